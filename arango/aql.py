@@ -1,6 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
 from arango.api import APIWrapper, api_method
+from arango.cache import QueryResultCache
 from arango.utils import HTTP_OK
 from arango.cursor import Cursor
 from arango.exceptions import (
@@ -27,6 +28,7 @@ class AQL(APIWrapper):
     def __init__(self, connection):
         self._conn = connection
         self._cache = AQLQueryCache(self._conn)
+        self._result_cache = None
 
     def __repr__(self):
         return "<ArangoDB AQL>"
@@ -40,8 +42,44 @@ class AQL(APIWrapper):
         """
         return self._cache
 
+    @property
+    def result_cache(self):
+        """Return the client-side query result cache.
+
+        :returns: the query result cache, or ``None`` if it is disabled
+        :rtype: arango.cache.QueryResultCache
+        """
+        return self._result_cache
+
+    def enable_result_cache(self, max_size=100, ttl=0):
+        """Cache the results of queries on the client side.
+
+        Refer to :class:`arango.cache.QueryResultCache` for more information.
+
+        :param max_size: the maximum number of results kept in the cache
+        :type max_size: int
+        :param ttl: the number of seconds a cached result is served without
+            being revalidated (by default, it is revalidated on every read)
+        :type ttl: int | float
+        :returns: the query result cache
+        :rtype: arango.cache.QueryResultCache
+
+        .. note::
+            Only the queries executed with **cache_result** set to ``True``
+            (see :func:`arango.aql.AQL.execute`) are cached. Unlike the
+            server-side query cache (see :class:`arango.aql.AQLQueryCache`),
+            the cached results are served without any query execution.
+        """
+        self._result_cache = QueryResultCache(max_size=max_size, ttl=ttl)
+        return self._result_cache
+
+    def disable_result_cache(self):
+        """Stop caching the results of queries on the client side."""
+        self._result_cache = None
+
     @api_method
-    def explain(self, query, all_plans=False, max_plans=None, opt_rules=None):
+    def explain(self, query, all_plans=False, max_plans=None, opt_rules=None,
+                bind_vars=None):
         """Inspect the query and return its metadata.
 
         :param query: the query to inspect
@@ -53,6 +91,8 @@ class AQL(APIWrapper):
         :type max_plans: int
         :param opt_rules: the list of optimizer rules
         :type opt_rules: list
+        :param bind_vars: key-value pairs of bind parameters
+        :type bind_vars: dict
         :returns: the plan or plans if `all_plans` is set to ``True``
         :rtype: list | dict
         :raises arango.exceptions.AQLQueryExplainError: if the query cannot be
@@ -64,10 +104,14 @@ class AQL(APIWrapper):
         if opt_rules is not None:
             options['optimizer'] = {'rules': opt_rules}
 
+        data = {'query': query, 'options': options}
+        if bind_vars is not None:
+            data['bindVars'] = bind_vars
+
         request = Request(
             method='post',
             endpoint='/_api/explain',
-            data={'query': query, 'options': options}
+            data=data
         )
 
         def handler(res):
@@ -103,10 +147,9 @@ class AQL(APIWrapper):
 
         return request, handler
 
-    @api_method
     def execute(self, query, count=False, batch_size=None, ttl=None,
                 bind_vars=None, full_count=None, max_plans=None,
-                optimizer_rules=None):
+                optimizer_rules=None, cache_result=False, collections=None):
         """Execute the query and return the result cursor.
 
         :param query: the AQL query to execute
@@ -124,13 +167,144 @@ class AQL(APIWrapper):
         :type max_plans: int
         :param optimizer_rules: list of optimizer rules
         :type optimizer_rules: list
+        :param cache_result: serve the result from the client-side query
+            result cache if enabled (see method
+            :func:`arango.aql.AQL.enable_result_cache`)
+        :type cache_result: bool
+        :param collections: the names of the collections read by the query,
+            whose revisions are used to invalidate the cached result (by
+            default, they are retrieved by explaining the query once)
+        :type collections: [str | unicode]
         :returns: document cursor
         :rtype: arango.cursor.Cursor
         :raises arango.exceptions.AQLQueryExecuteError: if the query cannot be
             executed
         :raises arango.exceptions.CursorCloseError: if the cursor cannot be
             closed properly
+
+        .. note::
+            The results of queries modifying documents or reading no
+            collection, or executed in batches, asynchronously or in
+            transactions, are never cached. The cached results are complete,
+            so the cursor returned never needs a round trip to the server.
+        """
+        if (
+            cache_result and
+            self._result_cache is not None and
+            self._conn.type == 'standard'
+        ):
+            return self._execute_cached(
+                query, count, batch_size, ttl, bind_vars, full_count,
+                max_plans, optimizer_rules, collections
+            )
+        return self._execute(
+            query, count, batch_size, ttl, bind_vars, full_count, max_plans,
+            optimizer_rules
+        )
+
+    def _read_collections(self, query, bind_vars):
+        """Return the names of the collections read by a read-only query.
+
+        :param query: the AQL query
+        :type query: str | unicode
+        :param bind_vars: key-value pairs of bind parameters
+        :type bind_vars: dict
+        :returns: the names of the collections, or ``None`` if the query
+            modifies documents or cannot be explained
+        :rtype: [str | unicode]
+        """
+        try:
+            plan = self.explain(query, bind_vars=bind_vars)
+        except AQLQueryExplainError:
+            return None
+        collections = plan.get('collections', [])
+        if any(col.get('type') == 'write' for col in collections):
+            return None
+        return [col['name'] for col in collections]
+
+    def _revisions(self, collections):
+        """Return the current revisions of the given collections.
+
+        :param collections: the names of the collections
+        :type collections: [str | unicode]
+        :returns: the revision of each collection (``None`` if it cannot be
+            retrieved)
+        :rtype: dict
         """
+        revisions = {}
+        for name in collections:
+            res = self._conn.get('/_api/collection/{}/revision'.format(name))
+            if res.status_code in HTTP_OK:
+                revisions[name] = res.body['revision']
+            else:
+                revisions[name] = None
+        return revisions
+
+    def _execute_cached(self, query, count, batch_size, ttl, bind_vars,
+                        full_count, max_plans, optimizer_rules, collections):
+        """Execute the query through the query result cache.
+
+        :returns: document cursor
+        :rtype: arango.cursor.Cursor
+        """
+        cache = self._result_cache
+        key = cache.key(query, bind_vars, {
+            'count': count,
+            'fullCount': full_count,
+            'maxNumberOfPlans': max_plans,
+            'optimizer': optimizer_rules
+        })
+        data, revisions = cache.lookup(key)
+        if data is not None:
+            return Cursor(self._conn, data)
+
+        if revisions is not None:
+            current = self._revisions(revisions)
+            if None not in current.values() and current == revisions:
+                data = cache.revalidated(key)
+                if data is not None:
+                    return Cursor(self._conn, data)
+            cache.invalidate(key)
+            revisions = current
+        else:
+            if collections is None and not cache.uncachable(key):
+                collections = self._read_collections(query, bind_vars)
+                if not collections:
+                    # Avoid explaining the query again on every read
+                    cache.mark_uncachable(key)
+            if collections:
+                revisions = self._revisions(collections)
+
+        # Without collections, or without the revisions of all of them (e.g.
+        # one is missing), the result could never be invalidated, so it is
+        # not cached
+        if not revisions or None in revisions.values():
+            return self._execute(
+                query, count, batch_size, ttl, bind_vars, full_count,
+                max_plans, optimizer_rules
+            )
+
+        # The revisions are fetched before the query is executed, so that
+        # modifications made during its execution invalidate the result
+        cursor = self._execute(
+            query, count, batch_size, ttl, bind_vars, full_count, max_plans,
+            optimizer_rules
+        )
+        data = {
+            'hasMore': False,
+            'count': cursor.count(),
+            'cached': cursor.cached(),
+            'extra': cursor.extra() or {}
+        }
+        data['result'] = list(cursor)
+        cache.store(key, data, revisions)
+        return Cursor(self._conn, data)
+
+    @api_method
+    def _execute(self, query, count=False, batch_size=None, ttl=None,
+                 bind_vars=None, full_count=None, max_plans=None,
+                 optimizer_rules=None):
+        """Send the request executing the query."""
         options = {}
         if full_count is not None:
             options['fullCount'] = full_count
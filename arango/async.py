@@ -1,9 +1,18 @@
 from __future__ import absolute_import, unicode_literals
 
+from concurrent import futures
+from functools import partial
+from threading import Event, Lock, Thread
+from time import time
+
 from arango.collections import Collection
 from arango.connection import Connection
+from arango.multipart import post_batch
+from arango.registry import ResourceRegistry
+from arango.request import Request
 from arango.utils import HTTP_OK
 from arango.exceptions import (
+    ArangoError,
     AsyncExecuteError,
     AsyncJobCancelError,
     AsyncJobStatusError,
@@ -13,6 +22,9 @@ from arango.exceptions import (
 from arango.graph import Graph
 from arango.aql import AQL
 
+# Registry of the async jobs whose results are still stored on the server
+job_registry = ResourceRegistry('async jobs')
+
 
 class AsyncExecution(Connection):
     """ArangoDB asynchronous execution.
@@ -126,12 +138,25 @@ class AsyncJob(object):
     :type job_id: str | unicode
     :param handler: the response handler
     :type handler: callable
+
+    .. note::
+        The result of the job is stored on the server until it is fetched or
+        cleared. If the job object is garbage collected (or the interpreter
+        exits) before then, the result is deleted from the server
+        automatically.
     """
 
     def __init__(self, connection, job_id, handler):
         self._conn = connection
         self._id = job_id
         self._handler = handler
+        self._future = None
+        job_registry.register(
+            obj=self,
+            resource_id=job_id,
+            release=partial(connection.delete, '/_api/job/{}'.format(job_id)),
+            database=connection.database
+        )
 
     def __repr__(self):
         return '<ArangoDB asynchronous job {}>'.format(self._id)
@@ -145,6 +170,27 @@ class AsyncJob(object):
         """
         return self._id
 
+    def future(self, poller=None):
+        """Return a future which completes along with the async job.
+
+        The future is completed by a background poller shared by all async
+        jobs, so any number of jobs can be awaited without busy loops.
+
+        :param poller: the poller which completes the future (if not set, the
+            default poller shared by all jobs is used)
+        :type poller: arango.async.AsyncJobPoller
+        :returns: the future holding the result of the async job (if the job
+            failed, its exception is raised by the future instead)
+        :rtype: concurrent.futures.Future
+
+        .. note::
+            The result of the async job is fetched (and therefore cleared from
+            the server) by the poller as soon as the job is done.
+        """
+        if self._future is None:
+            self._future = (poller or default_poller).watch(self)
+        return self._future
+
     def status(self):
         """Return the status of the async job from the server.
 
@@ -177,9 +223,23 @@ class AsyncJob(object):
             An async job result will automatically be cleared from the server
             once fetched and will *not* be available in subsequent calls.
         """
-        res = self._conn.put('/_api/job/{}'.format(self._id))
+        return self._process_result(
+            self._conn.put('/_api/job/{}'.format(self._id))
+        )
+
+    def _process_result(self, res):
+        """Process the response of a request for the result of the job.
+
+        :param res: the response to ``PUT /_api/job/{id}``
+        :type res: arango.response.Response
+        :returns: the result or the exception from the async job
+        :rtype: object
+        :raises arango.exceptions.AsyncJobResultError: if the response does
+            not hold the result of the async job
+        """
         if ('X-Arango-Async-Id' in res.headers
                 or 'x-arango-async-id' in res.headers):
+            job_registry.unregister(self)
             try:
                 result = self._handler(res)
             except Exception as error:
@@ -189,6 +249,7 @@ class AsyncJob(object):
         elif res.status_code == 204:
             raise AsyncJobResultError(res, 'Job {} not done'.format(self._id))
         elif res.status_code == 404:
+            job_registry.unregister(self)
             raise AsyncJobResultError(res, 'Job {} missing'.format(self._id))
         else:
             raise AsyncJobResultError(res)
@@ -231,10 +292,352 @@ class AsyncJob(object):
         """
         res = self._conn.delete('/_api/job/{}'.format(self._id))
         if res.status_code in HTTP_OK:
+            job_registry.unregister(self)
             return True
         elif res.status_code == 404:
+            job_registry.unregister(self)
             if ignore_missing:
                 return False
             raise AsyncJobClearError(res, 'Job {} missing'.format(self._id))
         else:
             raise AsyncJobClearError(res)
+
+
+class AsyncJobPoller(object):
+    """Background poller which completes the futures of async jobs.
+
+    The poller polls the outstanding async jobs from a background thread,
+    which is started on demand and stops once no jobs are left. The polling
+    interval starts at **min_interval** and grows by a factor of **backoff**
+    each round no job completes, up to **max_interval**. It is reset whenever
+    a job completes or a new job is watched.
+
+    By default, each polling round lists the IDs of the finished jobs once per
+    database, and fetches the results of the watched ones in a single batch
+    request, so the cost of polling scales with the number of completions
+    rather than the number of outstanding jobs. If the finished jobs cannot be
+    listed (e.g. due to missing permissions), or the listing is full and may
+    have left out some of the watched jobs, those are polled one by one.
+
+    :param min_interval: the minimum number of seconds between polls
+    :type min_interval: int | float
+    :param max_interval: the maximum number of seconds between polls
+    :type max_interval: int | float
+    :param backoff: the factor by which the polling interval grows
+    :type backoff: int | float
+    :param bulk: poll the jobs via job listings and batch requests, instead of
+        one request per job
+    :type bulk: bool
+    """
+
+    # The number of finished jobs listed on top of the watched ones
+    _listing_slack = 100
+
+    def __init__(self,
+                 min_interval=0.01,
+                 max_interval=1.0,
+                 backoff=2.0,
+                 bulk=True):
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._bulk = bulk
+        self._jobs = {}
+        self._lock = Lock()
+        self._wake = Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '<ArangoDB async job poller>'
+
+    def __len__(self):
+        with self._lock:
+            return len(self._jobs)
+
+    def watch(self, job):
+        """Start polling the async job.
+
+        :param job: the async job
+        :type job: arango.async.AsyncJob
+        :returns: the future which completes along with the job
+        :rtype: concurrent.futures.Future
+        """
+        future = futures.Future()
+        with self._lock:
+            self._jobs[job.id] = (job, future)
+            if self._thread is None:
+                self._thread = Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+        self._wake.set()
+        return future
+
+    def _run(self):
+        """Poll the outstanding jobs until none are left.
+
+        This method is run by the background thread.
+        """
+        interval = self._min_interval
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._thread = None
+                    return
+                jobs = list(self._jobs.values())
+            if self._poll(jobs):
+                interval = self._min_interval
+            else:
+                interval = min(interval * self._backoff, self._max_interval)
+            if self._wake.wait(interval):
+                self._wake.clear()
+                interval = self._min_interval
+
+    def _poll(self, jobs):
+        """Poll the given jobs once and complete the futures of finished ones.
+
+        :param jobs: the async jobs and their futures
+        :type jobs: [(arango.async.AsyncJob, concurrent.futures.Future)]
+        :returns: whether any of the jobs completed
+        :rtype: bool
+        """
+        if not self._bulk:
+            return self._poll_each(jobs)
+
+        # Group the jobs by the database they were issued in
+        groups = {}
+        for job, future in jobs:
+            conn = job._conn
+            key = (conn.host, conn.port, conn.database, conn.username)
+            groups.setdefault(key, []).append((job, future))
+
+        completed = False
+        for group in groups.values():
+            conn = group[0][0]._conn
+            # The listing is capped, and may include finished jobs which are
+            # not watched (e.g. issued by other clients)
+            count = len(group) + self._listing_slack
+            try:
+                res = conn.get('/_api/job/done', params={'count': count})
+            except Exception:
+                res = None
+            if res is None or res.status_code not in HTTP_OK:
+                completed = self._poll_each(group) or completed
+                continue
+            done_ids = set(res.body)
+            done = [item for item in group if item[0].id in done_ids]
+            if done:
+                self._fetch(conn, done)
+                completed = True
+            if len(done_ids) >= count:
+                # The listing is full, so the missing jobs may have finished
+                missing = [
+                    item for item in group if item[0].id not in done_ids
+                ]
+                completed = self._poll_each(missing) or completed
+        return completed
+
+    def _fetch(self, connection, jobs):
+        """Fetch the results of the finished jobs in a single batch request.
+
+        :param connection: ArangoDB database connection
+        :type connection: arango.connection.Connection
+        :param jobs: the finished async jobs and their futures
+        :type jobs: [(arango.async.AsyncJob, concurrent.futures.Future)]
+        """
+        requests = [
+            Request(method='put', endpoint='/_api/job/{}'.format(job.id))
+            for job, _ in jobs
+        ]
+        try:
+            parts = post_batch(connection, requests)
+        except ArangoError as error:
+            for job, future in jobs:
+                self._complete(job, future, error)
+            return
+
+        for (job, future), request, part in zip(jobs, requests, parts):
+            if part is None:
+                self._complete(job, future, AsyncJobResultError(
+                    'Job {} missing from batch response'.format(job.id)
+                ))
+                continue
+            try:
+                self._complete(job, future, job._process_result(
+                    part.to_response(
+                        method=request.method,
+                        url=connection._url_prefix + request.endpoint
+                    )
+                ))
+            except Exception as error:
+                self._complete(job, future, error)
+
+    def _poll_each(self, jobs):
+        """Poll the given jobs one by one.
+
+        :param jobs: the async jobs and their futures
+        :type jobs: [(arango.async.AsyncJob, concurrent.futures.Future)]
+        :returns: whether any of the jobs completed
+        :rtype: bool
+        """
+        completed = False
+        for job, future in jobs:
+            try:
+                if job.status() == 'pending':
+                    continue
+                self._complete(job, future, job.result())
+            except Exception as error:
+                self._complete(job, future, error)
+            completed = True
+        return completed
+
+    def _complete(self, job, future, result):
+        """Stop polling the job and complete its future.
+
+        :param job: the async job
+        :type job: arango.async.AsyncJob
+        :param future: the future of the job
+        :type future: concurrent.futures.Future
+        :param result: the result of the job or its exception
+        :type result: object
+        """
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+class AsyncJobHousekeeper(object):
+    """Background housekeeper which deletes stale async job results.
+
+    Every **interval** seconds, the results of the async jobs issued via this
+    client and left unfetched for more than **ttl** seconds are deleted from
+    the server. Unless **orphans_only** is set to ``True``, all job results in
+    the database older than **ttl** seconds are deleted as well via
+    :func:`arango.database.Database.clear_async_jobs`, which also covers the
+    jobs issued by other clients or whose objects were discarded before the
+    jobs finished.
+
+    :param database: the database to clean up
+    :type database: arango.database.Database
+    :param ttl: the number of seconds after which job results are deleted
+    :type ttl: int | float
+    :param interval: the number of seconds between housekeeping rounds
+    :type interval: int | float
+    :param orphans_only: only delete the results of jobs issued via this
+        client
+    :type orphans_only: bool
+
+    .. note::
+        Method :func:`arango.async.AsyncJobHousekeeper.stop` should be called
+        to stop the background thread (this is done automatically when context
+        managers are used).
+    """
+
+    def __init__(self, database, ttl=3600, interval=60, orphans_only=False):
+        self._db = database
+        self._ttl = ttl
+        self._interval = interval
+        self._orphans_only = orphans_only
+        self._stopped = Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '<ArangoDB async job housekeeper>'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def start(self):
+        """Start the background housekeeping thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background housekeeping thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Run the housekeeping rounds until stopped.
+
+        This method is run by the background thread.
+        """
+        while not self._stopped.wait(self._interval):
+            try:
+                self.run_once()
+            except ArangoError:
+                pass
+
+    def run_once(self):
+        """Run a single housekeeping round.
+
+        :returns: the number of stale job results tracked by this client that
+            were deleted
+        :rtype: int
+        :raises arango.exceptions.AsyncJobClearError: if the job results
+            cannot be deleted
+        """
+        count = job_registry.release_expired(
+            self._ttl, database=self._db.name
+        )
+        if not self._orphans_only:
+            self._db.clear_async_jobs(threshold=int(time() - self._ttl))
+        return count
+
+
+# The poller shared by all async jobs by default
+default_poller = AsyncJobPoller()
+
+
+def wait(jobs, timeout=None, return_when=futures.ALL_COMPLETED):
+    """Wait for the async jobs to complete.
+
+    :param jobs: the async jobs
+    :type jobs: [arango.async.AsyncJob]
+    :param timeout: the maximum number of seconds to wait
+    :type timeout: int | float
+    :param return_when: when to return, which can be
+        ``concurrent.futures.FIRST_COMPLETED``,
+        ``concurrent.futures.FIRST_EXCEPTION`` or
+        ``concurrent.futures.ALL_COMPLETED`` (default)
+    :type return_when: str | unicode
+    :returns: the completed jobs and the jobs not yet completed
+    :rtype: (set, set)
+    """
+    by_future = {job.future(): job for job in jobs}
+    done, not_done = futures.wait(
+        by_future, timeout=timeout, return_when=return_when
+    )
+    return (
+        set(by_future[future] for future in done),
+        set(by_future[future] for future in not_done)
+    )
+
+
+def as_completed(jobs, timeout=None):
+    """Yield the async jobs as they complete.
+
+    :param jobs: the async jobs
+    :type jobs: [arango.async.AsyncJob]
+    :param timeout: the maximum number of seconds to wait
+    :type timeout: int | float
+    :returns: the generator yielding the completed jobs, whose results are
+        then available via :func:`arango.async.AsyncJob.future`
+    :rtype: generator
+    :raises concurrent.futures.TimeoutError: if the jobs are not completed
+        before the timeout
+    """
+    by_future = {job.future(): job for job in jobs}
+    for future in futures.as_completed(by_future, timeout=timeout):
+        yield by_future[future]
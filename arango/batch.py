@@ -1,13 +1,23 @@
 from __future__ import absolute_import, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Event, Lock, RLock, Thread
+from time import time
 from uuid import uuid4
 
+from arango.async import AsyncJob
 from arango.collections import Collection
 from arango.connection import Connection
+from arango.multipart import (
+    BOUNDARY,
+    MultipartParser,
+    encode_end,
+    encode_part
+)
 from arango.utils import HTTP_OK
 from arango.exceptions import BatchExecuteError, ArangoError
 from arango.graph import Graph
-from arango.response import Response
 from arango.aql import AQL
 
 
@@ -28,13 +38,47 @@ class BatchExecution(Connection):
         so far are committed even if an exception is raised before existing
         out of the context (default: ``False``)
     :type commit_on_error: bool
+    :param max_requests: if set, the queued requests are committed
+        automatically once their number reaches this limit
+    :type max_requests: int
+    :param max_bytes: if set, the queued requests are committed automatically
+        once their total (serialized) size in bytes reaches this limit
+    :type max_bytes: int
+    :param max_latency: if set, the queued requests are committed
+        automatically once the oldest of them has been waiting for this many
+        seconds
+    :type max_latency: int | float
+    :param background: if ``True`` and **max_latency** is set, the latency
+        threshold is enforced by a background thread, otherwise it is only
+        checked when new requests are queued
+    :type background: bool
+    :param sub_batches: the number of sub-batches the queued requests are
+        split into on commit, which are then sent concurrently in separate
+        HTTP calls (default: ``1``, i.e. a single HTTP call). The requests
+        are executed in order within a sub-batch, but not across sub-batches
+    :type sub_batches: int
+
+    .. note::
+        If a commit triggered by the background thread fails, the error is
+        raised on the next call to queue or commit requests. Method
+        :func:`arango.batch.BatchExecution.close` should be called to stop the
+        background thread (this is done automatically when context managers
+        are used).
 
     .. warning::
         Batch execution is currently an experimental feature and is not
         thread-safe.
     """
 
-    def __init__(self, connection, return_result=True, commit_on_error=False):
+    def __init__(self,
+                 connection,
+                 return_result=True,
+                 commit_on_error=False,
+                 max_requests=None,
+                 max_bytes=None,
+                 max_latency=None,
+                 background=False,
+                 sub_batches=1):
         super(BatchExecution, self).__init__(
             protocol=connection.protocol,
             host=connection.host,
@@ -51,8 +95,24 @@ class BatchExecution(Connection):
         self._requests = []    # The queue for requests
         self._handlers = []    # The queue for response handlers
         self._batch_jobs = []  # For tracking batch jobs
+        self._payloads = []    # The content IDs and encoded request parts
+        self._content_ids = count(1)
+        self._bytes = 0        # The total size of the serialized requests
+        self._oldest = None    # The time the oldest request was queued
+        self._max_requests = max_requests
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._sub_batches = max(sub_batches, 1)
+        self._lock = RLock()
+        self._flush_error = None
+        self._flusher = None
+        self._stopped = Event()
         self._aql = AQL(self)
         self._type = 'batch'
+        if background and max_latency is not None:
+            self._flusher = Thread(target=self._flush_periodically)
+            self._flusher.daemon = True
+            self._flusher.start()
 
     def __repr__(self):
         return '<ArangoDB batch execution {}>'.format(self._id)
@@ -61,6 +121,7 @@ class BatchExecution(Connection):
         return self
 
     def __exit__(self, exception, *_):
+        self._stop_flusher()
         if exception is None or self._commit_on_error:
             self.commit()
 
@@ -84,79 +145,272 @@ class BatchExecution(Connection):
         :type handler: callable
         :returns: the batch job or None
         :rtype: arango.batch.BatchJob
+        :raises arango.exceptions.BatchExecuteError: if the requests are
+            committed automatically and the commit fails
         """
-        self._requests.append(request)
-        self._handlers.append(handler)
-
-        if not self._return_result:
-            return None
-        batch_job = BatchJob()
-        self._batch_jobs.append(batch_job)
+        self._raise_flush_error()
+        with self._lock:
+            content_id = '{}'.format(next(self._content_ids))
+            payload = encode_part(content_id, request)
+            if not self._requests:
+                self._oldest = time()
+            self._requests.append(request)
+            self._handlers.append(handler)
+            self._payloads.append((content_id, payload))
+            self._bytes += len(payload)
+
+            batch_job = None
+            if self._return_result:
+                batch_job = BatchJob()
+                self._batch_jobs.append(batch_job)
+
+            if self._threshold_reached():
+                self.commit()
         return batch_job
 
+    def _threshold_reached(self):
+        """Return whether the queued requests must be committed.
+
+        :returns: whether any of the auto-commit thresholds are reached
+        :rtype: bool
+        """
+        if not self._requests:
+            return False
+        if self._max_requests is not None:
+            if len(self._requests) >= self._max_requests:
+                return True
+        if self._max_bytes is not None and self._bytes >= self._max_bytes:
+            return True
+        if self._max_latency is not None:
+            return time() - self._oldest >= self._max_latency
+        return False
+
+    def _flush_periodically(self):
+        """Commit the queued requests when the latency threshold is reached.
+
+        This method is run by the background flusher thread.
+        """
+        interval = max(self._max_latency / 2.0, 0.001)
+        while not self._stopped.wait(interval):
+            with self._lock:
+                if not self._threshold_reached():
+                    continue
+                try:
+                    self.commit()
+                except Exception as err:
+                    # Keep the thread alive and surface the error (e.g. a
+                    # connection error) on the next add or commit
+                    self._flush_error = err
+
+    def _stop_flusher(self):
+        """Stop the background flusher thread (if any)."""
+        self._stopped.set()
+        if self._flusher is not None and self._flusher.is_alive():
+            self._flusher.join()
+
+    def _raise_flush_error(self):
+        """Raise the error of the last failed background commit (if any).
+
+        :raises arango.exceptions.BatchExecuteError: if the last background
+            commit failed (other exceptions, e.g. connection errors, are
+            re-raised as is)
+        """
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    def queue_size(self):
+        """Return the number of requests currently queued.
+
+        :returns: the number of queued requests
+        :rtype: int
+        """
+        return len(self._requests)
+
+    def queue_bytes(self):
+        """Return the total (serialized) size of the queued requests.
+
+        :returns: the size of the queued requests in bytes
+        :rtype: int
+        """
+        return self._bytes
+
     def commit(self):
         """Execute the queued API requests in a single HTTP call.
 
+        If **sub_batches** was set to a value greater than 1 during
+        initialization, the queued requests are split into that many
+        consecutive sub-batches instead, which are sent concurrently. The
+        order of execution is then only guaranteed within each sub-batch, so
+        requests which depend on each other (e.g. an insert and an update of
+        the same document) must not be queued in the same batch.
+
         If `return_response` was set to ``True`` during initialization, the
         responses are saved within an :class:`arango.batch.BatchJob` object
         for later retrieval via its :func:`arango.batch.BatchJob.result`
         method
 
         :raises arango.exceptions.BatchExecuteError: if the batch request
-            cannot be executed
+            (or any of its sub-batches) cannot be executed
         """
-        try:
-            if not self._requests:
+        self._raise_flush_error()
+        with self._lock:
+            requests = self._requests
+            handlers = self._handlers
+            batch_jobs = self._batch_jobs
+            payloads = self._payloads
+            self._reset()
+            if not requests:
                 return
-            raw_data_list = []
-            for content_id, request in enumerate(self._requests, start=1):
-                raw_data_list.append('--XXXsubpartXXX\r\n')
-                raw_data_list.append('Content-Type: application/x-arango-batchpart\r\n')
-                raw_data_list.append('Content-Id: {}\r\n\r\n'.format(content_id))
-                raw_data_list.append('{}\r\n'.format(request.stringify()))
-            raw_data_list.append('--XXXsubpartXXX--\r\n\r\n')
-            raw_data = ''.join(raw_data_list)
-
-            res = self.post(
-                endpoint='/_api/batch',
-                headers={
-                    'Content-Type': (
-                        'multipart/form-data; boundary=XXXsubpartXXX'
-                    )
-                },
-                data=raw_data,
-            )
-            if res.status_code not in HTTP_OK:
-                raise BatchExecuteError(res)
+            sub_batches = min(self._sub_batches, len(requests))
+            if sub_batches == 1:
+                return self._send(requests, handlers, batch_jobs, payloads)
+
+            # Split the queue into contiguous slices so that each batch job
+            # is updated by the sub-batch which holds its request
+            size, extra = divmod(len(requests), sub_batches)
+            bounds = []
+            start = 0
+            for index in range(sub_batches):
+                end = start + size + (1 if index < extra else 0)
+                bounds.append((start, end))
+                start = end
+            with ThreadPoolExecutor(max_workers=sub_batches) as executor:
+                futures = [
+                    executor.submit(
+                        self._send,
+                        requests[start:end],
+                        handlers[start:end],
+                        batch_jobs[start:end],
+                        payloads[start:end]
+                    ) for start, end in bounds
+                ]
+            for future in futures:
+                future.result()
+
+    def _send(self, requests, handlers, batch_jobs, payloads):
+        """Send the given requests in a single HTTP call.
+
+        :param requests: the API requests
+        :type requests: [arango.request.Request]
+        :param handlers: the response handlers
+        :type handlers: [callable]
+        :param batch_jobs: the batch jobs to update with the results
+        :type batch_jobs: [arango.batch.BatchJob]
+        :param payloads: the content IDs and encoded multipart request parts
+        :type payloads: [(str | unicode, bytes)]
+        :raises arango.exceptions.BatchExecuteError: if the batch request
+            cannot be executed
+        """
+        res = self._post_payloads(payloads)
+        if res.status_code not in HTTP_OK:
+            raise BatchExecuteError(res)
+        if self._return_result:
+            self._process(res, requests, handlers, batch_jobs, payloads)
+
+    def _post_payloads(self, payloads, headers=None):
+        """Post the encoded requests to the batch API.
+
+        :param payloads: the content IDs and encoded multipart request parts
+        :type payloads: [(str | unicode, bytes)]
+        :param headers: additional request headers
+        :type headers: dict
+        :returns: the HTTP response
+        :rtype: arango.response.Response
+        """
+        headers = dict(headers or {})
+        headers['Content-Type'] = (
+            'multipart/form-data; boundary={}'.format(BOUNDARY)
+        )
+        return self.post(
+            endpoint='/_api/batch',
+            headers=headers,
+            data=b''.join(payload for _, payload in payloads) + encode_end(),
+        )
+
+    def _process(self, res, requests, handlers, batch_jobs, payloads):
+        """Match the parts of a batch response to the batch jobs.
+
+        :param res: the response of the batch API
+        :type res: arango.response.Response
+        :param requests: the API requests
+        :type requests: [arango.request.Request]
+        :param handlers: the response handlers
+        :type handlers: [callable]
+        :param batch_jobs: the batch jobs to update with the results
+        :type batch_jobs: [arango.batch.BatchJob]
+        :param payloads: the content IDs and encoded multipart request parts
+        :type payloads: [(str | unicode, bytes)]
+        :raises arango.exceptions.BatchExecuteError: if the response is
+            malformed
+        """
+        raw_body = res.raw_body
+        if not isinstance(raw_body, bytes):
+            raw_body = raw_body.encode('utf-8')
+        parser = MultipartParser()
+        parts = {part.content_id: part for part in parser.feed(raw_body)}
+        parser.close()
+
+        # The responses are matched to the requests by their content IDs,
+        # and the handlers only run once the results are accessed
+        for request, handler, job, (content_id, _) in zip(
+            requests, handlers, batch_jobs, payloads
+        ):
+            part = parts.get(content_id)
+            if part is None:
+                job.update(status='error', result=BatchExecuteError(
+                    'missing response for batch part {}'.format(content_id)
+                ))
+            else:
+                job.defer(self._url_prefix, request, handler, part)
+
+    def commit_async(self):
+        """Execute the queued API requests as a single asynchronous job.
+
+        The queued requests are sent in a single HTTP call as with method
+        :func:`arango.batch.BatchExecution.commit`, but the server processes
+        them in the background. The returned async job completes once all
+        requests are executed, after which its result is the list of batch
+        jobs (if `return_result` was set to ``True`` during initialization)
+        holding the results of the individual requests.
+
+        :returns: the async job, or None if no requests are queued
+        :rtype: arango.async.AsyncJob
+        :raises arango.exceptions.BatchExecuteError: if the batch request
+            cannot be queued on the server
+        """
+        self._raise_flush_error()
+        with self._lock:
+            requests = self._requests
+            handlers = self._handlers
+            batch_jobs = self._batch_jobs
+            payloads = self._payloads
+            self._reset()
+        if not requests:
+            return None
+
+        res = self._post_payloads(payloads, {'x-arango-async': 'store'})
+        if res.status_code not in HTTP_OK:
+            raise BatchExecuteError(res)
+
+        def handler(job_res):
+            if job_res.status_code not in HTTP_OK:
+                raise BatchExecuteError(job_res)
             if not self._return_result:
-                return
+                return None
+            self._process(job_res, requests, handlers, batch_jobs, payloads)
+            return batch_jobs
 
-            for index, raw_response in enumerate(
-                res.raw_body.split('--XXXsubpartXXX')[1:-1]
-            ):
-                request = self._requests[index]
-                handler = self._handlers[index]
-                job = self._batch_jobs[index]
-                res_parts = raw_response.strip().split('\r\n')
-                raw_status, raw_body = res_parts[3], res_parts[-1]
-                _, status_code, status_text = raw_status.split(' ', 2)
-                try:
-                    result = handler(Response(
-                        method=request.method,
-                        url=self._url_prefix + request.endpoint,
-                        headers=request.headers,
-                        http_code=int(status_code),
-                        http_text=status_text,
-                        body=raw_body
-                    ))
-                except ArangoError as err:
-                    job.update(status='error', result=err)
-                else:
-                    job.update(status='done', result=result)
-        finally:
-            self._requests = []
-            self._handlers = []
-            self._batch_jobs = []
+        return AsyncJob(self, res.headers['x-arango-async-id'], handler)
+
+    def _reset(self):
+        """Empty the requests queue."""
+        self._requests = []
+        self._handlers = []
+        self._batch_jobs = []
+        self._payloads = []
+        self._bytes = 0
+        self._oldest = None
 
     def clear(self):
         """Clear the requests queue and discard pointers to batch jobs issued.
@@ -167,12 +421,20 @@ class BatchExecution(Connection):
         .. warning::
             This method will orphan any batch jobs that were issued
         """
-        count = len(self._requests)
-        self._requests = []
-        self._handlers = []
-        self._batch_jobs = []
+        with self._lock:
+            count = len(self._requests)
+            self._reset()
         return count
 
+    def close(self):
+        """Stop the background flusher and commit the remaining requests.
+
+        :raises arango.exceptions.BatchExecuteError: if the batch request
+            cannot be executed
+        """
+        self._stop_flusher()
+        self.commit()
+
     @property
     def aql(self):
         """Return the AQL object tailored for batch execution.
@@ -222,6 +484,8 @@ class BatchJob(object):
         self._id = uuid4()
         self._status = 'pending'
         self._result = None
+        self._deferred = None
+        self._lock = Lock()
 
     def __repr__(self):
         return '<ArangoDB batch job {}>'.format(self._id)
@@ -247,6 +511,41 @@ class BatchJob(object):
         """
         self._status = status
         self._result = result
+        self._deferred = None
+
+    def defer(self, url_prefix, request, handler, part):
+        """Store the response of the batch job for processing on demand.
+
+        The response handler is run the first time the status or the result of
+        the batch job is requested. This method designed to be used internally
+        only.
+
+        :param url_prefix: the URL prefix of the batch connection
+        :type url_prefix: str | unicode
+        :param request: the API request
+        :type request: arango.request.Request
+        :param handler: the response handler
+        :type handler: callable
+        :param part: the part of the batch response for the request
+        :type part: arango.multipart.MultipartPart
+        """
+        self._deferred = (url_prefix, request, handler, part)
+
+    def _process(self):
+        """Run the response handler of the batch job if not done already."""
+        with self._lock:
+            if self._deferred is None:
+                return
+            url_prefix, request, handler, part = self._deferred
+            try:
+                result = handler(part.to_response(
+                    method=request.method,
+                    url=url_prefix + request.endpoint
+                ))
+            except ArangoError as err:
+                self.update(status='error', result=err)
+            else:
+                self.update(status='done', result=result)
 
     def status(self):
         """Return the status of the batch job.
@@ -256,6 +555,7 @@ class BatchJob(object):
             ``"error"`` (the job raised an exception)
         :rtype: str | unicode
         """
+        self._process()
         return self._status
 
     def result(self):
@@ -265,4 +565,5 @@ class BatchJob(object):
         :rtype: object
         :raises ArangoError: if the batch job failed
         """
+        self._process()
         return self._result
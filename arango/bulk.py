@@ -0,0 +1,541 @@
+from __future__ import absolute_import, unicode_literals
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from time import time
+
+from requests import ConnectionError, Timeout
+
+from arango.collections import Collection
+from arango.exceptions import ArangoError, BulkWriteError
+from arango.transaction import StreamTransaction
+
+# HTTP status codes indicating the server is overloaded
+HTTP_OVERLOAD = {408, 429, 502, 503, 504}
+
+# Errors raised by the server or the transport layer on a failed request
+REQUEST_ERRORS = (ArangoError, ConnectionError, Timeout)
+
+
+class TransactionalBulkWriter(object):
+    """Bulk writer committing each chunk of documents as its own transaction.
+
+    The documents are split into chunks of **chunk_size**, and each chunk is
+    written in a stream transaction which is committed only if every document
+    in the chunk succeeds (otherwise it is aborted). This keeps the size of
+    each request and the duration of each collection lock bounded, while each
+    chunk is applied atomically.
+
+    The writer tracks how many documents (from the start of the input) have
+    been committed, so a failed or interrupted write can be resumed from that
+    offset. If **compensate** is set to ``True``, the chunks committed during
+    a failed write are undone (in reverse order) before the error is raised.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param method: the write method, which can be ``"insert"`` (default),
+        ``"update"``, ``"replace"`` or ``"delete"``
+    :type method: str | unicode
+    :param chunk_size: the number of documents written per transaction
+    :type chunk_size: int
+    :param sync: wait for each transaction to sync to disk on commit
+    :type sync: bool
+    :param timeout: timeout on the collection locks of each transaction
+    :type timeout: int
+    :param compensate: undo the committed chunks if a write fails
+    :type compensate: bool
+    :param callback: the callable invoked with the progress (see method
+        :func:`arango.bulk.TransactionalBulkWriter.progress`) each time a chunk
+        is committed, e.g. to persist a checkpoint
+    :type callback: callable
+    :param throttle: the throttle to wait on before each chunk
+    :type throttle: arango.throttle.WriteThrottle
+
+    .. note::
+        With **compensate** set to ``True``, the information needed to undo
+        the committed chunks (the keys of the inserted documents, or the old
+        bodies of the updated, replaced or deleted documents) is kept in
+        client-side memory until the write finishes. Compensation is best
+        effort: changes made by others in between are overwritten, and the
+        chunks which cannot be undone are left as committed and named in the
+        error raised.
+    """
+
+    methods = ('insert', 'update', 'replace', 'delete')
+
+    def __init__(self,
+                 connection,
+                 collection,
+                 method='insert',
+                 chunk_size=1000,
+                 sync=None,
+                 timeout=None,
+                 compensate=False,
+                 callback=None,
+                 throttle=None):
+        if method not in self.methods:
+            raise ValueError('invalid method: {}'.format(method))
+        self._conn = connection
+        self._collection = collection
+        self._method = method
+        self._chunk_size = max(chunk_size, 1)
+        self._sync = sync
+        self._timeout = timeout
+        self._compensate = compensate
+        self._callback = callback
+        self._throttle = throttle
+        self._offset = 0
+        self._chunks = 0
+        self._undo = []
+
+    def __repr__(self):
+        return '<ArangoDB transactional bulk writer {} ({})>'.format(
+            self._collection, self._method
+        )
+
+    @property
+    def offset(self):
+        """Return the number of documents committed from the start of input.
+
+        :returns: the offset to resume writing from
+        :rtype: int
+        """
+        return self._offset
+
+    def progress(self):
+        """Return the progress of the bulk write.
+
+        :returns: the offset to resume from (``"offset"``), and the number of
+            chunks committed by the last write (``"chunks"``)
+        :rtype: dict
+        """
+        return {'offset': self._offset, 'chunks': self._chunks}
+
+    def write(self, documents, offset=0):
+        """Write the documents chunk by chunk.
+
+        :param documents: the documents (or keys if deleting), which can be any
+            iterable (e.g. a generator reading from a file)
+        :type documents: collections.Iterable
+        :param offset: the number of documents at the start of **documents**
+            to skip, which should be the offset of a previous write to resume
+        :type offset: int
+        :returns: the number of documents written
+        :rtype: int
+        :raises arango.exceptions.BulkWriteError: if a chunk cannot be
+            written (the offset of the writer points to the start of the
+            failed chunk, or is reset to **offset** if all committed chunks
+            were undone); the error names the chunks that could not be undone
+        """
+        documents = iter(documents)
+        if offset:
+            documents = islice(documents, offset, None)
+        self._offset = offset
+        self._chunks = 0
+        self._undo = []
+        try:
+            while True:
+                chunk = list(islice(documents, self._chunk_size))
+                if not chunk:
+                    break
+                if self._throttle is not None:
+                    self._throttle.wait()
+                self._write_chunk(chunk)
+                self._offset += len(chunk)
+                self._chunks += 1
+                if self._callback is not None:
+                    self._callback(self.progress())
+        except REQUEST_ERRORS as error:
+            if isinstance(error, BulkWriteError):
+                message = error.message
+            else:
+                message = 'chunk at offset {} failed: {}'.format(
+                    self._offset, error
+                )
+            if self._compensate and self._undo:
+                failed_undo = self._rollback()
+                if failed_undo:
+                    raise BulkWriteError(
+                        '{}; the chunk(s) at offset(s) {} could not be '
+                        'undone'.format(
+                            message,
+                            ', '.join(str(o) for o, _ in failed_undo)
+                        )
+                    )
+                self._offset = offset
+            if isinstance(error, BulkWriteError):
+                raise
+            raise BulkWriteError(message)
+        finally:
+            self._undo = []
+        return self._offset - offset
+
+    def _begin(self):
+        """Begin a stream transaction on the collection.
+
+        :returns: the stream transaction
+        :rtype: arango.transaction.StreamTransaction
+        """
+        return StreamTransaction(
+            connection=self._conn,
+            write=self._collection,
+            sync=self._sync,
+            timeout=self._timeout
+        )
+
+    def _write_chunk(self, chunk):
+        """Write a chunk of documents in its own transaction.
+
+        :param chunk: the documents in the chunk
+        :type chunk: list
+        :raises arango.exceptions.BulkWriteError: if any of the documents
+            cannot be written, in which case the transaction is aborted
+        """
+        txn = self._begin()
+        try:
+            col = txn.collection(self._collection)
+            write = getattr(col, '{}_many'.format(self._method))
+            if self._method == 'insert':
+                results = write(chunk)
+            else:
+                results = write(chunk, return_old=self._compensate)
+            errors = [r for r in results if isinstance(r, ArangoError)]
+            if errors:
+                raise BulkWriteError(
+                    'chunk at offset {} failed on {} document(s): {}'.format(
+                        self._offset, len(errors), errors[0]
+                    )
+                )
+        except Exception:
+            self._abort(txn)
+            raise
+        txn.commit()
+        if self._compensate:
+            if self._method == 'insert':
+                undo = [r['_key'] for r in results]
+            else:
+                undo = [r['old'] for r in results]
+            self._undo.append((self._offset, undo))
+
+    def _rollback(self):
+        """Undo the chunks committed so far, most recent first.
+
+        Each chunk is undone in its own transaction, which is aborted if any
+        of its documents cannot be restored. The remaining chunks are still
+        undone.
+
+        :returns: the offsets of the chunks which could not be undone, along
+            with the errors
+        :rtype: [(int, Exception)]
+        """
+        undo_method = {
+            'insert': 'delete',
+            'update': 'replace',
+            'replace': 'replace',
+            'delete': 'insert'
+        }[self._method]
+        failed = []
+        while self._undo:
+            chunk_offset, chunk = self._undo.pop()
+            try:
+                txn = self._begin()
+            except REQUEST_ERRORS as error:
+                failed.append((chunk_offset, error))
+                continue
+            try:
+                col = txn.collection(self._collection)
+                results = getattr(col, '{}_many'.format(undo_method))(chunk)
+                errors = [r for r in results if isinstance(r, ArangoError)]
+                if errors:
+                    raise BulkWriteError(
+                        'undo failed on {} document(s): {}'.format(
+                            len(errors), errors[0]
+                        )
+                    )
+                txn.commit()
+            except REQUEST_ERRORS as error:
+                self._abort(txn)
+                failed.append((chunk_offset, error))
+        return failed
+
+    @staticmethod
+    def _abort(txn):
+        """Abort a failed transaction without masking the original error.
+
+        :param txn: the stream transaction
+        :type txn: arango.transaction.StreamTransaction
+        """
+        try:
+            txn.abort()
+        except REQUEST_ERRORS:
+            # The server aborts the transaction on its own once it expires
+            pass
+
+
+class AdaptiveBulkLoader(object):
+    """Bulk loader tuning its chunk size and concurrency automatically.
+
+    The documents are imported in chunks via
+    :func:`arango.collections.Collection.import_bulk`, several chunks at a
+    time. The latency of each chunk is measured, and the chunk size and the
+    number of concurrent chunks are adjusted with additive-increase and
+    multiplicative-decrease (AIMD): they grow step by step while the chunks
+    complete within **target_latency**, and are cut down sharply when the
+    latency exceeds it or the server appears overloaded (timeouts, connection
+    errors or HTTP 408, 429, 502, 503 and 504 responses), in which case the
+    failed chunk is also retried. The loader thus settles close to the peak
+    sustainable throughput.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param chunk_size: the initial number of documents per chunk
+    :type chunk_size: int
+    :param min_chunk_size: the minimum number of documents per chunk, which
+        is also the step by which the chunk size is increased
+    :type min_chunk_size: int
+    :param max_chunk_size: the maximum number of documents per chunk
+    :type max_chunk_size: int
+    :param workers: the initial number of concurrent chunks
+    :type workers: int
+    :param max_workers: the maximum number of concurrent chunks
+    :type max_workers: int
+    :param target_latency: the maximum number of seconds a chunk should take
+    :type target_latency: int | float
+    :param backoff: the factor by which the chunk size and concurrency are
+        multiplied when decreased
+    :type backoff: float
+    :param retries: the maximum number of times a chunk is retried
+    :type retries: int
+    :param on_duplicate: the action to take on unique key constraint
+        violations (see :func:`arango.collections.Collection.import_bulk`)
+    :type on_duplicate: str | unicode
+    :param sync: wait for the operations to sync to disk
+    :type sync: bool
+    :param throttle: the throttle to wait on before each chunk
+    :type throttle: arango.throttle.WriteThrottle
+    """
+
+    def __init__(self,
+                 connection,
+                 collection,
+                 chunk_size=1000,
+                 min_chunk_size=100,
+                 max_chunk_size=100000,
+                 workers=2,
+                 max_workers=16,
+                 target_latency=1.0,
+                 backoff=0.5,
+                 retries=5,
+                 on_duplicate=None,
+                 sync=None,
+                 throttle=None):
+        self._collection = Collection(connection, collection)
+        self._min_chunk_size = max(min_chunk_size, 1)
+        self._max_chunk_size = max(max_chunk_size, self._min_chunk_size)
+        self._chunk_size = min(
+            max(chunk_size, self._min_chunk_size), self._max_chunk_size
+        )
+        self._max_workers = max(max_workers, 1)
+        self._workers = min(max(workers, 1), self._max_workers)
+        self._target_latency = target_latency
+        self._backoff = backoff
+        self._retries = retries
+        self._on_duplicate = on_duplicate
+        self._sync = sync
+        self._throttle = throttle
+        self._streak = 0
+        self._stats = {}
+        self._reset_statistics()
+
+    def __repr__(self):
+        return '<ArangoDB adaptive bulk loader {}>'.format(
+            self._collection.name
+        )
+
+    @property
+    def chunk_size(self):
+        """Return the current number of documents per chunk.
+
+        :returns: the current number of documents per chunk
+        :rtype: int
+        """
+        return self._chunk_size
+
+    @property
+    def workers(self):
+        """Return the current number of concurrent chunks.
+
+        :returns: the current number of concurrent chunks
+        :rtype: int
+        """
+        return self._workers
+
+    def statistics(self):
+        """Return the statistics of the last load.
+
+        :returns: the numbers of documents created, failed (``"errors"``),
+            empty, updated and ignored, the number of chunks and retries, the
+            elapsed time in seconds, the throughput in documents per second,
+            and the current chunk size and concurrency
+        :rtype: dict
+        """
+        stats = dict(self._stats)
+        stats['chunk_size'] = self._chunk_size
+        stats['workers'] = self._workers
+        elapsed = stats['elapsed']
+        stats['throughput'] = stats['documents'] / elapsed if elapsed else 0.0
+        return stats
+
+    def _reset_statistics(self):
+        """Reset the statistics."""
+        self._stats = {
+            'documents': 0,
+            'created': 0,
+            'errors': 0,
+            'empty': 0,
+            'updated': 0,
+            'ignored': 0,
+            'chunks': 0,
+            'retries': 0,
+            'elapsed': 0.0
+        }
+
+    def load(self, documents):
+        """Import the documents.
+
+        :param documents: the documents, which can be any iterable (e.g. a
+            generator reading from a file)
+        :type documents: collections.Iterable
+        :returns: the statistics of the load (see method
+            :func:`arango.bulk.AdaptiveBulkLoader.statistics`)
+        :rtype: dict
+        :raises arango.exceptions.DocumentInsertError: if a chunk cannot be
+            imported (after retries if the server is overloaded)
+        """
+        self._reset_statistics()
+        self._streak = 0
+        documents = iter(documents)
+        retried = deque()
+        running = {}
+        exhausted = False
+        started = time()
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                while True:
+                    while len(running) < self._workers:
+                        if retried:
+                            chunk, attempt = retried.popleft()
+                        elif not exhausted:
+                            chunk = list(islice(documents, self._chunk_size))
+                            attempt = 0
+                            if not chunk:
+                                exhausted = True
+                                continue
+                        else:
+                            break
+                        future = executor.submit(self._import_chunk, chunk)
+                        running[future] = (chunk, attempt)
+                    if not running:
+                        break
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk, attempt = running.pop(future)
+                        self._complete(future, chunk, attempt, retried)
+        finally:
+            self._stats['elapsed'] = time() - started
+        return self.statistics()
+
+    def _import_chunk(self, chunk):
+        """Import a chunk of documents and measure its latency.
+
+        :param chunk: the documents in the chunk
+        :type chunk: list
+        :returns: the result of the bulk import and its latency in seconds
+        :rtype: (dict, float)
+        """
+        if self._throttle is not None:
+            self._throttle.wait()
+        started = time()
+        result = self._collection.import_bulk(
+            chunk,
+            halt_on_error=False,
+            details=False,
+            on_duplicate=self._on_duplicate,
+            sync=self._sync
+        )
+        return result, time() - started
+
+    def _complete(self, future, chunk, attempt, retried):
+        """Record the outcome of a chunk and adjust the chunk size/concurrency.
+
+        :param future: the future of the chunk
+        :type future: concurrent.futures.Future
+        :param chunk: the documents in the chunk
+        :type chunk: list
+        :param attempt: the number of times the chunk was retried
+        :type attempt: int
+        :param retried: the queue of chunks to retry
+        :type retried: collections.deque
+        """
+        try:
+            result, latency = future.result()
+        except Exception as error:
+            if not self._is_overload(error) or attempt >= self._retries:
+                raise
+            self._decrease(concurrency=True)
+            self._stats['retries'] += 1
+            # Retry the chunk in pieces no larger than the new chunk size
+            for i in range(0, len(chunk), self._chunk_size):
+                retried.append((chunk[i:i + self._chunk_size], attempt + 1))
+            return
+
+        self._stats['documents'] += len(chunk)
+        self._stats['chunks'] += 1
+        for field in ('created', 'errors', 'empty', 'updated', 'ignored'):
+            self._stats[field] += result.get(field, 0)
+
+        if latency > self._target_latency:
+            self._decrease(concurrency=False)
+        else:
+            self._increase()
+
+    @staticmethod
+    def _is_overload(error):
+        """Return whether the error indicates that the server is overloaded.
+
+        :param error: the error raised by a chunk
+        :type error: Exception
+        :returns: whether the chunk should be retried
+        :rtype: bool
+        """
+        if isinstance(error, (ConnectionError, Timeout)):
+            return True
+        return getattr(error, 'http_code', None) in HTTP_OVERLOAD
+
+    def _increase(self):
+        """Increase the chunk size, and the concurrency once per round."""
+        self._chunk_size = min(
+            self._chunk_size + self._min_chunk_size, self._max_chunk_size
+        )
+        self._streak += 1
+        if self._streak >= self._workers:
+            self._streak = 0
+            self._workers = min(self._workers + 1, self._max_workers)
+
+    def _decrease(self, concurrency):
+        """Cut down the chunk size, and the concurrency if requested.
+
+        :param concurrency: whether to cut down the concurrency as well
+        :type concurrency: bool
+        """
+        self._streak = 0
+        self._chunk_size = max(
+            int(self._chunk_size * self._backoff), self._min_chunk_size
+        )
+        if concurrency:
+            self._workers = max(int(self._workers * self._backoff), 1)
@@ -0,0 +1,474 @@
+from __future__ import absolute_import, unicode_literals
+
+import re
+from collections import OrderedDict
+from json import dumps, loads
+from threading import Lock
+from time import time
+
+# String literals and quoted names, or runs of whitespace and comments in AQL
+_AQL_TOKENS = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`[^`]*`|'
+    r'((?://[^\n]*|/\*.*?\*/|\s)+)',
+    re.DOTALL
+)
+
+
+class DocumentCache(object):
+    """Client-side LRU cache of the documents in a collection.
+
+    Documents are cached by key along with their revisions. A cached document
+    is served from memory for **ttl** seconds after it was fetched or last
+    revalidated. After that, it is revalidated by sending its revision in the
+    ``If-None-Match`` header: if the document was not modified, the server
+    replies with HTTP 304 and no body, and the cached copy is served.
+
+    :param max_size: the maximum number of documents kept in the cache, past
+        which the least recently used documents are evicted
+    :type max_size: int
+    :param ttl: the number of seconds a cached document is served without
+        being revalidated (by default, it is revalidated on every read)
+    :type ttl: int | float
+    :param revision_check: if set to ``True``, the collection revision is
+        used as a validity token for the whole cache: once the **ttl** has
+        expired, a single request fetching the collection revision
+        revalidates all cached documents at once if the collection was not
+        modified in the meantime. Otherwise, the documents cached before the
+        modification are revalidated one by one as they are read. This
+        requires a positive **ttl**.
+    :type revision_check: bool
+    :raises ValueError: if **revision_check** is set without a positive
+        **ttl**
+
+    .. note::
+        The documents are cached in their JSON form, so every read returns a
+        new copy which can be modified safely.
+    """
+
+    def __init__(self, max_size=1000, ttl=0, revision_check=False):
+        if revision_check and not ttl > 0:
+            raise ValueError('revision check requires a positive ttl')
+        self._max_size = max(max_size, 1)
+        self._ttl = ttl
+        self._revision_check = revision_check
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._revision = None
+        self._revision_time = None
+        self._generation = 0
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revision_checks = 0
+
+    def __repr__(self):
+        return '<ArangoDB document cache ({} documents)>'.format(len(self))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def revision_check(self):
+        """Return whether the collection revision is used as a validity token.
+
+        :returns: whether the collection revision is used as a validity token
+        :rtype: bool
+        """
+        return self._revision_check
+
+    @property
+    def generation(self):
+        """Return the generation of the cache.
+
+        The generation changes whenever the collection revision the cache is
+        validated against changes. It should be read before fetching a
+        document, and passed to :func:`arango.cache.DocumentCache.store` or
+        :func:`arango.cache.DocumentCache.revalidated` afterwards.
+
+        :returns: the generation of the cache
+        :rtype: int
+        """
+        return self._generation
+
+    def _fresh(self, entry, now):
+        """Return whether a cache entry can be served without revalidation.
+
+        :param entry: the cache entry
+        :type entry: tuple
+        :param now: the current time
+        :type now: float
+        :returns: whether the entry can be served without revalidation
+        :rtype: bool
+        """
+        _, _, validated, generation = entry
+        if now - validated < self._ttl:
+            return True
+        return (
+            self._revision_check and
+            generation == self._generation and
+            self._revision_time is not None and
+            now - self._revision_time < self._ttl
+        )
+
+    def revision_due(self):
+        """Return whether the collection revision should be checked.
+
+        :returns: whether revision checks are enabled and the collection
+            revision was not checked within the last **ttl** seconds
+        :rtype: bool
+        """
+        with self._lock:
+            return self._revision_check and (
+                self._revision_time is None or
+                time() - self._revision_time >= self._ttl
+            )
+
+    def validate(self, revision):
+        """Validate the cache against the current collection revision.
+
+        If the revision did not change since the last check, all documents
+        cached since then are valid for another **ttl** seconds. Otherwise,
+        the cache moves to a new generation and the documents cached so far
+        must be revalidated one by one.
+
+        :param revision: the current collection revision
+        :type revision: str | unicode
+        :returns: whether the collection revision did not change
+        :rtype: bool
+        """
+        with self._lock:
+            self._revision_checks += 1
+            self._revision_time = time()
+            if revision == self._revision:
+                return True
+            self._revision = revision
+            self._generation += 1
+            return False
+
+    def lookup(self, key):
+        """Return the cached document if it can be served without revalidation.
+
+        :param key: the document key
+        :type key: str | unicode
+        :returns: the document if cached and fresh, otherwise ``None`` along
+            with the cached revision (or ``None`` if not cached) to revalidate
+        :rtype: (dict, str | unicode)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            # Mark the document as the most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            if self._fresh(entry, time()):
+                self._hits += 1
+                return loads(entry[0]), entry[1]
+            return None, entry[1]
+
+    def revalidated(self, key, generation=None):
+        """Mark the cached document as not modified and return it.
+
+        :param key: the document key
+        :type key: str | unicode
+        :param generation: the generation of the cache before the document
+            was revalidated
+        :type generation: int
+        :returns: the cached document, or ``None`` if it was evicted meanwhile
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            raw, rev, _, current = entry
+            if generation is None:
+                generation = current
+            self._entries[key] = (raw, rev, time(), generation)
+            self._revalidations += 1
+        return loads(raw)
+
+    def store(self, key, raw, rev, generation=None):
+        """Cache a document fetched from the server.
+
+        :param key: the document key
+        :type key: str | unicode
+        :param raw: the document in its JSON form
+        :type raw: str | unicode
+        :param rev: the document revision
+        :type rev: str | unicode
+        :param generation: the generation of the cache before the document
+            was fetched (default: the current generation)
+        :type generation: int
+        """
+        with self._lock:
+            if generation is None:
+                generation = self._generation
+            self._misses += 1
+            self._entries.pop(key, None)
+            self._entries[key] = (raw, rev, time(), generation)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def discard(self, key):
+        """Remove a document from the cache.
+
+        :param key: the document key
+        :type key: str | unicode
+        :returns: whether the document was cached
+        :rtype: bool
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        """Remove all documents from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._revision = None
+            self._revision_time = None
+
+    def statistics(self):
+        """Return the statistics of the cache.
+
+        :returns: the number of reads served from memory (``"hits"``), served
+            after revalidation (``"revalidations"``) and fetched from the
+            server (``"misses"``), the number of evicted documents
+            (``"evictions"``), the number of collection revision checks
+            (``"revision_checks"``), the number of cached documents
+            (``"size"``) and the ratio of reads not transferring the document
+            (``"hit_rate"``)
+        :rtype: dict
+        """
+        with self._lock:
+            reads = self._hits + self._revalidations + self._misses
+            return {
+                'hits': self._hits,
+                'revalidations': self._revalidations,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'revision_checks': self._revision_checks,
+                'size': len(self._entries),
+                'hit_rate': (
+                    float(self._hits + self._revalidations) / reads
+                    if reads else 0.0
+                )
+            }
+
+
+class QueryResultCache(object):
+    """Client-side LRU cache of AQL query results.
+
+    Results are cached by query text (with its whitespace and comments
+    normalized), bind variables and result-affecting options, along with the
+    revisions of the collections read by the query. A cached result is served
+    from memory for **ttl** seconds after it was fetched or last revalidated.
+    After that, it is revalidated by fetching the current revisions of its
+    collections: if none of them was modified, the cached result is served,
+    otherwise the query is executed again.
+
+    :param max_size: the maximum number of results kept in the cache, past
+        which the least recently used results are evicted
+    :type max_size: int
+    :param ttl: the number of seconds a cached result is served without
+        being revalidated (by default, it is revalidated on every read)
+    :type ttl: int | float
+
+    .. note::
+        The results are cached in their JSON form, so every read returns a
+        new copy which can be modified safely.
+    """
+
+    def __init__(self, max_size=100, ttl=0):
+        self._max_size = max(max_size, 1)
+        self._ttl = ttl
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._uncachable = OrderedDict()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __repr__(self):
+        return '<ArangoDB query result cache ({} results)>'.format(len(self))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @staticmethod
+    def normalize(query):
+        """Normalize the whitespace and strip the comments in an AQL query.
+
+        :param query: the AQL query
+        :type query: str | unicode
+        :returns: the normalized query
+        :rtype: str | unicode
+        """
+        return _AQL_TOKENS.sub(
+            lambda match: match.group(0) if match.group(1) is None else ' ',
+            query
+        ).strip()
+
+    @classmethod
+    def key(cls, query, bind_vars=None, options=None):
+        """Return the cache key of a query.
+
+        :param query: the AQL query
+        :type query: str | unicode
+        :param bind_vars: the bind variables of the query
+        :type bind_vars: dict
+        :param options: the query options affecting its result
+        :type options: dict
+        :returns: the cache key
+        :rtype: str | unicode
+        """
+        return dumps(
+            [cls.normalize(query), bind_vars or {}, options or {}],
+            sort_keys=True
+        )
+
+    def lookup(self, key):
+        """Return the cached result if it can be served without revalidation.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        :returns: the cursor data of the result if cached and fresh, otherwise
+            ``None`` along with the collection revisions (or ``None`` if not
+            cached) to revalidate
+        :rtype: (dict, dict)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            raw, revisions, validated = entry
+            # Mark the result as the most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            if time() - validated < self._ttl:
+                self._hits += 1
+                return loads(raw), revisions
+            return None, revisions
+
+    def revalidated(self, key):
+        """Mark the cached result as not modified and return it.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        :returns: the cursor data of the result, or ``None`` if it was evicted
+            meanwhile
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            raw, revisions, _ = entry
+            self._entries[key] = (raw, revisions, time())
+            self._revalidations += 1
+        return loads(raw)
+
+    def invalidate(self, key):
+        """Remove a cached result whose collections were modified.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def store(self, key, data, revisions):
+        """Cache the result of a query.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        :param data: the cursor data of the complete result
+        :type data: dict
+        :param revisions: the revisions of the collections read by the query,
+            fetched before it was executed
+        :type revisions: dict
+        """
+        raw = dumps(data)
+        with self._lock:
+            self._misses += 1
+            self._entries.pop(key, None)
+            self._entries[key] = (raw, revisions, time())
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def uncachable(self, key):
+        """Return whether the result of a query was found not cachable.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        :returns: whether the query was marked as not cachable
+        :rtype: bool
+        """
+        with self._lock:
+            return key in self._uncachable
+
+    def mark_uncachable(self, key):
+        """Remember that the result of a query cannot be cached.
+
+        The query (e.g. one modifying documents, or reading no collection)
+        is then executed right away on the following reads, without being
+        explained again. The markers are kept until the cache is cleared,
+        past **max_size** markers the least recently marked are dropped.
+
+        :param key: the cache key of the query
+        :type key: str | unicode
+        """
+        with self._lock:
+            self._uncachable.pop(key, None)
+            self._uncachable[key] = True
+            while len(self._uncachable) > self._max_size:
+                self._uncachable.popitem(last=False)
+
+    def clear(self):
+        """Remove all results (and not cachable markers) from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._uncachable.clear()
+
+    def statistics(self):
+        """Return the statistics of the cache.
+
+        :returns: the number of queries served from memory (``"hits"``),
+            served after revalidation (``"revalidations"``) and executed on
+            the server (``"misses"``), the number of evicted results
+            (``"evictions"``) and of results invalidated by modifications of
+            their collections (``"invalidations"``), the number of cached
+            results (``"size"``) and the ratio of queries not executed on the
+            server (``"hit_rate"``)
+        :rtype: dict
+        """
+        with self._lock:
+            reads = self._hits + self._revalidations + self._misses
+            return {
+                'hits': self._hits,
+                'revalidations': self._revalidations,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'size': len(self._entries),
+                'hit_rate': (
+                    float(self._hits + self._revalidations) / reads
+                    if reads else 0.0
+                )
+            }
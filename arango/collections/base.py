@@ -4,6 +4,15 @@ from arango.api import APIWrapper, api_method
 from arango.cursor import Cursor, ExportCursor
 from arango.exceptions import *
 from arango.request import Request
+from arango.scan import (
+    Page,
+    ParallelScan,
+    Scan,
+    check_connection,
+    decode_page_token,
+    encode_page_token,
+    fetch_page
+)
 from arango.utils import HTTP_OK
 
 
@@ -97,6 +106,11 @@ class BaseCollection(APIWrapper):
             return True
         raise DocumentInError(res)
 
+    def _clear_cache(self):
+        """Remove all documents from the document cache, if the collection
+        has one (see :func:`arango.collections.Collection.enable_cache`).
+        """
+
     def _status(self, code):
         """Return the collection status text.
 
@@ -414,6 +428,7 @@ class BaseCollection(APIWrapper):
         )
 
         def handler(res):
+            self._clear_cache()
             if res.status_code not in HTTP_OK:
                 raise CollectionTruncateError(res)
             return {
@@ -500,6 +515,11 @@ class BaseCollection(APIWrapper):
         :rtype: arango.cursor.Cursor
         :raises arango.exceptions.DocumentGetError: if the documents in
             the collection cannot be retrieved
+
+        .. note::
+            The server walks past all skipped documents, so deep pages get
+            slower as **skip** grows. Use
+            :func:`arango.collections.Collection.paginate` instead.
         """
 
         data = {'collection': self._name}
@@ -590,6 +610,151 @@ class BaseCollection(APIWrapper):
 
         return request, handler
 
+    def scan(self, batch_size=1000, checkpoint=None, callback=None):
+        """Scan all documents in the collection in ``"_key"`` order.
+
+        Unlike :func:`arango.collections.Collection.all` and
+        :func:`arango.collections.Collection.export`, the scan fetches the
+        documents one page at a time using keyset pagination on ``"_key"``,
+        without keeping a server cursor open. It can be resumed from the last
+        checkpoint after a failure without rescanning any documents.
+
+        :param batch_size: the max number of documents fetched per page
+        :type batch_size: int
+        :param checkpoint: the checkpoint to resume from, as returned by
+            :func:`arango.scan.Scan.checkpoint` of an earlier scan
+        :type checkpoint: dict
+        :param callback: the callable invoked with the latest checkpoint each
+            time a page of documents is fully consumed (e.g. to persist it)
+        :type callback: callable
+        :returns: the resumable scan
+        :rtype: arango.scan.Scan
+        :raises arango.exceptions.DocumentGetError: if the connection belongs
+            to a batch, async or (JavaScript) transaction execution
+
+        .. note::
+            The scan uses the primary index, which supports sorted range
+            lookups with the RocksDB storage engine.
+
+        .. note::
+            Scans are not supported in batch, async or (JavaScript)
+            transaction executions.
+        """
+        check_connection(self._conn)
+        return Scan(
+            connection=self._conn,
+            collection=self._name,
+            batch_size=batch_size,
+            checkpoint=checkpoint,
+            callback=callback
+        )
+
+    def parallel_scan(self,
+                      partitions=4,
+                      workers=None,
+                      batch_size=1000,
+                      buffer_size=None):
+        """Scan all documents in the collection with parallel cursors.
+
+        The key space is split into **partitions** ranges of roughly equal
+        size which are scanned concurrently in a thread pool. The returned
+        object can be iterated over to get the merged documents, or its
+        :func:`arango.scan.ParallelScan.run` method can be called with a
+        sink callable which receives the pages of documents as they arrive.
+
+        :param partitions: the number of key ranges to split the collection
+            into
+        :type partitions: int
+        :param workers: the max number of partitions scanned concurrently
+            (default: the number of partitions)
+        :type workers: int
+        :param batch_size: the max number of documents fetched per page
+        :type batch_size: int
+        :param buffer_size: the max number of pages buffered while iterating
+            before the workers are made to wait for the consumer
+        :type buffer_size: int
+        :returns: the parallel scan
+        :rtype: arango.scan.ParallelScan
+        :raises arango.exceptions.DocumentGetError: if the connection belongs
+            to a batch, async or (JavaScript) transaction execution
+        """
+        check_connection(self._conn)
+        return ParallelScan(
+            connection=self._conn,
+            collection=self._name,
+            partitions=partitions,
+            workers=workers,
+            batch_size=batch_size,
+            buffer_size=buffer_size
+        )
+
+    def paginate(self,
+                 page_size=100,
+                 page_token=None,
+                 filters=None,
+                 sort_field='_key',
+                 descending=False):
+        """Return a page of documents using keyset pagination.
+
+        This is a replacement for paging with the **skip** and **offset**
+        parameters of :func:`arango.collections.Collection.all` and
+        :func:`arango.collections.Collection.find`, which make the server
+        walk past all previous pages. Each page here picks up right after the
+        last document of the previous page, so page N costs as much as page 1.
+
+        :param page_size: the max number of documents in the page
+        :type page_size: int
+        :param page_token: the token of the page to return, taken from
+            :attr:`arango.scan.Page.next_token` of the previous page (if not
+            given, the first page is returned)
+        :type page_token: str | unicode
+        :param filters: the document fields and values to match exactly
+        :type filters: dict
+        :param sort_field: the document field to sort by (ties are broken by
+            the document keys), which should be covered by a sorted index
+        :type sort_field: str | unicode
+        :param descending: sort the documents in descending order
+        :type descending: bool
+        :returns: the page of documents
+        :rtype: arango.scan.Page
+        :raises arango.exceptions.DocumentGetError: if the documents cannot
+            be fetched from the collection or the page token is invalid
+
+        .. note::
+            The same **filters**, **sort_field** and **descending** values
+            must be used for all pages of a pagination.
+
+        .. note::
+            Paginations are not supported in batch, async or (JavaScript)
+            transaction executions.
+        """
+        check_connection(self._conn)
+        if page_token is None:
+            after = None
+        else:
+            after = decode_page_token(page_token, sort_field)
+
+        # One extra document is fetched to find out if there are more pages
+        documents = fetch_page(
+            connection=self._conn,
+            collection=self._name,
+            limit=page_size + 1,
+            after=after,
+            sort_field=sort_field,
+            descending=descending,
+            filters=filters
+        )
+        if len(documents) <= page_size:
+            return Page(documents)
+
+        documents.pop()
+        last = documents[-1]
+        if sort_field == '_key':
+            position = (last['_key'],)
+        else:
+            position = (last.get(sort_field), last['_key'])
+        return Page(documents, encode_page_token(position))
+
     @api_method
     def find(self, filters, offset=None, limit=None):
         """Return all documents that match the given filters.
@@ -604,6 +769,11 @@ class BaseCollection(APIWrapper):
         :rtype: arango.cursor.Cursor
         :raises arango.exceptions.DocumentGetError: if the document
             cannot be fetched from the collection
+
+        .. note::
+            The server walks past all skipped documents, so deep pages get
+            slower as **offset** grows. Use
+            :func:`arango.collections.Collection.paginate` instead.
         """
         data = {'collection': self._name, 'example': filters}
         if offset is not None:
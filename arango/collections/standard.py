@@ -1,13 +1,19 @@
 from __future__ import absolute_import, unicode_literals
 
-from json import dumps
+import mmap
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from six import string_types
 
 from arango.api import api_method
+from arango.cache import DocumentCache
 from arango.collections.base import BaseCollection
 from arango.exceptions import *
+from arango.importer import check_connection, split_csv
 from arango.request import Request
-from arango.utils import HTTP_OK
+from arango.result import BulkResult
+from arango.utils import HTTP_OK, split_documents
 
 
 class Collection(BaseCollection):
@@ -29,11 +35,196 @@ class Collection(BaseCollection):
 
     def __init__(self, connection, name):
         super(Collection, self).__init__(connection, name)
+        self._cache = None
 
     def __repr__(self):
         return '<ArangoDB collection "{}">'.format(self._name)
 
-    @api_method
+    def __getitem__(self, key):
+        """Return a document by its key from the collection.
+
+        :param key: the document key
+        :type key: str  | unicode
+        :returns: the document
+        :rtype: dict
+        :raises arango.exceptions.DocumentGetError: if the document cannot
+            be fetched from the collection
+        """
+        if self._cache is not None and self._conn.type == 'standard':
+            return self._get_cached(key)
+        return super(Collection, self).__getitem__(key)
+
+    @property
+    def cache(self):
+        """Return the document cache of the collection object.
+
+        :returns: the document cache, or ``None`` if caching is disabled
+        :rtype: arango.cache.DocumentCache
+        """
+        return self._cache
+
+    def enable_cache(self, max_size=1000, ttl=0, revision_check=False):
+        """Cache the documents read through this collection object.
+
+        Refer to :class:`arango.cache.DocumentCache` for more information.
+
+        :param max_size: the maximum number of documents kept in the cache
+        :type max_size: int
+        :param ttl: the number of seconds a cached document is served without
+            being revalidated (by default, it is revalidated on every read)
+        :type ttl: int | float
+        :param revision_check: revalidate all cached documents at once using
+            the collection revision (best suited for collections which are
+            rarely modified), which requires a positive **ttl**
+        :type revision_check: bool
+        :returns: the document cache
+        :rtype: arango.cache.DocumentCache
+        :raises ValueError: if **revision_check** is set without a positive
+            **ttl**
+
+        .. note::
+            The cache is used by :func:`arango.collections.Collection.get`
+            (when no revision is given) and by key lookups (``col[key]``) in
+            the collection object it is enabled for. The documents modified
+            through the same collection object are evicted from the cache
+            once the server responds, and the whole cache is cleared by
+            truncates, match operations and imports which can overwrite
+            existing documents.
+        """
+        self._cache = DocumentCache(
+            max_size=max_size,
+            ttl=ttl,
+            revision_check=revision_check
+        )
+        return self._cache
+
+    def disable_cache(self):
+        """Stop caching the documents read through this collection object."""
+        self._cache = None
+
+    def revalidate_cache(self):
+        """Revalidate all cached documents against the collection revision.
+
+        A single request fetching the collection revision is sent. If the
+        collection was not modified since the last check, all documents
+        cached since then are served from memory for another **ttl** seconds
+        without being revalidated one by one.
+
+        :returns: whether the collection was not modified since the last check
+            (``None`` if the document cache is not enabled)
+        :rtype: bool
+        :raises arango.exceptions.CollectionRevisionError: if the collection
+            revision cannot be retrieved
+        """
+        if self._cache is None:
+            return None
+        return self._cache.validate(self.revision())
+
+    def _get_cached(self, key):
+        """Read a document through the document cache.
+
+        :param key: the document key
+        :type key: str | unicode
+        :returns: the document or ``None`` if the document is missing
+        :rtype: dict
+        :raises arango.exceptions.DocumentGetError: if the document cannot
+            be retrieved from the collection
+        """
+        cache = self._cache
+        document, rev = cache.lookup(key)
+        if document is not None:
+            return document
+
+        if cache.revision_due():
+            # One cheap request may revalidate the whole cache at once
+            cache.validate(self.revision())
+            if rev is not None:
+                document, rev = cache.lookup(key)
+                if document is not None:
+                    return document
+
+        generation = cache.generation
+        res = self._conn.get(
+            '/_api/document/{}/{}'.format(self._name, key),
+            headers={'If-None-Match': rev} if rev is not None else None
+        )
+        if res.status_code == 304:
+            document = cache.revalidated(key, generation)
+            if document is not None:
+                return document
+            return self._get_cached(key)
+        elif res.status_code == 404 and res.error_code == 1202:
+            cache.discard(key)
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise DocumentGetError(res)
+        cache.store(key, res.raw_body, res.body['_rev'], generation)
+        return res.body
+
+    def _evict(self, documents):
+        """Remove the given documents from the document cache.
+
+        :param documents: the documents or keys
+        :type documents: list
+        """
+        if self._cache is None:
+            return
+        for document in documents:
+            if isinstance(document, string_types):
+                self._cache.discard(document)
+            elif '_key' in document:
+                self._cache.discard(document['_key'])
+            elif '_id' in document:
+                self._cache.discard(document['_id'].split('/', 1)[-1])
+
+    def _clear_cache(self):
+        """Remove all documents from the document cache."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _write_many(self,
+                    method,
+                    documents,
+                    chunk_size,
+                    max_bytes,
+                    workers,
+                    **kwargs):
+        """Send the documents in chunks and merge the per-document results.
+
+        :param method: the API method writing a single chunk
+        :type method: callable
+        :param documents: the documents to write
+        :type documents: list
+        :param chunk_size: the maximum number of documents per chunk
+        :type chunk_size: int
+        :param max_bytes: the maximum number of bytes per chunk
+        :type max_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
+        :returns: the results of all chunks in the order of **documents**
+        :rtype: list | arango.result.BulkResult
+        """
+        if (
+            (chunk_size is None and max_bytes is None) or
+            self._conn.type not in ('standard', 'stream_transaction')
+        ):
+            return method(documents, **kwargs)
+
+        chunks = split_documents(documents, chunk_size, max_bytes)
+        if len(chunks) <= 1:
+            return method(documents, **kwargs)
+
+        if not workers or workers <= 1 or self._conn.type != 'standard':
+            results = [method(chunk, **kwargs) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda chunk: method(chunk, **kwargs), chunks
+                ))
+        if results and isinstance(results[0], BulkResult):
+            return BulkResult.merge(results)
+        return [result for chunk in results for result in chunk]
+
     def get(self, key, rev=None, match_rev=True):
         """Retrieve a document by its key.
 
@@ -52,7 +243,23 @@ class Collection(BaseCollection):
             does not match the revision of the retrieved document
         :raises arango.exceptions.DocumentGetError: if the document cannot
             be retrieved from the collection
+
+        .. note::
+            If the document cache is enabled (see method
+            :func:`arango.collections.Collection.enable_cache`) and **rev** is
+            not given, the document is read through the cache
         """
+        if (
+            self._cache is not None and
+            rev is None and
+            self._conn.type == 'standard'
+        ):
+            return self._get_cached(key)
+        return self._get(key, rev, match_rev)
+
+    @api_method
+    def _get(self, key, rev=None, match_rev=True):
+        """Send the request retrieving a document by its key."""
         request = Request(
             method='get',
             endpoint='/_api/document/{}/{}'.format(self._name, key),
@@ -103,19 +310,18 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command = 'db.{}.insert({},{})'.format(
-                self._name,
-                dumps(document),
-                dumps(params)
-            )
+            command = 'db.{}.insert'.format(self._name)
+            command_args = [document, params]
 
         request = Request(
             method='post',
             endpoint='/_api/document/{}'.format(self._name),
             data=document,
             params=params,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
@@ -129,8 +335,14 @@ class Collection(BaseCollection):
 
         return request, handler
 
-    @api_method
-    def insert_many(self, documents, return_new=False, sync=None):
+    def insert_many(self,
+                    documents,
+                    return_new=False,
+                    sync=None,
+                    compact=False,
+                    chunk_size=None,
+                    max_bytes=None,
+                    workers=None):
         """Insert multiple documents into the collection.
 
         If the ``"_key"`` fields are present in the entries in **documents**,
@@ -145,6 +357,17 @@ class Collection(BaseCollection):
         :type return_new: bool
         :param sync: wait for the operation to sync to disk
         :type sync: bool
+        :param compact: if ``True``, the results are returned as a compact
+            :class:`arango.result.BulkResult` instead of a list
+        :type compact: bool
+        :param chunk_size: if set, the documents are sent in chunks of at
+            most this many documents
+        :type chunk_size: int
+        :param max_bytes: if set, the documents are sent in chunks of at most
+            this many (JSON-encoded) bytes
+        :type max_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
         :returns: the result of the insert (e.g. document keys, revisions)
         :rtype: dict
         :raises arango.exceptions.DocumentInsertError: if the documents cannot
@@ -152,31 +375,55 @@ class Collection(BaseCollection):
 
         .. note::
             Argument **return_new** has no effect in a transaction
+
+        .. note::
+            Arguments **chunk_size**, **max_bytes** and **workers** have no
+            effect in batch, async and (non-stream) transactions, and
+            **workers** has no effect in stream transactions
         """
+        return self._write_many(
+            self._insert_many,
+            documents,
+            chunk_size,
+            max_bytes,
+            workers,
+            return_new=return_new,
+            sync=sync,
+            compact=compact
+        )
+
+    @api_method
+    def _insert_many(self,
+                     documents,
+                     return_new=False,
+                     sync=None,
+                     compact=False):
+        """Send the documents to insert in a single request."""
         params = {'returnNew': return_new}
         if sync is not None:
             params['waitForSync'] = sync
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command = 'db.{}.insert({},{})'.format(
-                self._name,
-                dumps(documents),
-                dumps(params)
-            )
+            command = 'db.{}.insert'.format(self._name)
+            command_args = [documents, params]
 
         request = Request(
             method='post',
             endpoint='/_api/document/{}'.format(self._name),
             data=documents,
             params=params,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
             if res.status_code not in HTTP_OK:
                 raise DocumentInsertError(res)
+            if compact:
+                return BulkResult(res, self._name, DocumentInsertError)
 
             results = []
             for result in res.body:
@@ -250,16 +497,12 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
             if not check_rev:
                 document.pop('_rev', None)
-            documents_str = dumps(document)
-            command = 'db.{}.update({},{},{})'.format(
-                self._name,
-                documents_str,
-                documents_str,
-                dumps(params)
-            )
+            command = 'db.{}.update'.format(self._name)
+            command_args = [document, document, params]
 
         request = Request(
             method='patch',
@@ -268,10 +511,12 @@ class Collection(BaseCollection):
             ),
             data=document,
             params=params,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict([document])
             if res.status_code == 412:
                 raise DocumentRevisionError(res)
             elif res.status_code not in HTTP_OK:
@@ -285,7 +530,6 @@ class Collection(BaseCollection):
 
         return request, handler
 
-    @api_method
     def update_many(self,
                     documents,
                     merge=True,
@@ -293,7 +537,11 @@ class Collection(BaseCollection):
                     return_new=False,
                     return_old=False,
                     check_rev=False,
-                    sync=None):
+                    sync=None,
+                    compact=False,
+                    chunk_size=None,
+                    max_bytes=None,
+                    workers=None):
         """Update multiple documents in the collection.
 
         :param documents: the list of documents with updates
@@ -315,6 +563,17 @@ class Collection(BaseCollection):
         :type check_rev: bool
         :param sync: wait for the operation to sync to disk
         :type sync: bool
+        :param compact: if ``True``, the results are returned as a compact
+            :class:`arango.result.BulkResult` instead of a list
+        :type compact: bool
+        :param chunk_size: if set, the documents are sent in chunks of at
+            most this many documents
+        :type chunk_size: int
+        :param max_bytes: if set, the documents are sent in chunks of at most
+            this many (JSON-encoded) bytes
+        :type max_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
         :returns: the result of the update (e.g. document keys, revisions)
         :rtype: dict
         :raises arango.exceptions.DocumentRevisionError: if the given revision
@@ -329,10 +588,41 @@ class Collection(BaseCollection):
             Arguments **return_new** and **return_old** have no effect in
             transactions
 
+        .. note::
+            Arguments **chunk_size**, **max_bytes** and **workers** have no
+            effect in batch, async and (non-stream) transactions, and
+            **workers** has no effect in stream transactions
+
         .. warning::
             The returned details (whose size scales with the number of target
             documents) are all brought into memory
         """
+        return self._write_many(
+            self._update_many,
+            documents,
+            chunk_size,
+            max_bytes,
+            workers,
+            merge=merge,
+            keep_none=keep_none,
+            return_new=return_new,
+            return_old=return_old,
+            check_rev=check_rev,
+            sync=sync,
+            compact=compact
+        )
+
+    @api_method
+    def _update_many(self,
+                     documents,
+                     merge=True,
+                     keep_none=True,
+                     return_new=False,
+                     return_old=False,
+                     check_rev=False,
+                     sync=None,
+                     compact=False):
+        """Send the documents to update in a single request."""
         params = {
             'keepNull': keep_none,
             'mergeObjects': merge,
@@ -346,26 +636,26 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            documents_str = dumps(documents)
-            command = 'db.{}.update({},{},{})'.format(
-                self._name,
-                documents_str,
-                documents_str,
-                dumps(params)
-            )
+            command = 'db.{}.update'.format(self._name)
+            command_args = [documents, documents, params]
 
         request = Request(
             method='patch',
             endpoint='/_api/document/{}'.format(self._name),
             data=documents,
             params=params,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict(documents)
             if res.status_code not in HTTP_OK:
                 raise DocumentUpdateError(res)
+            if compact:
+                return BulkResult(res, self._name, DocumentUpdateError)
 
             results = []
             for result in res.body:
@@ -429,22 +719,21 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command = 'db.{}.updateByExample({},{},{})'.format(
-                self._name,
-                dumps(filters),
-                dumps(body),
-                dumps(data)
-            )
+            command = 'db.{}.updateByExample'.format(self._name)
+            command_args = [filters, body, data]
 
         request = Request(
             method='put',
             endpoint='/_api/simple/update-by-example',
             data=data,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._clear_cache()
             if res.status_code not in HTTP_OK:
                 raise DocumentUpdateError(res)
             return res.body['updated']
@@ -505,14 +794,10 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            documents_str = dumps(document)
-            command = 'db.{}.replace({},{},{})'.format(
-                self._name,
-                documents_str,
-                documents_str,
-                dumps(params)
-            )
+            command = 'db.{}.replace'.format(self._name)
+            command_args = [document, document, params]
 
         request = Request(
             method='put',
@@ -521,10 +806,12 @@ class Collection(BaseCollection):
             ),
             params=params,
             data=document,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict([document])
             if res.status_code == 412:
                 raise DocumentRevisionError(res)
             if res.status_code not in HTTP_OK:
@@ -538,13 +825,16 @@ class Collection(BaseCollection):
 
         return request, handler
 
-    @api_method
     def replace_many(self,
                      documents,
                      return_new=False,
                      return_old=False,
                      check_rev=False,
-                     sync=None):
+                     sync=None,
+                     compact=False,
+                     chunk_size=None,
+                     max_bytes=None,
+                     workers=None):
         """Replace multiple documents in the collection.
 
         :param documents: the list of new documents
@@ -560,6 +850,17 @@ class Collection(BaseCollection):
         :type check_rev: bool
         :param sync: wait for the operation to sync to disk
         :type sync: bool
+        :param compact: if ``True``, the results are returned as a compact
+            :class:`arango.result.BulkResult` instead of a list
+        :type compact: bool
+        :param chunk_size: if set, the documents are sent in chunks of at
+            most this many documents
+        :type chunk_size: int
+        :param max_bytes: if set, the documents are sent in chunks of at most
+            this many (JSON-encoded) bytes
+        :type max_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
         :returns: the result of the replace (e.g. document keys, revisions)
         :rtype: dict
         :raises arango.exceptions.DocumentReplaceError: if the documents cannot
@@ -574,10 +875,37 @@ class Collection(BaseCollection):
             Arguments **return_new** and **return_old** have no effect in
             transactions
 
+        .. note::
+            Arguments **chunk_size**, **max_bytes** and **workers** have no
+            effect in batch, async and (non-stream) transactions, and
+            **workers** has no effect in stream transactions
+
         .. warning::
             The returned details (whose size scales with the number of target
             documents) are all brought into memory
         """
+        return self._write_many(
+            self._replace_many,
+            documents,
+            chunk_size,
+            max_bytes,
+            workers,
+            return_new=return_new,
+            return_old=return_old,
+            check_rev=check_rev,
+            sync=sync,
+            compact=compact
+        )
+
+    @api_method
+    def _replace_many(self,
+                      documents,
+                      return_new=False,
+                      return_old=False,
+                      check_rev=False,
+                      sync=None,
+                      compact=False):
+        """Send the documents to replace in a single request."""
         params = {
             'returnNew': return_new,
             'returnOld': return_old,
@@ -589,26 +917,26 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            documents_str = dumps(documents)
-            command = 'db.{}.replace({},{},{})'.format(
-                self._name,
-                documents_str,
-                documents_str,
-                dumps(params)
-            )
+            command = 'db.{}.replace'.format(self._name)
+            command_args = [documents, documents, params]
 
         request = Request(
             method='put',
             endpoint='/_api/document/{}'.format(self._name),
             params=params,
             data=documents,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict(documents)
             if res.status_code not in HTTP_OK:
                 raise DocumentReplaceError(res)
+            if compact:
+                return BulkResult(res, self._name, DocumentReplaceError)
 
             results = []
             for result in res.body:
@@ -662,22 +990,21 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command ='db.{}.replaceByExample({},{},{})'.format(
-                self._name,
-                dumps(filters),
-                dumps(body),
-                dumps(data)
-            )
+            command = 'db.{}.replaceByExample'.format(self._name)
+            command_args = [filters, body, data]
 
         request = Request(
             method='put',
             endpoint='/_api/simple/replace-by-example',
             data=data,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._clear_cache()
             if res.status_code not in HTTP_OK:
                 raise DocumentReplaceError(res)
             return res.body['replaced']
@@ -737,12 +1064,13 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command = 'db.{}.remove({},{})'.format(
-                self._name,
-                dumps(document if full_doc else {'_key': document}),
-                dumps(params)
-            )
+            command = 'db.{}.remove'.format(self._name)
+            command_args = [
+                document if full_doc else {'_key': document},
+                params
+            ]
 
         request = Request(
             method='delete',
@@ -751,10 +1079,12 @@ class Collection(BaseCollection):
             ),
             params=params,
             headers=headers,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict([document])
             if res.status_code == 412:
                 raise DocumentRevisionError(res)
             elif res.status_code == 404:
@@ -771,12 +1101,15 @@ class Collection(BaseCollection):
 
         return request, handler
 
-    @api_method
     def delete_many(self,
                     documents,
                     return_old=False,
                     check_rev=False,
-                    sync=None):
+                    sync=None,
+                    compact=False,
+                    chunk_size=None,
+                    max_bytes=None,
+                    workers=None):
         """Delete multiple documents from the collection.
 
         :param documents: the list of documents or keys to delete
@@ -789,6 +1122,17 @@ class Collection(BaseCollection):
         :type check_rev: bool
         :param sync: wait for the operation to sync to disk
         :type sync: bool
+        :param compact: if ``True``, the results are returned as a compact
+            :class:`arango.result.BulkResult` instead of a list
+        :type compact: bool
+        :param chunk_size: if set, the documents are sent in chunks of at
+            most this many documents
+        :type chunk_size: int
+        :param max_bytes: if set, the documents are sent in chunks of at most
+            this many (JSON-encoded) bytes
+        :type max_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
         :returns: the result of the delete (e.g. document keys, revisions)
         :rtype: dict
         :raises arango.exceptions.DocumentDeleteError: if the documents cannot
@@ -797,7 +1141,32 @@ class Collection(BaseCollection):
         .. note::
             If an entry in **documents** is a dictionary it must have the
             ``"_key"`` field
+
+        .. note::
+            Arguments **chunk_size**, **max_bytes** and **workers** have no
+            effect in batch, async and (non-stream) transactions, and
+            **workers** has no effect in stream transactions
         """
+        return self._write_many(
+            self._delete_many,
+            documents,
+            chunk_size,
+            max_bytes,
+            workers,
+            return_old=return_old,
+            check_rev=check_rev,
+            sync=sync,
+            compact=compact
+        )
+
+    @api_method
+    def _delete_many(self,
+                     documents,
+                     return_old=False,
+                     check_rev=False,
+                     sync=None,
+                     compact=False):
+        """Send the documents to delete in a single request."""
         params = {
             'returnOld': return_old,
             'ignoreRevs': not check_rev,
@@ -808,24 +1177,26 @@ class Collection(BaseCollection):
 
         if self._conn.type != 'transaction':
             command = None
+            command_args = None
         else:
-            command = 'db.{}.remove({},{})'.format(
-                self._name,
-                dumps(documents),
-                dumps(params)
-            )
+            command = 'db.{}.remove'.format(self._name)
+            command_args = [documents, params]
 
         request = Request(
             method='delete',
             endpoint='/_api/document/{}'.format(self._name),
             params=params,
             data=documents,
-            command=command
+            command=command,
+            command_args=command_args
         )
 
         def handler(res):
+            self._evict(documents)
             if res.status_code not in HTTP_OK:
                 raise DocumentDeleteError(res)
+            if compact:
+                return BulkResult(res, self._name, DocumentDeleteError)
 
             results = []
             for result in res.body:
@@ -873,14 +1244,12 @@ class Collection(BaseCollection):
             method='put',
             endpoint='/_api/simple/remove-by-example',
             data=data,
-            command='db.{}.removeByExample({}, {})'.format(
-                self._name,
-                dumps(filters),
-                dumps(data)
-            )
+            command='db.{}.removeByExample'.format(self._name),
+            command_args=[filters, data]
         )
 
         def handler(res):
+            self._clear_cache()
             if res.status_code not in HTTP_OK:
                 raise DocumentDeleteError(res)
             return res.body['deleted']
@@ -983,6 +1352,9 @@ class Collection(BaseCollection):
         if sync is not None:
             params['waitForSync'] = sync
 
+        # Existing documents are only modified on these options
+        clears_cache = overwrite or on_duplicate in ('update', 'replace')
+
         request = Request(
             method='post',
             endpoint='/_api/import',
@@ -991,6 +1363,218 @@ class Collection(BaseCollection):
         )
 
         def handler(res):
+            if clears_cache:
+                self._clear_cache()
+            if res.status_code not in HTTP_OK:
+                raise DocumentInsertError(res)
+            return res.body
+
+        return request, handler
+
+    def import_file(self,
+                    path,
+                    format='jsonl',
+                    chunk_bytes=8388608,
+                    workers=None,
+                    halt_on_error=None,
+                    details=True,
+                    from_prefix=None,
+                    to_prefix=None,
+                    on_duplicate=None,
+                    sync=None):
+        """Import the documents in a file into the collection.
+
+        The file is cut into chunks of roughly **chunk_bytes**, which are
+        imported separately, so files larger than memory can be imported.
+        JSON lines files are memory-mapped and cut at line boundaries, and
+        each chunk is sent to the server as is (without being parsed in
+        Python). CSV files are parsed with the :mod:`csv` module one record
+        at a time, and the records are sent as JSON arrays.
+
+        :param path: the path to the file
+        :type path: str | unicode
+        :param format: the format of the file, which can be ``"jsonl"`` (one
+            JSON document per line) or ``"csv"`` (a header record with the
+            attribute names, followed by a record of values per document)
+        :type format: str | unicode
+        :param chunk_bytes: the approximate number of bytes per chunk
+        :type chunk_bytes: int
+        :param workers: the number of chunks sent concurrently
+        :type workers: int
+        :param halt_on_error: halt the import of a chunk on an error
+            (default: ``True``)
+        :type halt_on_error: bool
+        :param details: if ``True``, the report of each chunk will include an
+            additional list of detailed error messages (default: ``True``)
+        :type details: bool
+        :param from_prefix: the string prefix to prepend to the ``"_from"``
+            field of each edge document inserted. *This only works for edge
+            collections.*
+        :type from_prefix: str | unicode
+        :param to_prefix: the string prefix to prepend to the ``"_to"`` field
+            of each edge document inserted. *This only works for edge
+            collections.*
+        :type to_prefix: str | unicode
+        :param on_duplicate: the action to take on unique key constraint
+            violations (see :func:`arango.collections.Collection.import_bulk`)
+        :type on_duplicate: str | unicode
+        :param sync: wait for the operation to sync to disk
+        :type sync: bool
+        :returns: the report of each chunk in the order of the file, which
+            is the result of the bulk import along with the position of the
+            chunk in the file (``"offset"`` and ``"size"``, in bytes for JSON
+            lines files and in records after the header for CSV files), or
+            the exception (``"error"``) if the chunk failed as a whole
+        :rtype: [dict]
+        :raises arango.exceptions.DocumentInsertError: if the collection
+            belongs to a batch, async or transaction execution
+
+        .. note::
+            CSV files must be UTF-8 encoded with comma-separated values, and
+            all values are imported as strings (see
+            :func:`arango.importer.split_csv`).
+
+        .. note::
+            File imports are not supported in batch, async or (JavaScript)
+            transaction executions.
+
+        .. note::
+            Argument **halt_on_error** applies to each chunk separately: the
+            other chunks are still imported.
+        """
+        if format not in ('jsonl', 'csv'):
+            raise ValueError('invalid format: {}'.format(format))
+        check_connection(self._conn)
+        options = {
+            'header': format == 'csv',
+            'halt_on_error': halt_on_error,
+            'details': details,
+            'from_prefix': from_prefix,
+            'to_prefix': to_prefix,
+            'on_duplicate': on_duplicate,
+            'sync': sync
+        }
+
+        def import_chunk(chunk):
+            offset, size, body = chunk
+            report = {'offset': offset, 'size': size}
+            try:
+                report.update(self.import_raw(body, **options))
+            except DocumentInsertError as error:
+                report['error'] = error
+            return report
+
+        def import_chunks(chunks):
+            if not workers or workers <= 1 or self._conn.type != 'standard':
+                return [import_chunk(chunk) for chunk in chunks]
+            # Only a few chunks are read ahead of the ones being imported
+            reports = []
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for chunk in chunks:
+                    pending.append(executor.submit(import_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        reports.append(pending.popleft().result())
+                reports.extend(future.result() for future in pending)
+            return reports
+
+        if format == 'csv':
+            return import_chunks(split_csv(path, max(chunk_bytes, 1)))
+
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            if f.tell() == 0:
+                return []
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            def split_lines():
+                start = 0
+                while start < len(data):
+                    end = data.find(b'\n', start + max(chunk_bytes, 1) - 1)
+                    end = len(data) if end == -1 else end + 1
+                    yield start, end - start, data[start:end]
+                    start = end
+
+            return import_chunks(split_lines())
+        finally:
+            data.close()
+
+    @api_method
+    def import_raw(self,
+                   data,
+                   header=False,
+                   halt_on_error=None,
+                   details=True,
+                   from_prefix=None,
+                   to_prefix=None,
+                   on_duplicate=None,
+                   sync=None):
+        """Import already encoded documents into the collection.
+
+        The body is sent to the server as is, without being parsed or
+        encoded in Python, which is how
+        :func:`arango.collections.Collection.import_file` imports its chunks.
+
+        :param data: the encoded documents, which are either one JSON
+            document per line, or (if **header** is ``True``) a JSON array of
+            attribute names followed by a JSON array of values per line
+        :type data: str | unicode | bytes
+        :param header: whether **data** starts with a header line
+        :type header: bool
+        :param halt_on_error: halt the entire import on an error
+            (default: ``True``)
+        :type halt_on_error: bool
+        :param details: if ``True``, the returned result will include an
+            additional list of detailed error messages (default: ``True``)
+        :type details: bool
+        :param from_prefix: the string prefix to prepend to the ``"_from"``
+            field of each edge document inserted. *This only works for edge
+            collections.*
+        :type from_prefix: str | unicode
+        :param to_prefix: the string prefix to prepend to the ``"_to"`` field
+            of each edge document inserted. *This only works for edge
+            collections.*
+        :type to_prefix: str | unicode
+        :param on_duplicate: the action to take on unique key constraint
+            violations (see :func:`arango.collections.Collection.import_bulk`)
+        :type on_duplicate: str | unicode
+        :param sync: wait for the operation to sync to disk
+        :type sync: bool
+        :returns: the result of the bulk import
+        :rtype: dict
+        :raises arango.exceptions.DocumentInsertError: if the documents cannot
+            be inserted into the collection
+        """
+        params = {
+            'collection': self._name,
+            'details': details,
+        }
+        if not header:
+            params['type'] = 'documents'
+        if halt_on_error is not None:
+            params['complete'] = halt_on_error
+        if from_prefix is not None:
+            params['fromPrefix'] = from_prefix
+        if to_prefix is not None:
+            params['toPrefix'] = to_prefix
+        if on_duplicate is not None:
+            params['onDuplicate'] = on_duplicate
+        if sync is not None:
+            params['waitForSync'] = sync
+
+        # Existing documents are only modified on these options
+        clears_cache = on_duplicate in ('update', 'replace')
+
+        request = Request(
+            method='post',
+            endpoint='/_api/import',
+            data=data,
+            params=params
+        )
+
+        def handler(res):
+            if clears_cache:
+                self._clear_cache()
             if res.status_code not in HTTP_OK:
                 raise DocumentInsertError(res)
             return res.body
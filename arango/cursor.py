@@ -1,15 +1,25 @@
 from __future__ import absolute_import, unicode_literals
 
+from functools import partial
+
+from arango.registry import ResourceRegistry
 from arango.utils import HTTP_OK
 from arango.exceptions import (
     CursorNextError,
     CursorCloseError,
 )
 
+# Registry of the cursors still open on the server
+cursor_registry = ResourceRegistry('cursors')
+
 
 class Cursor(object):
     """ArangoDB cursor which returns documents from the server in batches.
 
+    Cursors which still hold results on the server are tracked until they
+    are depleted or closed. If a cursor is garbage collected (or the
+    interpreter exits) before then, it is closed on the server automatically.
+
     :param connection: ArangoDB database connection
     :type connection: arango.connection.Connection
     :param init_data: the cursor initialization data
@@ -21,9 +31,21 @@ class Cursor(object):
         This class is designed to be instantiated internally only.
     """
 
+    _endpoint = '/_api/cursor'
+
     def __init__(self, connection, init_data):
         self._conn = connection
         self._data = init_data
+        if self.id is not None and self._data.get('hasMore'):
+            cursor_registry.register(
+                obj=self,
+                resource_id=self.id,
+                release=partial(
+                    connection.delete,
+                    '{}/{}'.format(self._endpoint, self.id)
+                ),
+                database=connection.database
+            )
 
     def __iter__(self):
         return self
@@ -87,6 +109,14 @@ class Cursor(object):
         """
         return self._data.get('cached')
 
+    def extra(self):
+        """Return the extra details of the result, as sent by the server.
+
+        :returns: the extra details (e.g. raw stats and warnings)
+        :rtype: dict
+        """
+        return self._data.get('extra')
+
     def statistics(self):
         """Return any available cursor stats.
 
@@ -119,10 +149,13 @@ class Cursor(object):
         :raises: StopIteration, CursorNextError
         """
         if not self.batch() and self.has_more():
-            res = self._conn.put("/_api/cursor/{}".format(self.id))
+            res = self._conn.put("{}/{}".format(self._endpoint, self.id))
             if res.status_code not in HTTP_OK:
                 raise CursorNextError(res)
             self._data = res.body
+            if not self.has_more():
+                # The server deletes the cursor once it is depleted
+                cursor_registry.unregister(self)
         elif not self.batch() and not self.has_more():
             raise StopIteration
         return self.batch().pop(0)
@@ -138,7 +171,8 @@ class Cursor(object):
         """
         if not self.id:
             return False
-        res = self._conn.delete("/_api/cursor/{}".format(self.id))
+        cursor_registry.unregister(self)
+        res = self._conn.delete("{}/{}".format(self._endpoint, self.id))
         if res.status_code not in HTTP_OK:
             if res.status_code == 404 and ignore_missing:
                 return False
@@ -153,36 +187,4 @@ class ExportCursor(Cursor):  # pragma: no cover
         This class is designed to be instantiated internally only.
     """
 
-    def next(self):
-        """Read the next result from the cursor.
-
-        :returns: the next item in the cursor
-        :rtype: dict
-        :raises: StopIteration, CursorNextError
-        """
-        if not self.batch() and self.has_more():
-            res = self._conn.put("/_api/export/{}".format(self.id))
-            if res.status_code not in HTTP_OK:
-                raise CursorNextError(res)
-            self._data = res.body
-        elif not self.batch() and not self.has_more():
-            raise StopIteration
-        return self.batch().pop(0)
-
-    def close(self, ignore_missing=True):
-        """Close the cursor and free the resources tied to it.
-
-        :returns: whether the cursor was closed successfully
-        :rtype: bool
-        :param ignore_missing: ignore missing cursors
-        :type ignore_missing: bool
-        :raises: CursorCloseError
-        """
-        if not self.id:
-            return False
-        res = self._conn.delete("/_api/export/{}".format(self.id))
-        if res.status_code not in HTTP_OK:
-            if res.status_code == 404 and ignore_missing:
-                return False
-            raise CursorCloseError(res)
-        return True
+    _endpoint = '/_api/export'
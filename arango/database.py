@@ -4,14 +4,24 @@ from datetime import datetime
 
 from requests import ConnectionError
 
-from arango.async import AsyncExecution
+from arango.async import (
+    AsyncExecution,
+    AsyncJobHousekeeper,
+    job_registry
+)
 from arango.batch import BatchExecution
+from arango.bulk import AdaptiveBulkLoader, TransactionalBulkWriter
 from arango.cluster import ClusterTest
 from arango.collections import Collection
+from arango.cursor import cursor_registry
+from arango.dispatcher import BatchDispatcher
+from arango.dump import dump_database, restore_database
 from arango.utils import HTTP_OK
 from arango.exceptions import *
 from arango.graph import Graph
-from arango.transaction import Transaction
+from arango.pipeline import WritePipeline
+from arango.throttle import WriteThrottle
+from arango.transaction import StreamTransaction, Transaction
 from arango.aql import AQL
 from arango.wal import WriteAheadLog
 
@@ -398,7 +408,187 @@ class Database(object):
         """
         return AsyncExecution(self._conn, return_result)
 
-    def batch(self, return_result=True, commit_on_error=True):
+    def write_pipeline(self, max_pending=1000, policy='block', timeout=None):
+        """Return the write pipeline object.
+
+        Refer to :class:`arango.pipeline.WritePipeline` for more information.
+
+        :param max_pending: the maximum number of outstanding jobs
+        :type max_pending: int
+        :param policy: what to do with requests made while the pipeline is
+            full (``"block"`` or ``"drop"``)
+        :type policy: str | unicode
+        :param timeout: the maximum number of seconds to block producers for
+        :type timeout: int | float
+        :returns: the write pipeline object
+        :rtype: arango.pipeline.WritePipeline
+        """
+        return WritePipeline(
+            connection=self._conn,
+            max_pending=max_pending,
+            policy=policy,
+            timeout=timeout
+        )
+
+    def bulk_writer(self,
+                    collection,
+                    method='insert',
+                    chunk_size=1000,
+                    sync=None,
+                    timeout=None,
+                    compensate=False,
+                    callback=None,
+                    throttle=None):
+        """Return the transactional bulk writer object.
+
+        Refer to :class:`arango.bulk.TransactionalBulkWriter` for more
+        information.
+
+        :param collection: the name of the collection
+        :type collection: str | unicode
+        :param method: the write method (``"insert"``, ``"update"``,
+            ``"replace"`` or ``"delete"``)
+        :type method: str | unicode
+        :param chunk_size: the number of documents written per transaction
+        :type chunk_size: int
+        :param sync: wait for each transaction to sync to disk on commit
+        :type sync: bool
+        :param timeout: timeout on the collection locks of each transaction
+        :type timeout: int
+        :param compensate: undo the committed chunks if a write fails
+        :type compensate: bool
+        :param callback: the callable invoked with the progress each time a
+            chunk is committed
+        :type callback: callable
+        :param throttle: the throttle to wait on before each chunk
+        :type throttle: arango.throttle.WriteThrottle
+        :returns: the transactional bulk writer object
+        :rtype: arango.bulk.TransactionalBulkWriter
+        """
+        return TransactionalBulkWriter(
+            connection=self._conn,
+            collection=collection,
+            method=method,
+            chunk_size=chunk_size,
+            sync=sync,
+            timeout=timeout,
+            compensate=compensate,
+            callback=callback,
+            throttle=throttle
+        )
+
+    def bulk_loader(self,
+                    collection,
+                    chunk_size=1000,
+                    min_chunk_size=100,
+                    max_chunk_size=100000,
+                    workers=2,
+                    max_workers=16,
+                    target_latency=1.0,
+                    backoff=0.5,
+                    retries=5,
+                    on_duplicate=None,
+                    sync=None,
+                    throttle=None):
+        """Return the adaptive bulk loader object.
+
+        Refer to :class:`arango.bulk.AdaptiveBulkLoader` for more information.
+
+        :param collection: the name of the collection
+        :type collection: str | unicode
+        :param chunk_size: the initial number of documents per chunk
+        :type chunk_size: int
+        :param min_chunk_size: the minimum number of documents per chunk
+        :type min_chunk_size: int
+        :param max_chunk_size: the maximum number of documents per chunk
+        :type max_chunk_size: int
+        :param workers: the initial number of concurrent chunks
+        :type workers: int
+        :param max_workers: the maximum number of concurrent chunks
+        :type max_workers: int
+        :param target_latency: the maximum number of seconds per chunk
+        :type target_latency: int | float
+        :param backoff: the factor by which the chunk size and concurrency
+            are multiplied when decreased
+        :type backoff: float
+        :param retries: the maximum number of times a chunk is retried
+        :type retries: int
+        :param on_duplicate: the action to take on unique key constraint
+            violations (``"error"``, ``"update"``, ``"replace"`` or
+            ``"ignore"``)
+        :type on_duplicate: str | unicode
+        :param sync: wait for the operations to sync to disk
+        :type sync: bool
+        :param throttle: the throttle to wait on before each chunk
+        :type throttle: arango.throttle.WriteThrottle
+        :returns: the adaptive bulk loader object
+        :rtype: arango.bulk.AdaptiveBulkLoader
+        """
+        return AdaptiveBulkLoader(
+            connection=self._conn,
+            collection=collection,
+            chunk_size=chunk_size,
+            min_chunk_size=min_chunk_size,
+            max_chunk_size=max_chunk_size,
+            workers=workers,
+            max_workers=max_workers,
+            target_latency=target_latency,
+            backoff=backoff,
+            retries=retries,
+            on_duplicate=on_duplicate,
+            sync=sync,
+            throttle=throttle
+        )
+
+    def write_throttle(self,
+                       interval=1.0,
+                       max_queued=64,
+                       max_latency=0.5,
+                       max_transactions=None,
+                       min_delay=0.01,
+                       max_delay=5.0,
+                       backoff=2.0):
+        """Return a write throttle reacting to the load of the server.
+
+        Refer to :class:`arango.throttle.WriteThrottle` for more information.
+
+        :param interval: the minimum number of seconds between two samples
+        :type interval: int | float
+        :param max_queued: the maximum number of requests queued on the server
+        :type max_queued: int
+        :param max_latency: the maximum average request time in seconds
+        :type max_latency: int | float
+        :param max_transactions: the maximum number of running transactions
+        :type max_transactions: int
+        :param min_delay: the delay in seconds imposed when the load first
+            exceeds a limit
+        :type min_delay: int | float
+        :param max_delay: the maximum delay in seconds
+        :type max_delay: int | float
+        :param backoff: the factor by which the delay grows and decays
+        :type backoff: int | float
+        :returns: the write throttle object
+        :rtype: arango.throttle.WriteThrottle
+        """
+        return WriteThrottle(
+            database=self,
+            interval=interval,
+            max_queued=max_queued,
+            max_latency=max_latency,
+            max_transactions=max_transactions,
+            min_delay=min_delay,
+            max_delay=max_delay,
+            backoff=backoff
+        )
+
+    def batch(self,
+              return_result=True,
+              commit_on_error=True,
+              max_requests=None,
+              max_bytes=None,
+              max_latency=None,
+              background=False,
+              sub_batches=1):
         """Return the batch request object.
 
         Refer to :class:`arango.batch.BatchExecution` for more information.
@@ -407,10 +597,56 @@ class Database(object):
         :type return_result: bool
         :param commit_on_error: commit when an exception is raised
             (this is only applicable when context managers are used)
+        :param max_requests: commit automatically once this many requests
+            are queued
+        :type max_requests: int
+        :param max_bytes: commit automatically once the queued requests reach
+            this size in bytes
+        :type max_bytes: int
+        :param max_latency: commit automatically once the oldest queued
+            request has been waiting for this many seconds
+        :type max_latency: int | float
+        :param background: enforce **max_latency** via a background thread
+        :type background: bool
+        :param sub_batches: the number of sub-batches committed concurrently
+        :type sub_batches: int
         :returns: the batch request object
         :rtype: arango.batch.BatchExecution
         """
-        return BatchExecution(self._conn, return_result, commit_on_error)
+        return BatchExecution(
+            connection=self._conn,
+            return_result=return_result,
+            commit_on_error=commit_on_error,
+            max_requests=max_requests,
+            max_bytes=max_bytes,
+            max_latency=max_latency,
+            background=background,
+            sub_batches=sub_batches
+        )
+
+    def dispatcher(self, max_delay=0.002, max_requests=100,
+                   return_future=False):
+        """Return a batch dispatcher which can be shared by multiple threads.
+
+        Refer to :class:`arango.dispatcher.BatchDispatcher` for more
+        information.
+
+        :param max_delay: the maximum number of seconds a request waits for
+            other requests to join its batch
+        :type max_delay: int | float
+        :param max_requests: the maximum number of requests in one batch
+        :type max_requests: int
+        :param return_future: return futures instead of results
+        :type return_future: bool
+        :returns: the batch dispatcher object
+        :rtype: arango.dispatcher.BatchDispatcher
+        """
+        return BatchDispatcher(
+            connection=self._conn,
+            max_delay=max_delay,
+            max_requests=max_requests,
+            return_future=return_future
+        )
 
     def transaction(self,
                     read=None,
@@ -445,6 +681,46 @@ class Database(object):
             commit_on_error=commit_on_error
         )
 
+    def begin_transaction(self,
+                          read=None,
+                          write=None,
+                          exclusive=None,
+                          sync=None,
+                          timeout=None,
+                          allow_implicit=None):
+        """Begin a stream transaction.
+
+        Refer to :class:`arango.transaction.StreamTransaction` for more
+        information.
+
+        :param read: the name(s) of the collection(s) to read from
+        :type read: str | unicode | list
+        :param write: the name(s) of the collection(s) to write to
+        :type write: str | unicode | list
+        :param exclusive: the name(s) of the collection(s) to write to
+            exclusively
+        :type exclusive: str | unicode | list
+        :param sync: wait for the transaction to sync to disk on commit
+        :type sync: bool
+        :param timeout: timeout on the collection locks
+        :type timeout: int
+        :param allow_implicit: allow reading from collections not declared
+        :type allow_implicit: bool
+        :returns: the stream transaction object
+        :rtype: arango.transaction.StreamTransaction
+        :raises arango.exceptions.TransactionBeginError: if the transaction
+            cannot be started
+        """
+        return StreamTransaction(
+            connection=self._conn,
+            read=read,
+            write=write,
+            exclusive=exclusive,
+            sync=sync,
+            timeout=timeout,
+            allow_implicit=allow_implicit
+        )
+
     def cluster(self, shard_id, transaction_id=None, timeout=None, sync=None):
         """Return the cluster round-trip test object.
 
@@ -818,6 +1094,82 @@ class Database(object):
                 raise GraphDeleteError(res)
         return not res.body['error']
 
+    ##################
+    # Dump & Restore #
+    ##################
+
+    def dump(self,
+             path,
+             collections=None,
+             workers=4,
+             shard_size=100000,
+             batch_size=1000):
+        """Dump collections and their graph definitions into a directory.
+
+        Refer to :func:`arango.dump.dump_database` for more information.
+
+        :param path: the directory to write the dump into
+        :type path: str | unicode
+        :param collections: the names of the collections to dump (default:
+            all non-system collections)
+        :type collections: [str | unicode]
+        :param workers: the number of collections exported in parallel
+        :type workers: int
+        :param shard_size: the maximum number of documents per shard file
+        :type shard_size: int
+        :param batch_size: the number of documents fetched per round trip
+        :type batch_size: int
+        :returns: the manifest of the dump
+        :rtype: dict
+        :raises arango.exceptions.ArangoError: if a collection cannot be
+            dumped
+        """
+        return dump_database(
+            database=self,
+            path=path,
+            collections=collections,
+            workers=workers,
+            shard_size=shard_size,
+            batch_size=batch_size
+        )
+
+    def restore(self,
+                path,
+                collections=None,
+                workers=4,
+                chunk_bytes=8388608,
+                on_duplicate=None):
+        """Restore collections and graph definitions from a dump directory.
+
+        Refer to :func:`arango.dump.restore_database` for more information.
+
+        :param path: the directory holding the dump
+        :type path: str | unicode
+        :param collections: the names of the collections to restore
+            (default: all collections in the dump)
+        :type collections: [str | unicode]
+        :param workers: the number of shard files imported in parallel
+        :type workers: int
+        :param chunk_bytes: the approximate number of bytes per import
+        :type chunk_bytes: int
+        :param on_duplicate: the action to take on unique key constraint
+            violations (``"error"``, ``"update"``, ``"replace"`` or
+            ``"ignore"``)
+        :type on_duplicate: str | unicode
+        :returns: the combined import result of each restored collection
+        :rtype: dict
+        :raises arango.exceptions.ArangoError: if a collection, index or
+            graph cannot be created, or the documents cannot be imported
+        """
+        return restore_database(
+            database=self,
+            path=path,
+            collections=collections,
+            workers=workers,
+            chunk_bytes=chunk_bytes,
+            on_duplicate=on_duplicate
+        )
+
     ###################
     # Task Management #
     ###################
@@ -1143,6 +1495,33 @@ class Database(object):
             return True
         raise UserRevokeAccessError(res)
 
+    #####################
+    # Cursor Management #
+    #####################
+
+    def open_cursors(self):
+        """Return the cursors of this database still open on the server.
+
+        Only the cursors created through this client are reported. A cursor
+        stays open until it is depleted or closed, and is closed automatically
+        when its Python object is garbage collected.
+
+        :returns: the details on the open cursors, each of which includes the
+            cursor ID and its age in seconds (oldest cursor first)
+        :rtype: [dict]
+        """
+        return cursor_registry.entries(database=self.name)
+
+    def close_cursors(self):
+        """Close the cursors of this database still open on the server.
+
+        Only the cursors created through this client are closed.
+
+        :returns: the number of cursors closed
+        :rtype: int
+        """
+        return cursor_registry.release_all(database=self.name)
+
     ########################
     # Async Job Management #
     ########################
@@ -1166,6 +1545,43 @@ class Database(object):
             raise AsyncJobListError(res)
         return res.body
 
+    def unfetched_async_jobs(self):
+        """Return the async jobs of this database with unfetched results.
+
+        Only the jobs issued through this client are reported. The results of
+        these jobs are stored on the server until they are fetched or cleared,
+        and are deleted automatically when the job objects are garbage
+        collected.
+
+        :returns: the details on the jobs, each of which includes the job ID
+            and its age in seconds (oldest job first)
+        :rtype: [dict]
+        """
+        return job_registry.entries(database=self.name)
+
+    def async_housekeeper(self, ttl=3600, interval=60, orphans_only=False):
+        """Return a housekeeper which deletes stale async job results.
+
+        Refer to :class:`arango.async.AsyncJobHousekeeper` for more
+        information.
+
+        :param ttl: the number of seconds after which job results are deleted
+        :type ttl: int | float
+        :param interval: the number of seconds between housekeeping rounds
+        :type interval: int | float
+        :param orphans_only: only delete the results of jobs issued via this
+            client
+        :type orphans_only: bool
+        :returns: the housekeeper (not started yet)
+        :rtype: arango.async.AsyncJobHousekeeper
+        """
+        return AsyncJobHousekeeper(
+            database=self,
+            ttl=ttl,
+            interval=interval,
+            orphans_only=orphans_only
+        )
+
     def clear_async_jobs(self, threshold=None):
         """Delete asynchronous job results from the server.
 
@@ -0,0 +1,218 @@
+from __future__ import absolute_import, unicode_literals
+
+from concurrent.futures import Future
+from threading import Lock, Thread
+from time import time
+
+from six.moves.queue import Empty, Queue
+
+from arango.aql import AQL
+from arango.collections import Collection
+from arango.connection import Connection
+from arango.exceptions import BatchExecuteError
+from arango.graph import Graph
+from arango.multipart import post_batch
+
+
+class BatchDispatcher(Connection):
+    """ArangoDB batch dispatcher shared by multiple threads.
+
+    API requests via this class are gathered from all threads over a short
+    window by a background thread, and sent together in a single HTTP call to
+    the ``/_api/batch`` endpoint of ArangoDB server. Each caller only waits for
+    the result of its own request, so the dispatcher can be used in place of a
+    regular database connection (e.g. by web workers issuing many small reads)
+    while reducing the number of round trips.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param max_delay: the maximum number of seconds a request waits for other
+        requests to join its batch
+    :type max_delay: int | float
+    :param max_requests: the maximum number of requests sent in one batch
+    :type max_requests: int
+    :param return_future: if ``True``, a :class:`concurrent.futures.Future`
+        which holds the result (or the error) of the request is returned each
+        time an API request is made, otherwise the caller is blocked until the
+        result is available
+    :type return_future: bool
+
+    .. note::
+        Method :func:`arango.dispatcher.BatchDispatcher.close` should be called
+        to stop the background thread (this is done automatically when context
+        managers are used). Requests made after the dispatcher is closed are
+        sent individually.
+    """
+
+    def __init__(self,
+                 connection,
+                 max_delay=0.002,
+                 max_requests=100,
+                 return_future=False):
+        super(BatchDispatcher, self).__init__(
+            protocol=connection.protocol,
+            host=connection.host,
+            port=connection.port,
+            username=connection.username,
+            password=connection.password,
+            http_client=connection.http_client,
+            database=connection.database,
+            enable_logging=connection.logging_enabled
+        )
+        self._max_delay = max_delay
+        self._max_requests = max(max_requests, 1)
+        self._return_future = return_future
+        self._queue = Queue()
+        self._lock = Lock()
+        self._closed = False
+        self._aql = AQL(self)
+        self._type = 'dispatcher'
+        self._thread = Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __repr__(self):
+        return '<ArangoDB batch dispatcher>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def handle_request(self, request, handler):
+        """Handle the incoming request and response handler.
+
+        :param request: the API request to be sent in the next batch
+        :type request: arango.request.Request
+        :param handler: the response handler
+        :type handler: callable
+        :returns: the result of the request, or its future if **return_future**
+            was set to ``True`` during initialization
+        :rtype: object | concurrent.futures.Future
+        :raises arango.exceptions.ArangoError: if the request fails (and
+            **return_future** was set to ``False``)
+        """
+        future = Future()
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._queue.put((request, handler, future))
+        if closed:
+            self._execute(request, handler, future)
+        if self._return_future:
+            return future
+        return future.result()
+
+    def close(self):
+        """Send the remaining requests and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Gather the queued requests into batches and send them.
+
+        This method is run by the background thread.
+        """
+        stopped = False
+        while not stopped:
+            item = self._queue.get()
+            if item is None:
+                break
+            items = [item]
+            deadline = time() + self._max_delay
+            while len(items) < self._max_requests:
+                timeout = deadline - time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                items.append(item)
+            if len(items) == 1:
+                self._execute(*items[0])
+            else:
+                self._send(items)
+
+    def _execute(self, request, handler, future):
+        """Send a single request and fulfil its future.
+
+        :param request: the API request
+        :type request: arango.request.Request
+        :param handler: the response handler
+        :type handler: callable
+        :param future: the future of the request
+        :type future: concurrent.futures.Future
+        """
+        try:
+            response = getattr(self, request.method)(**request.kwargs)
+            future.set_result(handler(response))
+        except Exception as error:
+            future.set_exception(error)
+
+    def _send(self, items):
+        """Send the requests in a single batch and fulfil their futures.
+
+        :param items: the API requests, response handlers and futures
+        :type items: [(arango.request.Request, callable,
+            concurrent.futures.Future)]
+        """
+        try:
+            parts = post_batch(self, [request for request, _, _ in items])
+        except Exception as error:
+            for _, _, future in items:
+                future.set_exception(error)
+            return
+
+        for (request, handler, future), part in zip(items, parts):
+            if part is None:
+                future.set_exception(BatchExecuteError(
+                    'missing response for batch request {} {}'.format(
+                        request.method, request.endpoint
+                    )
+                ))
+                continue
+            try:
+                future.set_result(handler(part.to_response(
+                    method=request.method,
+                    url=self._url_prefix + request.endpoint
+                )))
+            except Exception as error:
+                future.set_exception(error)
+
+    @property
+    def aql(self):
+        """Return the AQL object tailored for batch dispatching.
+
+        :returns: ArangoDB query object
+        :rtype: arango.query.AQL
+        """
+        return self._aql
+
+    def collection(self, name):
+        """Return the collection object tailored for batch dispatching.
+
+        :param name: the name of the collection
+        :type name: str | unicode
+        :returns: the collection object
+        :rtype: arango.collections.Collection
+        """
+        return Collection(self, name)
+
+    def graph(self, name):
+        """Return the graph object tailored for batch dispatching.
+
+        :param name: the name of the graph
+        :type name: str | unicode
+        :returns: the graph object
+        :rtype: arango.graph.Graph
+        """
+        return Graph(self, name)
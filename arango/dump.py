@@ -0,0 +1,342 @@
+from __future__ import absolute_import, unicode_literals
+
+import gzip
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+
+# The name of the file describing the contents of a dump
+MANIFEST = 'manifest.json'
+
+
+def _shard_name(collection, number):
+    """Return the file name of a shard of a collection.
+
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param number: the number of the shard
+    :type number: int
+    :returns: the file name of the shard
+    :rtype: str | unicode
+    """
+    return '{}-{:05d}.jsonl.gz'.format(collection, number)
+
+
+def _write_json(path, data):
+    """Write the data into a JSON file.
+
+    :param path: the path to the file
+    :type path: str | unicode
+    :param data: the data to write
+    :type data: dict
+    """
+    with io.open(path, 'wb') as f:
+        f.write(dumps(data, indent=2, sort_keys=True).encode('utf-8'))
+
+
+def _read_json(path):
+    """Read the data from a JSON file.
+
+    :param path: the path to the file
+    :type path: str | unicode
+    :returns: the data
+    :rtype: dict
+    """
+    with io.open(path, 'rb') as f:
+        return loads(f.read().decode('utf-8'))
+
+
+def dump_collection(collection, path, shard_size=100000, batch_size=1000):
+    """Export the documents of a collection into compressed JSONL shards.
+
+    :param collection: the collection object
+    :type collection: arango.collections.Collection
+    :param path: the directory to write the shards into
+    :type path: str | unicode
+    :param shard_size: the maximum number of documents per shard
+    :type shard_size: int
+    :param batch_size: the number of documents fetched per round trip
+    :type batch_size: int
+    :returns: the details of the collection in the dump, including its
+        properties and indexes, its shard files and the number of documents
+    :rtype: dict
+    :raises arango.exceptions.DocumentGetError: if the documents cannot be
+        exported
+    """
+    name = collection.name
+    shard_size = max(shard_size, 1)
+    details = {
+        'name': name,
+        'properties': collection.properties(),
+        'indexes': [
+            index for index in collection.indexes()
+            if index['type'] not in ('primary', 'edge')
+        ],
+        'shards': [],
+        'count': 0
+    }
+    shard = None
+    try:
+        for document in collection.export(batch_size=batch_size, flush=True):
+            if details['count'] % shard_size == 0:
+                if shard is not None:
+                    shard.close()
+                shard_name = _shard_name(name, len(details['shards']))
+                details['shards'].append(shard_name)
+                shard = gzip.open(os.path.join(path, shard_name), 'wb')
+            shard.write(dumps(document).encode('utf-8') + b'\n')
+            details['count'] += 1
+    finally:
+        if shard is not None:
+            shard.close()
+    return details
+
+
+def dump_database(database,
+                  path,
+                  collections=None,
+                  workers=4,
+                  shard_size=100000,
+                  batch_size=1000):
+    """Dump collections and their graph definitions into a directory.
+
+    Each collection is exported with its own server cursor, and the
+    collections are exported in parallel. The documents are written into
+    gzip-compressed JSON lines shards, and the collection properties, indexes
+    and the definitions of the graphs between the dumped collections are
+    recorded in a manifest file.
+
+    :param database: the database object
+    :type database: arango.database.Database
+    :param path: the directory to write the dump into (created if missing)
+    :type path: str | unicode
+    :param collections: the names of the collections to dump (default: all
+        non-system collections)
+    :type collections: [str | unicode]
+    :param workers: the number of collections exported in parallel
+    :type workers: int
+    :param shard_size: the maximum number of documents per shard
+    :type shard_size: int
+    :param batch_size: the number of documents fetched per round trip
+    :type batch_size: int
+    :returns: the manifest of the dump
+    :rtype: dict
+    :raises arango.exceptions.ArangoError: if a collection cannot be dumped
+    """
+    if collections is None:
+        collections = [
+            col['name'] for col in database.collections() if not col['system']
+        ]
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        dumped = list(executor.map(
+            lambda name: dump_collection(
+                collection=database.collection(name),
+                path=path,
+                shard_size=shard_size,
+                batch_size=batch_size
+            ),
+            collections
+        ))
+
+    graphs = []
+    for graph in database.graphs():
+        graph = database.graph(graph['name'])
+        edge_definitions = graph.edge_definitions()
+        orphan_collections = graph.orphan_collections()
+        names = set(orphan_collections)
+        for definition in edge_definitions:
+            names.add(definition['name'])
+            names.update(definition['from_collections'])
+            names.update(definition['to_collections'])
+        if names.issubset(collections):
+            graphs.append({
+                'name': graph.name,
+                'edge_definitions': edge_definitions,
+                'orphan_collections': orphan_collections
+            })
+
+    manifest = {'collections': dumped, 'graphs': graphs}
+    _write_json(os.path.join(path, MANIFEST), manifest)
+    return manifest
+
+
+def _create_collection(database, details):
+    """Create a dumped collection along with its indexes.
+
+    :param database: the database object
+    :type database: arango.database.Database
+    :param details: the details of the collection in the dump
+    :type details: dict
+    """
+    properties = details['properties']
+    collection = database.create_collection(
+        name=details['name'],
+        sync=properties.get('sync') or False,
+        compact=properties.get('compact', True) is not False,
+        journal_size=properties.get('journal_size'),
+        edge=properties.get('edge') or False,
+        volatile=properties.get('volatile') or False,
+        user_keys=properties.get('user_keys', True) is not False,
+        key_increment=properties.get('key_increment'),
+        key_offset=properties.get('key_offset'),
+        key_generator=properties.get('keygen') or 'traditional'
+    )
+    for index in details['indexes']:
+        index_type = index['type']
+        if index_type == 'hash':
+            collection.add_hash_index(
+                fields=index['fields'],
+                unique=index.get('unique'),
+                sparse=index.get('sparse'),
+                deduplicate=index.get('deduplicate')
+            )
+        elif index_type == 'skiplist':
+            collection.add_skiplist_index(
+                fields=index['fields'],
+                unique=index.get('unique'),
+                sparse=index.get('sparse'),
+                deduplicate=index.get('deduplicate')
+            )
+        elif index_type == 'persistent':
+            collection.add_persistent_index(
+                fields=index['fields'],
+                unique=index.get('unique'),
+                sparse=index.get('sparse')
+            )
+        elif index_type == 'fulltext':
+            collection.add_fulltext_index(
+                fields=index['fields'],
+                min_length=index.get('min_length')
+            )
+        elif index_type in ('geo', 'geo1', 'geo2'):
+            collection.add_geo_index(
+                fields=index['fields'],
+                ordered=index.get('geo_json')
+            )
+
+
+def restore_shard(collection, path, chunk_bytes=8388608, on_duplicate=None):
+    """Import the documents of a compressed JSONL shard into a collection.
+
+    The decompressed lines are sent as is to the bulk import API, in chunks of
+    roughly **chunk_bytes**.
+
+    :param collection: the collection object
+    :type collection: arango.collections.Collection
+    :param path: the path to the shard
+    :type path: str | unicode
+    :param chunk_bytes: the approximate number of bytes per import request
+    :type chunk_bytes: int
+    :param on_duplicate: the action to take on unique key constraint
+        violations (see :func:`arango.collections.Collection.import_bulk`)
+    :type on_duplicate: str | unicode
+    :returns: the combined result of the bulk imports
+    :rtype: dict
+    :raises arango.exceptions.DocumentInsertError: if the documents cannot
+        be imported
+    """
+    result = {'created': 0, 'errors': 0, 'empty': 0, 'updated': 0,
+              'ignored': 0}
+    with gzip.open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            # Extend the chunk up to the next line boundary
+            data += f.readline()
+            counts = collection.import_raw(
+                data,
+                halt_on_error=False,
+                details=False,
+                on_duplicate=on_duplicate
+            )
+            for field, count in counts.items():
+                if field in result:
+                    result[field] += count
+    return result
+
+
+def restore_database(database,
+                     path,
+                     collections=None,
+                     workers=4,
+                     chunk_bytes=8388608,
+                     on_duplicate=None):
+    """Restore collections and graph definitions from a dump directory.
+
+    Missing collections are created with their dumped properties and indexes
+    first, then the shards of all collections are imported in parallel, and
+    finally the missing graphs are created.
+
+    :param database: the database object
+    :type database: arango.database.Database
+    :param path: the directory holding the dump
+    :type path: str | unicode
+    :param collections: the names of the collections to restore (default:
+        all collections in the dump)
+    :type collections: [str | unicode]
+    :param workers: the number of shards imported in parallel
+    :type workers: int
+    :param chunk_bytes: the approximate number of bytes per import request
+    :type chunk_bytes: int
+    :param on_duplicate: the action to take on unique key constraint
+        violations (see :func:`arango.collections.Collection.import_bulk`)
+    :type on_duplicate: str | unicode
+    :returns: the combined import result of each restored collection
+    :rtype: dict
+    :raises arango.exceptions.ArangoError: if a collection, index or graph
+        cannot be created, or the documents cannot be imported
+    """
+    manifest = _read_json(os.path.join(path, MANIFEST))
+    dumped = [
+        details for details in manifest['collections']
+        if collections is None or details['name'] in collections
+    ]
+    existing = {col['name'] for col in database.collections()}
+    for details in dumped:
+        if details['name'] not in existing:
+            _create_collection(database, details)
+
+    shards = [
+        (details['name'], shard)
+        for details in dumped for shard in details['shards']
+    ]
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        shard_results = list(executor.map(
+            lambda item: restore_shard(
+                collection=database.collection(item[0]),
+                path=os.path.join(path, item[1]),
+                chunk_bytes=chunk_bytes,
+                on_duplicate=on_duplicate
+            ),
+            shards
+        ))
+
+    results = {
+        details['name']: {'created': 0, 'errors': 0, 'empty': 0,
+                          'updated': 0, 'ignored': 0}
+        for details in dumped
+    }
+    for (name, _), shard_result in zip(shards, shard_results):
+        for field, count in shard_result.items():
+            results[name][field] += count
+
+    restored = set(results)
+    existing_graphs = {graph['name'] for graph in database.graphs()}
+    for graph in manifest['graphs']:
+        if graph['name'] in existing_graphs:
+            continue
+        names = set(graph['orphan_collections'])
+        for definition in graph['edge_definitions']:
+            names.add(definition['name'])
+        if names.issubset(restored):
+            database.create_graph(
+                name=graph['name'],
+                edge_definitions=graph['edge_definitions'],
+                orphan_collections=graph['orphan_collections']
+            )
+    return results
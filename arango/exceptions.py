@@ -411,6 +411,22 @@ class TransactionError(ArangoError):
     """Failed to execute a transaction."""
 
 
+class TransactionBeginError(TransactionError):
+    """Failed to begin a stream transaction."""
+
+
+class TransactionStatusError(TransactionError):
+    """Failed to retrieve the status of a stream transaction."""
+
+
+class TransactionCommitError(TransactionError):
+    """Failed to commit a stream transaction."""
+
+
+class TransactionAbortError(TransactionError):
+    """Failed to abort a stream transaction."""
+
+
 ####################
 # Batch Exceptions #
 ####################
@@ -448,6 +464,25 @@ class AsyncJobResultError(ArangoError):
 class AsyncJobClearError(ArangoError):
     """Failed to delete the asynchronous job result from the server."""
 
+
+#############################
+# Write Pipeline Exceptions #
+#############################
+
+
+class WritePipelineFullError(ArangoError):
+    """Timed out waiting for room in the write pipeline."""
+
+
+#########################
+# Bulk Write Exceptions #
+#########################
+
+
+class BulkWriteError(ArangoError):
+    """Failed to write a chunk of documents in a bulk write."""
+
+
 #####################
 # Pregel Exceptions #
 #####################
@@ -0,0 +1,88 @@
+from __future__ import absolute_import, unicode_literals
+
+import csv
+import io
+from json import dumps
+
+from six import PY2
+
+from arango.exceptions import DocumentInsertError
+
+
+def check_connection(connection):
+    """Check that the connection sends its requests directly to the server.
+
+    File imports send the chunks right away and collect the report of each
+    one, which is not possible in batch, async or (JavaScript) transaction
+    executions.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :raises arango.exceptions.DocumentInsertError: if the connection belongs
+        to a batch, async or transaction execution
+    """
+    if connection.type not in ('standard', 'stream_transaction'):
+        raise DocumentInsertError(
+            'file imports are not supported in {} '
+            'executions'.format(connection.type)
+        )
+
+
+def _csv_rows(path):
+    """Yield the records of a CSV file as lists of unicode values.
+
+    :param path: the path to the UTF-8 encoded CSV file
+    :type path: str | unicode
+    :returns: the records, including the header
+    :rtype: collections.Iterator
+    """
+    if PY2:  # pragma: no cover
+        with open(path, 'rb') as f:
+            for row in csv.reader(f):
+                yield [value.decode('utf-8') for value in row]
+    else:
+        with io.open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.reader(f):
+                yield row
+
+
+def split_csv(path, chunk_bytes):
+    """Split a CSV file into bulk import bodies of JSON arrays.
+
+    The file is parsed with the :mod:`csv` module (quoted values, escaped
+    quotes and line breaks within quoted values are supported) one record at
+    a time. Each body holds the header followed by a chunk of records,
+    encoded as one JSON array of strings per line. Blank lines are skipped.
+
+    CSV carries no type information, so every value (numbers and booleans
+    included) is sent as a string and stored as such by the server.
+
+    :param path: the path to the UTF-8 encoded CSV file
+    :type path: str | unicode
+    :param chunk_bytes: the approximate number of bytes per body
+    :type chunk_bytes: int
+    :returns: the position of the first record of each chunk, the number
+        of records in it and the body to import
+    :rtype: collections.Iterator
+    """
+    rows = _csv_rows(path)
+    header = next((row for row in rows if row), None)
+    if header is None:
+        return
+    header = dumps(header).encode('utf-8')
+    lines = [header]
+    size = 0
+    offset = 0
+    for row in rows:
+        if not row:
+            continue
+        line = dumps(row).encode('utf-8')
+        lines.append(line)
+        size += len(line) + 1
+        if size >= chunk_bytes:
+            yield offset, len(lines) - 1, b'\n'.join(lines)
+            offset += len(lines) - 1
+            lines = [header]
+            size = 0
+    if len(lines) > 1:
+        yield offset, len(lines) - 1, b'\n'.join(lines)
@@ -0,0 +1,303 @@
+from __future__ import absolute_import, unicode_literals
+
+from requests.structures import CaseInsensitiveDict
+
+from arango.exceptions import BatchExecuteError
+from arango.response import Response
+from arango.utils import HTTP_OK
+
+# The boundary separating the parts of batch requests and responses
+BOUNDARY = 'XXXsubpartXXX'
+
+CRLF = b'\r\n'
+
+
+def encode_part(content_id, request, boundary=BOUNDARY):
+    """Encode an API request into a part of a multipart batch request.
+
+    :param content_id: the ID used to match the part with its response
+    :type content_id: int | str | unicode
+    :param request: the API request
+    :type request: arango.request.Request
+    :param boundary: the multipart boundary
+    :type boundary: str | unicode
+    :returns: the encoded part (including its leading delimiter)
+    :rtype: bytes
+    """
+    return ''.join([
+        '--{}\r\n'.format(boundary),
+        'Content-Type: application/x-arango-batchpart\r\n',
+        'Content-Id: {}\r\n\r\n'.format(content_id),
+        request.stringify(),
+        '\r\n'
+    ]).encode('utf-8')
+
+
+def encode_end(boundary=BOUNDARY):
+    """Return the closing delimiter of a multipart batch request.
+
+    :param boundary: the multipart boundary
+    :type boundary: str | unicode
+    :returns: the closing delimiter
+    :rtype: bytes
+    """
+    return '--{}--\r\n\r\n'.format(boundary).encode('utf-8')
+
+
+def _parse_headers(lines):
+    """Parse raw header lines into a case-insensitive dictionary.
+
+    :param lines: the raw header lines
+    :type lines: [bytes]
+    :returns: the headers
+    :rtype: requests.structures.CaseInsensitiveDict
+    """
+    headers = CaseInsensitiveDict()
+    for line in lines:
+        name, _, value = line.decode('utf-8').partition(':')
+        if name:
+            headers[name.strip()] = value.strip()
+    return headers
+
+
+class MultipartPart(object):
+    """Part of a multipart batch response.
+
+    Each part holds the HTTP response to one API request of the batch.
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    __slots__ = (
+        'content_id',
+        'headers',
+        'status_code',
+        'status_text',
+        'response_headers',
+        'body',
+    )
+
+    def __init__(self,
+                 content_id,
+                 headers,
+                 status_code,
+                 status_text,
+                 response_headers,
+                 body):
+        self.content_id = content_id
+        self.headers = headers
+        self.status_code = status_code
+        self.status_text = status_text
+        self.response_headers = response_headers
+        self.body = body
+
+    def __repr__(self):
+        return '<ArangoDB multipart part {}>'.format(self.content_id)
+
+    def to_response(self, method, url):
+        """Return the embedded response as an HTTP response object.
+
+        :param method: the HTTP method of the request
+        :type method: str | unicode
+        :param url: the URL of the request
+        :type url: str | unicode
+        :returns: the HTTP response
+        :rtype: arango.response.Response
+        """
+        return Response(
+            method=method,
+            url=url,
+            headers=self.response_headers,
+            http_code=self.status_code,
+            http_text=self.status_text,
+            body=self.body.decode('utf-8')
+        )
+
+
+class MultipartParser(object):
+    """Incremental byte-level parser for multipart batch responses.
+
+    Data is fed to the parser in chunks of any size, and each part is returned
+    as soon as it is complete. If the embedded response of a part declares its
+    ``Content-Length``, the body is sliced by length (so that bodies which
+    contain line breaks or the boundary itself are handled correctly),
+    otherwise it extends up to the next delimiter.
+
+    :param boundary: the multipart boundary
+    :type boundary: str | unicode
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    def __init__(self, boundary=BOUNDARY):
+        self._delimiter = '--{}'.format(boundary).encode('utf-8')
+        self._buffer = bytearray()
+        self._pos = 0
+        self._started = False
+        self._finished = False
+
+    def __repr__(self):
+        return '<ArangoDB multipart parser>'
+
+    def feed(self, data):
+        """Feed the next chunk of the response body to the parser.
+
+        :param data: the next chunk of the response body
+        :type data: bytes
+        :returns: the parts completed by the chunk
+        :rtype: [arango.multipart.MultipartPart]
+        :raises arango.exceptions.BatchExecuteError: if the data is malformed
+        """
+        if self._finished:
+            return []
+        self._buffer.extend(data)
+        parts = []
+        if not self._started and not self._skip_preamble():
+            return parts
+        while not self._finished:
+            part = self._next_part()
+            if part is None:
+                break
+            parts.append(part)
+        # Discard the data consumed so far
+        del self._buffer[:self._pos]
+        self._pos = 0
+        return parts
+
+    def close(self):
+        """Verify that the response body was consumed completely.
+
+        :raises arango.exceptions.BatchExecuteError: if the response body is
+            truncated
+        """
+        if not self._finished:
+            raise BatchExecuteError('truncated multipart batch response')
+
+    def _skip_preamble(self):
+        """Skip the data preceding the first delimiter.
+
+        :returns: whether the first delimiter was found
+        :rtype: bool
+        """
+        index = self._buffer.find(self._delimiter)
+        if index == -1:
+            return False
+        self._started = True
+        self._pos = index
+        return True
+
+    def _next_part(self):
+        """Parse the part following the delimiter at the current position.
+
+        :returns: the next part, or None if more data is needed
+        :rtype: arango.multipart.MultipartPart
+        """
+        buf = self._buffer
+        start = self._pos + len(self._delimiter)
+        if len(buf) < start + 2:
+            return None
+        if buf[start:start + 2] == b'--':
+            self._finished = True
+            self._pos = len(buf)
+            return None
+
+        # Locate the part headers and the embedded response headers
+        head_end = buf.find(CRLF + CRLF, start)
+        if head_end == -1:
+            return None
+        inner_start = head_end + 4
+        inner_end = buf.find(CRLF + CRLF, inner_start)
+        if inner_end == -1:
+            return None
+        headers = _parse_headers(bytes(buf[start:head_end]).split(CRLF))
+        inner_lines = bytes(buf[inner_start:inner_end]).split(CRLF)
+        response_headers = _parse_headers(inner_lines[1:])
+
+        # Locate the body by its length or by the next delimiter
+        body_start = inner_end + 4
+        length = response_headers.get('Content-Length')
+        if length is not None:
+            body_end = body_start + int(length)
+            next_pos = buf.find(self._delimiter, body_end)
+            if next_pos == -1:
+                return None
+        else:
+            next_pos = buf.find(self._delimiter, body_start)
+            if next_pos == -1:
+                return None
+            body_end = next_pos
+            if buf[body_end - 2:body_end] == CRLF:
+                body_end = max(body_end - 2, body_start)
+
+        status = inner_lines[0].decode('utf-8').split(' ', 2)
+        if len(status) < 2 or not status[1].isdigit():
+            raise BatchExecuteError(
+                'malformed multipart batch response part: {}'.format(
+                    inner_lines[0].decode('utf-8')
+                )
+            )
+        self._pos = next_pos
+        return MultipartPart(
+            content_id=headers.get('Content-Id'),
+            headers=headers,
+            status_code=int(status[1]),
+            status_text=status[2] if len(status) > 2 else '',
+            response_headers=response_headers,
+            body=bytes(buf[body_start:body_end])
+        )
+
+
+def parse_parts(data, boundary=BOUNDARY):
+    """Parse a complete multipart batch response.
+
+    :param data: the response body
+    :type data: bytes | str | unicode
+    :param boundary: the multipart boundary
+    :type boundary: str | unicode
+    :returns: the parts of the response
+    :rtype: [arango.multipart.MultipartPart]
+    :raises arango.exceptions.BatchExecuteError: if the response body is
+        malformed or truncated
+    """
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    parser = MultipartParser(boundary)
+    parts = parser.feed(data)
+    parser.close()
+    return parts
+
+
+def post_batch(connection, requests, boundary=BOUNDARY):
+    """Send the API requests in a single call to the batch API.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param requests: the API requests
+    :type requests: [arango.request.Request]
+    :param boundary: the multipart boundary
+    :type boundary: str | unicode
+    :returns: the parts of the response in the order of the requests (or
+        None for the requests which got no response)
+    :rtype: [arango.multipart.MultipartPart]
+    :raises arango.exceptions.BatchExecuteError: if the batch request cannot
+        be executed or its response is malformed
+    """
+    res = connection.post(
+        endpoint='/_api/batch',
+        headers={
+            'Content-Type': 'multipart/form-data; boundary={}'.format(boundary)
+        },
+        data=b''.join(
+            encode_part(content_id, request, boundary)
+            for content_id, request in enumerate(requests, start=1)
+        ) + encode_end(boundary)
+    )
+    if res.status_code not in HTTP_OK:
+        raise BatchExecuteError(res)
+    parts = {part.content_id: part for part in parse_parts(res.raw_body)}
+    return [
+        parts.get('{}'.format(content_id))
+        for content_id in range(1, len(requests) + 1)
+    ]
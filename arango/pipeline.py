@@ -0,0 +1,193 @@
+from __future__ import absolute_import, unicode_literals
+
+from threading import Condition
+from time import time
+
+from arango.async import AsyncExecution, AsyncJobPoller
+from arango.exceptions import WritePipelineFullError
+
+
+class WritePipeline(AsyncExecution):
+    """ArangoDB write pipeline with a bounded number of outstanding jobs.
+
+    API requests via this class are placed in the server-side task queue and
+    executed asynchronously as with :class:`arango.async.AsyncExecution`, but
+    at most **max_pending** of them are outstanding on the server at any time.
+    Once the limit is reached, producers are either blocked until earlier jobs
+    finish (policy ``"block"``), or their requests are discarded (policy
+    ``"drop"``). The jobs are tracked by a background poller, and their results
+    are discarded once they finish (failures are only counted).
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param max_pending: the maximum number of outstanding jobs
+    :type max_pending: int
+    :param policy: what to do with requests made while the pipeline is full,
+        which can be ``"block"`` (default) or ``"drop"``
+    :type policy: str | unicode
+    :param timeout: the maximum number of seconds producers are blocked for
+        (only applicable to policy ``"block"``), after which
+        :class:`arango.exceptions.WritePipelineFullError` is raised
+    :type timeout: int | float
+    :param poller: the poller tracking the outstanding jobs (if not set, a
+        poller dedicated to the pipeline is used)
+    :type poller: arango.async.AsyncJobPoller
+    """
+
+    def __init__(self,
+                 connection,
+                 max_pending=1000,
+                 policy='block',
+                 timeout=None,
+                 poller=None):
+        super(WritePipeline, self).__init__(connection, return_result=True)
+        if policy not in ('block', 'drop'):
+            raise ValueError('invalid policy: {}'.format(policy))
+        self._max_pending = max(max_pending, 1)
+        self._policy = policy
+        self._timeout = timeout
+        self._poller = poller or AsyncJobPoller(
+            min_interval=0.005,
+            max_interval=0.2
+        )
+        self._condition = Condition()
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def __repr__(self):
+        return '<ArangoDB write pipeline>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.flush()
+
+    def handle_request(self, request, handler):
+        """Handle the incoming request and response handler.
+
+        :param request: the API request to be placed in the server-side queue
+        :type request: arango.request.Request
+        :param handler: the response handler
+        :type handler: callable
+        :returns: whether the request was queued (``False`` if it was dropped)
+        :rtype: bool
+        :raises arango.exceptions.AsyncExecuteError: if the async request
+            cannot be executed
+        :raises arango.exceptions.WritePipelineFullError: if the pipeline
+            stays full past the timeout
+        """
+        if not self._acquire():
+            return False
+        try:
+            job = super(WritePipeline, self).handle_request(request, handler)
+        except Exception:
+            self._release(failed=False, completed=False)
+            raise
+        job.future(poller=self._poller).add_done_callback(self._job_done)
+        return True
+
+    def _acquire(self):
+        """Reserve room for a new job in the pipeline.
+
+        :returns: whether room was reserved (``False`` if the request must be
+            dropped)
+        :rtype: bool
+        :raises arango.exceptions.WritePipelineFullError: if the pipeline
+            stays full past the timeout
+        """
+        with self._condition:
+            if self._pending >= self._max_pending:
+                if self._policy == 'drop':
+                    self._dropped += 1
+                    return False
+                deadline = None
+                if self._timeout is not None:
+                    deadline = time() + self._timeout
+                while self._pending >= self._max_pending:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time()
+                        if remaining <= 0:
+                            raise WritePipelineFullError(
+                                'write pipeline full ({} jobs pending)'.format(
+                                    self._pending
+                                )
+                            )
+                    self._condition.wait(remaining)
+            self._pending += 1
+            self._submitted += 1
+            return True
+
+    def _release(self, failed, completed=True):
+        """Free the room taken by a job in the pipeline.
+
+        :param failed: whether the job failed
+        :type failed: bool
+        :param completed: whether the job was executed on the server
+        :type completed: bool
+        """
+        with self._condition:
+            self._pending -= 1
+            if completed:
+                self._completed += 1
+            else:
+                self._submitted -= 1
+            if failed:
+                self._failed += 1
+            self._condition.notify_all()
+
+    def _job_done(self, future):
+        """Account for a finished job.
+
+        :param future: the future of the job
+        :type future: concurrent.futures.Future
+        """
+        self._release(failed=future.exception() is not None)
+
+    def depth(self):
+        """Return the number of outstanding jobs.
+
+        :returns: the number of jobs queued or running on the server
+        :rtype: int
+        """
+        with self._condition:
+            return self._pending
+
+    def statistics(self):
+        """Return the statistics of the pipeline.
+
+        :returns: the number of outstanding (``"pending"``), submitted,
+            completed, failed and dropped jobs
+        :rtype: dict
+        """
+        with self._condition:
+            return {
+                'pending': self._pending,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'failed': self._failed,
+                'dropped': self._dropped
+            }
+
+    def flush(self, timeout=None):
+        """Wait for the outstanding jobs to finish.
+
+        :param timeout: the maximum number of seconds to wait
+        :type timeout: int | float
+        :returns: whether all outstanding jobs finished
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time() + timeout
+        with self._condition:
+            while self._pending > 0:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time()
+                    if remaining <= 0:
+                        return False
+                self._condition.wait(remaining)
+            return True
@@ -0,0 +1,154 @@
+from __future__ import absolute_import, unicode_literals
+
+import atexit
+import logging
+from threading import RLock
+from time import time
+from weakref import ref
+
+
+class ResourceRegistry(object):
+    """Registry of server-side resources held by client-side objects.
+
+    Each registered object (e.g. a cursor) is tracked through a weak
+    reference. If the object is garbage collected before its resource is
+    unregistered, the resource is released on the server right away. Any
+    resources still registered when the interpreter exits are released as
+    well.
+
+    :param name: the name of the resources (used in log messages)
+    :type name: str | unicode
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._lock = RLock()
+        self._entries = {}
+        self._logger = logging.getLogger('arango')
+        atexit.register(self.release_all)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self):
+        return '<ArangoDB registry of {} {}>'.format(len(self), self._name)
+
+    def register(self, obj, resource_id, release, **details):
+        """Start tracking the server-side resource held by the object.
+
+        :param obj: the object holding the resource
+        :type obj: object
+        :param resource_id: the ID of the resource on the server
+        :type resource_id: str | unicode
+        :param release: the callable (taking no arguments) which releases the
+            resource on the server, and which must not reference **obj**
+        :type release: callable
+        :param details: additional details reported for the resource
+        """
+        entry = dict(details, id=resource_id, created=time())
+        with self._lock:
+            self._entries[ref(obj, self._collect)] = (entry, release)
+
+    def unregister(self, obj):
+        """Stop tracking the resource held by the object.
+
+        This should be called once the resource is released or depleted.
+
+        :param obj: the object holding the resource
+        :type obj: object
+        :returns: whether the object was being tracked
+        :rtype: bool
+        """
+        with self._lock:
+            return self._entries.pop(ref(obj), None) is not None
+
+    def _collect(self, obj_ref):
+        """Release the resource of an object that was garbage collected."""
+        with self._lock:
+            item = self._entries.pop(obj_ref, None)
+        if item is not None:
+            entry, release = item
+            self._logger.debug('Releasing abandoned resource {} ({})'.format(
+                entry['id'], self._name
+            ))
+            self._release(entry, release)
+
+    def _release(self, entry, release):
+        """Release a resource, logging (but otherwise ignoring) failures."""
+        try:
+            release()
+        except Exception as error:
+            self._logger.warning(
+                'Failed to release resource {} ({}): {}'.format(
+                    entry['id'], self._name, error
+                )
+            )
+
+    def entries(self, **details):
+        """Return the details on the resources currently tracked.
+
+        :param details: if specified, only the resources with matching
+            details are returned
+        :returns: the resource details, each of which includes the resource
+            ID (``"id"``) and its age in seconds (``"age"``)
+        :rtype: [dict]
+        """
+        now = time()
+        with self._lock:
+            entries = [
+                entry for entry, _ in self._entries.values()
+                if all(entry.get(k) == v for k, v in details.items())
+            ]
+        return [
+            dict(entry, age=now - entry['created'])
+            for entry in sorted(entries, key=lambda e: e['created'])
+        ]
+
+    def release_all(self, **details):
+        """Release all resources still tracked.
+
+        :param details: if specified, only the resources with matching
+            details are released
+        :returns: the number of resources released
+        :rtype: int
+        """
+        return self._release_matching(details)
+
+    def release_expired(self, max_age, **details):
+        """Release the tracked resources older than the given age.
+
+        :param max_age: the maximum age of the resources in seconds
+        :type max_age: int | float
+        :param details: if specified, only the resources with matching
+            details are released
+        :returns: the number of resources released
+        :rtype: int
+        """
+        return self._release_matching(details, time() - max_age)
+
+    def _release_matching(self, details, created_before=None):
+        """Release the tracked resources matching the given criteria.
+
+        :param details: the details the resources must match
+        :type details: dict
+        :param created_before: if set, only the resources created before this
+            unix timestamp are released
+        :type created_before: int | float
+        :returns: the number of resources released
+        :rtype: int
+        """
+        with self._lock:
+            items = []
+            for obj_ref, (entry, release) in list(self._entries.items()):
+                if created_before is not None:
+                    if entry['created'] >= created_before:
+                        continue
+                if all(entry.get(k) == v for k, v in details.items()):
+                    items.append(self._entries.pop(obj_ref))
+        for entry, release in items:
+            self._release(entry, release)
+        return len(items)
@@ -1,8 +1,8 @@
 from __future__ import absolute_import, unicode_literals
 
-from json import dumps
+from six import binary_type, moves
 
-from six import moves
+from arango.utils import sanitize
 
 
 class Request(object):
@@ -19,6 +19,7 @@ class Request(object):
         'params',
         'data',
         'command',
+        'command_args',
     )
 
     def __init__(self,
@@ -27,13 +28,15 @@ class Request(object):
                  headers=None,
                  params=None,
                  data=None,
-                 command=None):
+                 command=None,
+                 command_args=None):
         self.method = method
         self.endpoint = endpoint
         self.headers = headers or {}
         self.params = params or {}
         self.data = data
         self.command = command
+        self.command_args = command_args
 
     @property
     def kwargs(self):
@@ -55,5 +58,9 @@ class Request(object):
                     key=key, value=value
                 )
         if self.data is not None:
-            request_string += "\r\n\r\n{}".format(dumps(self.data))
+            # Encoded bodies (e.g. raw imports) are sent as is, like over HTTP
+            data = sanitize(self.data)
+            if isinstance(data, binary_type):
+                data = data.decode('utf-8')
+            request_string += "\r\n\r\n{}".format(data)
         return request_string
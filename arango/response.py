@@ -31,9 +31,8 @@ class Response(object):
         'status_code',
         'status_text',
         'raw_body',
-        'body',
-        'error_code',
-        'error_message'
+        '_body',
+        '_decoded'
     )
 
     def __init__(self,
@@ -49,16 +48,50 @@ class Response(object):
         self.status_code = http_code
         self.status_text = http_text
         self.raw_body = body
-        try:
-            self.body = json.loads(body)
-        except (ValueError, TypeError):
-            self.body = body
-        if self.body and isinstance(self.body, dict):
-            self.error_code = self.body.get('errorNum')
-            self.error_message = self.body.get('errorMessage')
-        else:
-            self.error_code = None
-            self.error_message = None
+        self._body = None
+        self._decoded = False
+
+    @property
+    def body(self):
+        """Return the HTTP response body, decoded from JSON if possible.
+
+        The body is decoded on first access only, so that callers which
+        process :attr:`raw_body` themselves do not pay for it.
+
+        :returns: the decoded response body
+        :rtype: dict | list | str | unicode
+        """
+        if not self._decoded:
+            try:
+                self._body = json.loads(self.raw_body)
+            except (ValueError, TypeError):
+                self._body = self.raw_body
+            self._decoded = True
+        return self._body
+
+    @property
+    def error_code(self):
+        """Return the ArangoDB error code of the response.
+
+        :returns: the error code, or None if the body holds none
+        :rtype: int | None
+        """
+        body = self.body
+        if body and isinstance(body, dict):
+            return body.get('errorNum')
+        return None
+
+    @property
+    def error_message(self):
+        """Return the ArangoDB error message of the response.
+
+        :returns: the error message, or None if the body holds none
+        :rtype: str | unicode | None
+        """
+        body = self.body
+        if body and isinstance(body, dict):
+            return body.get('errorMessage')
+        return None
 
     def update_body(self, new_body):
         return Response(
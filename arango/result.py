@@ -0,0 +1,256 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import re
+from array import array
+
+from six import binary_type, text_type
+
+from arango.exceptions import DocumentRevisionError
+
+_OPTIONAL_FIELDS = (('old_revs', '_oldRev'), ('new', 'new'), ('old', 'old'))
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_results(response):
+    """Decode the per-document results of a bulk response one at a time.
+
+    The raw JSON array is walked element by element so that only the
+    document being processed is held as a dictionary, instead of decoding
+    the whole body up front. Bodies which are not a raw JSON string (e.g.
+    already decoded by a custom HTTP client) are iterated as is.
+
+    :param response: the HTTP response of the bulk operation
+    :type response: arango.response.Response
+    :returns: the result of each document, in order
+    :rtype: collections.Iterable
+    """
+    text = response.raw_body
+    if isinstance(text, binary_type):
+        text = text.decode('utf-8')
+    if not isinstance(text, text_type):
+        for result in response.body:
+            yield result
+        return
+
+    decoder = json.JSONDecoder()
+    index = _WHITESPACE.match(text, 0).end()
+    if text[index:index + 1] != '[':
+        raise ValueError('bulk response body is not a JSON array')
+    index = _WHITESPACE.match(text, index + 1).end()
+    if text[index:index + 1] == ']':
+        return
+    while True:
+        result, index = decoder.raw_decode(text, index)
+        yield result
+        index = _WHITESPACE.match(text, index).end()
+        if text[index:index + 1] == ']':
+            return
+        if text[index:index + 1] != ',':
+            raise ValueError('bulk response body is not a JSON array')
+        index = _WHITESPACE.match(text, index + 1).end()
+
+
+class BulkResult(object):
+    """Compact result of a bulk document operation.
+
+    Instead of a dictionary (or an exception) per document, the outcome of
+    each document is stored in parallel arrays: its key, its revision, its
+    previous revision (updates and replaces only) and its error code (``0`` on
+    success). Exceptions for the failed documents are only built when they are
+    accessed.
+
+    Indexing or iterating the result yields the same entries as the
+    non-compact results (a dictionary or an exception per document), which
+    are built on the fly.
+
+    :param response: the HTTP response of the bulk operation
+    :type response: arango.response.Response
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param error_class: the exception class for failed documents (revision
+        mismatches are always reported as
+        :class:`arango.exceptions.DocumentRevisionError`)
+    :type error_class: type
+
+    .. note::
+        The response body is decoded one document at a time straight into the
+        arrays, so the per-document dictionaries are never all held at once.
+        Keys and revisions are kept as lists of strings.
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    __slots__ = (
+        'keys',
+        'revs',
+        'old_revs',
+        'error_codes',
+        'new',
+        'old',
+        '_collection',
+        '_error_class',
+        '_syncs',
+        '_errors',
+    )
+
+    def __init__(self, response=None, collection=None, error_class=None):
+        self.keys = []
+        self.revs = []
+        self.old_revs = None
+        self.error_codes = array('l')
+        self.new = None
+        self.old = None
+        self._collection = collection
+        self._error_class = error_class
+        self._syncs = array('b')
+        self._errors = {}
+        if response is not None:
+            self._load(response)
+
+    def __repr__(self):
+        return '<ArangoDB bulk result ({} documents, {} errors)>'.format(
+            len(self), len(self._errors)
+        )
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('bulk result index out of range')
+
+        if index in self._errors:
+            return self._build_error(*self._errors[index])
+
+        key = self.keys[index]
+        result = {
+            '_id': '{}/{}'.format(self._collection, key),
+            '_key': key,
+            '_rev': self.revs[index],
+            'sync': bool(self._syncs[index])
+        }
+        if self.old_revs is not None:
+            result['_old_rev'] = self.old_revs[index]
+        if self.new is not None:
+            result['new'] = self.new[index]
+        if self.old is not None:
+            result['old'] = self.old[index]
+        return result
+
+    def _load(self, response):
+        """Load the per-document results from the HTTP response.
+
+        :param response: the HTTP response of the bulk operation
+        :type response: arango.response.Response
+        """
+        # Keep the response details without the (potentially large) body
+        template = response.update_body(None)
+        sync = response.status_code != 202
+        for index, result in enumerate(_iter_results(response)):
+            if '_id' in result:
+                self.keys.append(result['_key'])
+                self.revs.append(result['_rev'])
+                self.error_codes.append(0)
+            else:
+                self.keys.append(None)
+                self.revs.append(None)
+                self.error_codes.append(result.get('errorNum') or -1)
+                self._errors[index] = (template, result, self._error_class)
+            self._syncs.append(sync)
+            for name, field in _OPTIONAL_FIELDS:
+                values = getattr(self, name)
+                if values is None:
+                    if field not in result:
+                        continue
+                    # Only create the array once a document carries the field
+                    values = [None] * index
+                    setattr(self, name, values)
+                values.append(result.get(field))
+
+    @staticmethod
+    def _build_error(template, result, error_class):
+        """Build the exception of a failed document.
+
+        :param template: the HTTP response without its body
+        :type template: arango.response.Response
+        :param result: the error details of the document
+        :type result: dict
+        :param error_class: the exception class
+        :type error_class: type
+        :returns: the exception
+        :rtype: arango.exceptions.ArangoError
+        """
+        if result.get('errorNum') == 1200:
+            error_class = DocumentRevisionError
+        return error_class(template.update_body(result))
+
+    @property
+    def sync(self):
+        """Return whether all operations were synced to disk.
+
+        :returns: whether all operations were synced to disk
+        :rtype: bool
+        """
+        return all(self._syncs)
+
+    @property
+    def error_count(self):
+        """Return the number of failed documents.
+
+        :returns: the number of failed documents
+        :rtype: int
+        """
+        return len(self._errors)
+
+    def errors(self):
+        """Return the exceptions of the failed documents.
+
+        :returns: the positions of the failed documents and their exceptions
+        :rtype: [(int, arango.exceptions.ArangoError)]
+        """
+        return [
+            (index, self._build_error(*self._errors[index]))
+            for index in sorted(self._errors)
+        ]
+
+    @classmethod
+    def merge(cls, results):
+        """Concatenate the results of consecutive bulk operations.
+
+        :param results: the results to concatenate, in order
+        :type results: [arango.result.BulkResult]
+        :returns: the merged result
+        :rtype: arango.result.BulkResult
+        """
+        merged = cls()
+        for result in results:
+            offset = len(merged)
+            merged._collection = result._collection
+            merged._error_class = result._error_class
+            for name in ('old_revs', 'new', 'old'):
+                values = getattr(result, name)
+                current = getattr(merged, name)
+                if values is None and current is None:
+                    continue
+                if current is None:
+                    current = [None] * offset
+                    setattr(merged, name, current)
+                current.extend(values or [None] * len(result))
+            merged.keys.extend(result.keys)
+            merged.revs.extend(result.revs)
+            merged.error_codes.extend(result.error_codes)
+            merged._syncs.extend(result._syncs)
+            for index, error in result._errors.items():
+                merged._errors[offset + index] = error
+        return merged
@@ -0,0 +1,606 @@
+from __future__ import absolute_import, unicode_literals
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from threading import Event, Thread
+
+from six.moves.queue import Full, Queue
+
+from arango.cursor import Cursor
+from arango.exceptions import DocumentGetError
+from arango.utils import HTTP_OK
+
+
+def check_connection(connection):
+    """Check that the connection sends its requests directly to the server.
+
+    The scans and the paginations send their requests right away and build
+    on the response of each one, which is not possible in batch, async or
+    (JavaScript) transaction executions.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :raises arango.exceptions.DocumentGetError: if the connection belongs to
+        a batch, async or transaction execution
+    """
+    if connection.type not in ('standard', 'stream_transaction'):
+        raise DocumentGetError(
+            'scans and paginations are not supported in {} '
+            'executions'.format(connection.type)
+        )
+
+
+def fetch_page(connection,
+               collection,
+               limit,
+               after=None,
+               sort_field='_key',
+               descending=False,
+               filters=None,
+               lower_key=None,
+               upper_key=None):
+    """Fetch a page of documents using keyset pagination.
+
+    Instead of skipping over the previous pages on the server, the page
+    starts right after the given position in the sort order, so fetching
+    any page costs the same as fetching the first one.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param limit: the max number of documents to fetch
+    :type limit: int
+    :param after: the position to start after, which is a ``(key,)`` tuple
+        if **sort_field** is ``"_key"``, or a ``(value, key)`` tuple holding
+        the sort field value and the key of the last document otherwise
+    :type after: tuple
+    :param sort_field: the document field to sort by, which should be
+        covered by a sorted index (e.g. skiplist) for efficient lookups
+    :type sort_field: str | unicode
+    :param descending: sort the documents in descending order
+    :type descending: bool
+    :param filters: the document fields and values to match exactly
+    :type filters: dict
+    :param lower_key: if given, only documents with keys greater than or
+        equal to this value are fetched
+    :type lower_key: str | unicode
+    :param upper_key: if given, only documents with keys less than this value
+        are fetched
+    :type upper_key: str | unicode
+    :returns: the page of documents
+    :rtype: list
+    :raises arango.exceptions.DocumentGetError: if the page of documents
+        cannot be fetched from the collection
+    """
+    bind_vars = {'@collection': collection, 'limit': limit}
+    query_filters = []
+    for index, (field, value) in enumerate(sorted((filters or {}).items())):
+        query_filters.append(
+            'FILTER doc.@field{0} == @value{0}'.format(index)
+        )
+        bind_vars['field{}'.format(index)] = field
+        bind_vars['value{}'.format(index)] = value
+    if lower_key is not None:
+        query_filters.append('FILTER doc._key >= @lower_key')
+        bind_vars['lower_key'] = lower_key
+    if upper_key is not None:
+        query_filters.append('FILTER doc._key < @upper_key')
+        bind_vars['upper_key'] = upper_key
+
+    order = 'DESC' if descending else 'ASC'
+    op = '<' if descending else '>'
+    if sort_field == '_key':
+        sort = 'doc._key {}'.format(order)
+        if after is not None:
+            query_filters.append('FILTER doc._key {} @last_key'.format(op))
+            bind_vars['last_key'] = after[0]
+    else:
+        # The document key breaks the ties between equal sort field values
+        sort = 'doc.@sort_field {0}, doc._key {0}'.format(order)
+        bind_vars['sort_field'] = sort_field
+        if after is not None:
+            query_filters.append(
+                'FILTER doc.@sort_field {}= @last_value'.format(op)
+            )
+            query_filters.append(
+                'FILTER doc.@sort_field != @last_value '
+                '|| doc._key {} @last_key'.format(op)
+            )
+            bind_vars['last_value'], bind_vars['last_key'] = after
+
+    res = connection.post(
+        endpoint='/_api/cursor',
+        data={
+            'query': """
+            FOR doc IN @@collection
+                {}
+                SORT {}
+                LIMIT @limit
+                RETURN doc
+            """.format('\n                '.join(query_filters), sort),
+            'bindVars': bind_vars,
+            'batchSize': limit
+        }
+    )
+    if res.status_code not in HTTP_OK:
+        raise DocumentGetError(res)
+    if res.body.get('hasMore'):  # pragma: no cover
+        return list(Cursor(connection, res.body))
+    return res.body['result']
+
+
+class Scan(object):
+    """Resumable scan through the documents of a collection.
+
+    Documents are fetched in ``"_key"`` order one page at a time, where each
+    page is a separate AQL query picking up after the last key seen (keyset
+    pagination). No server cursor is kept open between pages, so the scan is
+    not affected by cursor TTL expiry and can be resumed from a checkpoint
+    without rescanning the documents already returned.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param batch_size: the max number of documents fetched per page
+    :type batch_size: int
+    :param checkpoint: the checkpoint to resume the scan from, as returned by
+        :func:`arango.scan.Scan.checkpoint`
+    :type checkpoint: dict
+    :param callback: the callable invoked with the latest checkpoint each
+        time a page of documents is fully consumed (e.g. to persist it)
+    :type callback: callable
+    :param lower_key: if given, only documents with keys greater than or
+        equal to this value are scanned
+    :type lower_key: str | unicode
+    :param upper_key: if given, only documents with keys less than this value
+        are scanned
+    :type upper_key: str | unicode
+    :raises arango.exceptions.DocumentGetError: if a page of documents cannot
+        be fetched from the collection
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    def __init__(self,
+                 connection,
+                 collection,
+                 batch_size=1000,
+                 checkpoint=None,
+                 callback=None,
+                 lower_key=None,
+                 upper_key=None):
+        self._conn = connection
+        self._collection = collection
+        self._batch_size = batch_size
+        self._callback = callback
+        self._lower_key = lower_key
+        self._upper_key = upper_key
+        self._last_key = None
+        self._count = 0
+        if checkpoint is not None:
+            self._last_key = checkpoint.get('last_key')
+            self._count = checkpoint.get('count', 0)
+        self._batch = deque()
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def __repr__(self):
+        return '<ArangoDB scan on "{}">'.format(self._collection)
+
+    @property
+    def collection(self):
+        """Return the name of the collection being scanned.
+
+        :returns: the name of the collection
+        :rtype: str | unicode
+        """
+        return self._collection
+
+    def count(self):
+        """Return the number of documents returned so far.
+
+        The count includes the documents returned before the checkpoint the
+        scan was resumed from, if any.
+
+        :returns: the number of documents returned
+        :rtype: int
+        """
+        return self._count
+
+    def checkpoint(self):
+        """Return the checkpoint of the scan.
+
+        The checkpoint points right after the last document returned, and
+        can be persisted (it is JSON serializable) and passed back via the
+        **checkpoint** parameter of :func:`arango.collections.Collection.scan`
+        to resume the scan.
+
+        :returns: the checkpoint
+        :rtype: dict
+        """
+        return {'last_key': self._last_key, 'count': self._count}
+
+    def _fetch(self):
+        """Fetch the next page of documents after the last key seen.
+
+        :returns: the next page of documents
+        :rtype: list
+        :raises arango.exceptions.DocumentGetError: if the page of documents
+            cannot be fetched from the collection
+        """
+        return fetch_page(
+            connection=self._conn,
+            collection=self._collection,
+            limit=self._batch_size,
+            after=None if self._last_key is None else (self._last_key,),
+            lower_key=self._lower_key,
+            upper_key=self._upper_key
+        )
+
+    def _load(self):
+        """Load the next page of documents if the current one is consumed.
+
+        :returns: whether there are documents left in the scan
+        :rtype: bool
+        :raises arango.exceptions.DocumentGetError: if the page of documents
+            cannot be fetched from the collection
+        """
+        if not self._batch and not self._done:
+            # The last key is only advanced as documents are returned, so
+            # a failed fetch can simply be retried by calling this again
+            self._batch = deque(self._fetch())
+            if len(self._batch) < self._batch_size:
+                self._done = True
+        return bool(self._batch)
+
+    def _advance(self, document):
+        """Move the checkpoint of the scan past the given document."""
+        self._last_key = document['_key']
+        self._count += 1
+        if not self._batch and self._callback is not None:
+            self._callback(self.checkpoint())
+
+    def next(self):
+        """Return the next document in the scan.
+
+        :returns: the next document
+        :rtype: dict
+        :raises: StopIteration, DocumentGetError
+        """
+        if not self._load():
+            raise StopIteration
+        document = self._batch.popleft()
+        self._advance(document)
+        return document
+
+    def next_batch(self):
+        """Return the remaining documents in the current page of the scan.
+
+        If the current page is already consumed, the next page is fetched.
+
+        :returns: the next documents, or an empty list if the scan is over
+        :rtype: list
+        :raises arango.exceptions.DocumentGetError: if the page of documents
+            cannot be fetched from the collection
+        """
+        if not self._load():
+            return []
+        documents = list(self._batch)
+        self._batch.clear()
+        self._count += len(documents) - 1
+        self._advance(documents[-1])
+        return documents
+
+
+class Page(object):
+    """Page of documents returned by keyset pagination.
+
+    :param documents: the documents in the page
+    :type documents: list
+    :param next_token: the token for the next page, or ``None`` if this is
+        the last page
+    :type next_token: str | unicode
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    def __init__(self, documents, next_token=None):
+        self._documents = documents
+        self._next_token = next_token
+
+    def __iter__(self):
+        return iter(self._documents)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __repr__(self):
+        return '<ArangoDB page of {} documents>'.format(len(self))
+
+    @property
+    def documents(self):
+        """Return the documents in the page.
+
+        :returns: the documents in the page
+        :rtype: list
+        """
+        return self._documents
+
+    @property
+    def next_token(self):
+        """Return the token for the next page.
+
+        :returns: the token for the next page, or ``None`` if this is the
+            last page
+        :rtype: str | unicode
+        """
+        return self._next_token
+
+    def has_more(self):
+        """Indicates whether more pages are available.
+
+        :returns: whether more pages are available
+        :rtype: bool
+        """
+        return self._next_token is not None
+
+
+def encode_page_token(position):
+    """Encode the position in a sort order into an opaque page token.
+
+    :param position: the position as passed to :func:`fetch_page`
+    :type position: tuple
+    :returns: the page token
+    :rtype: str | unicode
+    """
+    return urlsafe_b64encode(dumps(list(position)).encode('utf-8')).decode()
+
+
+def decode_page_token(token, sort_field='_key'):
+    """Decode the page token into a position in a sort order.
+
+    :param token: the page token
+    :type token: str | unicode
+    :param sort_field: the document field the pages are sorted by
+    :type sort_field: str | unicode
+    :returns: the position as passed to :func:`fetch_page`
+    :rtype: tuple
+    :raises arango.exceptions.DocumentGetError: if the token is invalid
+    """
+    try:
+        position = loads(urlsafe_b64decode(token.encode()).decode('utf-8'))
+    except (TypeError, ValueError):
+        raise DocumentGetError('Invalid page token {}'.format(token))
+    if (
+        not isinstance(position, list) or
+        len(position) != (1 if sort_field == '_key' else 2)
+    ):
+        raise DocumentGetError('Invalid page token {}'.format(token))
+    return tuple(position)
+
+
+class ParallelScan(object):
+    """Scan through the documents of a collection with parallel cursors.
+
+    The key space of the collection is split into partitions of roughly
+    equal size, and each partition is scanned separately (see
+    :class:`arango.scan.Scan`) in a pool of worker threads. The documents
+    from all partitions are merged into a single iterator, or handed over
+    to a sink callable as they arrive.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param collection: the name of the collection
+    :type collection: str | unicode
+    :param partitions: the number of key ranges to split the collection into
+    :type partitions: int
+    :param workers: the max number of partitions scanned concurrently
+        (default: the number of partitions)
+    :type workers: int
+    :param batch_size: the max number of documents fetched per page
+    :type batch_size: int
+    :param buffer_size: the max number of pages buffered for the iterator
+        before the workers are made to wait for the consumer
+    :type buffer_size: int
+
+    .. note::
+        The documents are returned in ``"_key"`` order within each partition,
+        but the partitions are interleaved.
+
+    .. note::
+        This class is designed to be instantiated internally only.
+    """
+
+    def __init__(self,
+                 connection,
+                 collection,
+                 partitions=4,
+                 workers=None,
+                 batch_size=1000,
+                 buffer_size=None):
+        self._conn = connection
+        self._collection = collection
+        self._partitions = partitions
+        self._workers = workers or partitions
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size or 2 * self._workers
+        self._ranges = None
+
+    def __iter__(self):
+        return self._merge()
+
+    def __repr__(self):
+        return '<ArangoDB parallel scan on "{}">'.format(self._collection)
+
+    @property
+    def collection(self):
+        """Return the name of the collection being scanned.
+
+        :returns: the name of the collection
+        :rtype: str | unicode
+        """
+        return self._collection
+
+    def ranges(self):
+        """Return the key ranges of the partitions.
+
+        The boundaries are computed on the server (once per scan object) by
+        picking every N-th key of the collection in sorted order, with one
+        query per boundary. Each query skips over the keys before its
+        boundary in the primary index (without reading the documents), so
+        computing the boundaries walks the index about ``partitions / 2``
+        times in total.
+
+        :returns: the list of ``(lower_key, upper_key)`` tuples, where the
+            lower key is inclusive, the upper key is exclusive and ``None``
+            stands for an open end
+        :rtype: [tuple]
+        :raises arango.exceptions.DocumentGetError: if the key ranges cannot
+            be computed
+        """
+        if self._ranges is not None:
+            return self._ranges
+
+        boundaries = []
+        if self._partitions > 1:
+            res = self._conn.get(
+                '/_api/collection/{}/count'.format(self._collection)
+            )
+            if res.status_code not in HTTP_OK:
+                raise DocumentGetError(res)
+            step = max(-(-res.body['count'] // self._partitions), 1)
+            for index in range(1, self._partitions):
+                # LIMIT only accepts constants and bind parameters, so each
+                # boundary is looked up with a separate query, which skips
+                # over the preceding keys in the primary index
+                res = self._conn.post(
+                    endpoint='/_api/cursor',
+                    data={
+                        'query': """
+                        FOR doc IN @@collection
+                            SORT doc._key
+                            LIMIT @offset, 1
+                            RETURN doc._key
+                        """,
+                        'bindVars': {
+                            '@collection': self._collection,
+                            'offset': index * step
+                        }
+                    }
+                )
+                if res.status_code not in HTTP_OK:
+                    raise DocumentGetError(res)
+                if not res.body['result']:
+                    break
+                boundaries.append(res.body['result'][0])
+            boundaries = sorted(set(boundaries))
+
+        bounds = [None] + boundaries + [None]
+        self._ranges = list(zip(bounds[:-1], bounds[1:]))
+        return self._ranges
+
+    def _scan_partition(self, key_range, sink, stopped):
+        """Scan a partition and pass its pages of documents to the sink.
+
+        :returns: the number of documents scanned
+        :rtype: int
+        """
+        scan = Scan(
+            connection=self._conn,
+            collection=self._collection,
+            batch_size=self._batch_size,
+            lower_key=key_range[0],
+            upper_key=key_range[1]
+        )
+        documents = scan.next_batch()
+        while documents and not stopped():
+            sink(documents)
+            documents = scan.next_batch()
+        return scan.count()
+
+    def _run(self, sink, stopped):
+        """Scan the partitions in the worker threads until done or stopped.
+
+        :returns: the total number of documents scanned
+        :rtype: int
+        """
+        failed = Event()
+
+        def partition_stopped():
+            return failed.is_set() or stopped()
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [
+                executor.submit(
+                    self._scan_partition,
+                    key_range,
+                    sink,
+                    partition_stopped
+                )
+                for key_range in self.ranges()
+            ]
+            try:
+                return sum(future.result() for future in futures)
+            except Exception:
+                # Do not let the other partitions run to the end for nothing
+                failed.set()
+                raise
+
+    def run(self, sink):
+        """Scan the collection and pass each page of documents to the sink.
+
+        :param sink: the callable invoked with each page (list) of documents,
+            which is called from the worker threads and must be thread-safe
+        :type sink: callable
+        :returns: the total number of documents scanned
+        :rtype: int
+        :raises arango.exceptions.DocumentGetError: if the documents cannot be
+            fetched from the collection
+        """
+        return self._run(sink, lambda: False)
+
+    def _merge(self):
+        """Run the scan in the background and yield the merged documents."""
+        pages = Queue(maxsize=self._buffer_size)
+        closed = Event()
+
+        def sink(item):
+            while not closed.is_set():
+                try:
+                    return pages.put(item, timeout=0.1)
+                except Full:
+                    continue
+
+        def run():
+            try:
+                self._run(sink, closed.is_set)
+            except Exception as error:
+                sink(error)
+            else:
+                sink(None)
+
+        worker = Thread(target=run)
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is None:
+                    break
+                elif isinstance(item, Exception):
+                    raise item
+                for document in item:
+                    yield document
+        finally:
+            closed.set()
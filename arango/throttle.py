@@ -0,0 +1,181 @@
+from __future__ import absolute_import, unicode_literals
+
+import logging
+from threading import Lock
+from time import sleep, time
+
+from arango.exceptions import ArangoError
+
+
+class WriteThrottle(object):
+    """Throttle slowing down bulk writers when the server is under load.
+
+    The server load is sampled at most once every **interval** seconds from
+    the server statistics (the number of queued requests and the average
+    request time since the previous sample) and from the write-ahead log (the
+    number of running transactions). While any of these exceeds its limit,
+    the delay imposed on the writers is increased exponentially up to
+    **max_delay**. Once the load is back under the limits, the delay decays
+    the same way down to zero.
+
+    :param database: ArangoDB database object
+    :type database: arango.database.Database
+    :param interval: the minimum number of seconds between two samples
+    :type interval: int | float
+    :param max_queued: the maximum number of requests queued on the server
+    :type max_queued: int
+    :param max_latency: the maximum average request time in seconds
+    :type max_latency: int | float
+    :param max_transactions: the maximum number of running transactions
+    :type max_transactions: int
+    :param min_delay: the delay in seconds imposed when the load first
+        exceeds a limit
+    :type min_delay: int | float
+    :param max_delay: the maximum delay in seconds
+    :type max_delay: int | float
+    :param backoff: the factor by which the delay grows and decays
+    :type backoff: int | float
+
+    .. note::
+        Limits set to ``None`` are not checked. Metrics which cannot be
+        retrieved (e.g. the write-ahead log details with the RocksDB storage
+        engine, or without sufficient permissions) are ignored.
+    """
+
+    def __init__(self,
+                 database,
+                 interval=1.0,
+                 max_queued=64,
+                 max_latency=0.5,
+                 max_transactions=None,
+                 min_delay=0.01,
+                 max_delay=5.0,
+                 backoff=2.0):
+        self._db = database
+        self._interval = interval
+        self._limits = {
+            'queued': max_queued,
+            'latency': max_latency,
+            'transactions': max_transactions
+        }
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._backoff = backoff
+        self._lock = Lock()
+        self._delay = 0.0
+        self._sampled = None
+        self._load = {}
+        self._request_time = None
+        self._wal_supported = True
+        self._throttled = 0
+        self._throttled_time = 0.0
+        self._logger = logging.getLogger('arango')
+
+    def __repr__(self):
+        return '<ArangoDB write throttle>'
+
+    @property
+    def delay(self):
+        """Return the delay currently imposed on the writers.
+
+        :returns: the delay in seconds
+        :rtype: float
+        """
+        return self._delay
+
+    def statistics(self):
+        """Return the last sampled server load and the throttling statistics.
+
+        :returns: the last sampled metrics (``"queued"``, ``"latency"`` and
+            ``"transactions"``, each of which is ``None`` if not available),
+            the current delay (``"delay"``), the number of times writers were
+            delayed (``"throttled"``) and the total time they were delayed for
+            in seconds (``"throttled_time"``)
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._load)
+            stats['delay'] = self._delay
+            stats['throttled'] = self._throttled
+            stats['throttled_time'] = self._throttled_time
+        return stats
+
+    def wait(self):
+        """Sample the server load if due, and block for the current delay.
+
+        This should be called by the writers before each write.
+
+        :returns: the number of seconds the caller was blocked for
+        :rtype: float
+        """
+        with self._lock:
+            now = time()
+            if self._sampled is None or now - self._sampled >= self._interval:
+                self._sampled = now
+                self._adjust(self._sample())
+            delay = self._delay
+            if delay > 0:
+                self._throttled += 1
+                self._throttled_time += delay
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    def _sample(self):
+        """Sample the server load.
+
+        :returns: the sampled metrics (``None`` for the unavailable ones)
+        :rtype: dict
+        """
+        load = dict.fromkeys(self._limits)
+        try:
+            stats = self._db.statistics()
+            threads = stats.get('server', {}).get('threads', {})
+            load['queued'] = threads.get('queued')
+
+            request_time = stats.get('client', {}).get('requestTime', {})
+            current = (request_time.get('sum'), request_time.get('count'))
+            previous = self._request_time
+            self._request_time = current
+            if None not in current and previous is not None:
+                count = current[1] - previous[1]
+                if count > 0:
+                    load['latency'] = (current[0] - previous[0]) / count
+        except ArangoError as error:
+            self._logger.warning(
+                'Failed to sample server statistics: {}'.format(error)
+            )
+
+        if self._wal_supported and self._limits['transactions'] is not None:
+            try:
+                transactions = self._db.wal.transactions()
+            except ArangoError as error:
+                self._wal_supported = False
+                self._logger.debug(
+                    'Write-ahead log details unavailable: {}'.format(error)
+                )
+            else:
+                load['transactions'] = transactions['count']
+        self._load = load
+        return load
+
+    def _adjust(self, load):
+        """Adjust the delay to the sampled server load.
+
+        :param load: the sampled metrics
+        :type load: dict
+        """
+        overloaded = any(
+            limit is not None and load[name] is not None and
+            load[name] > limit
+            for name, limit in self._limits.items()
+        )
+        if overloaded:
+            self._delay = min(
+                max(self._delay * self._backoff, self._min_delay),
+                self._max_delay
+            )
+        else:
+            self._delay /= self._backoff
+            if self._delay < self._min_delay:
+                self._delay = 0.0
@@ -1,11 +1,20 @@
 from __future__ import absolute_import, unicode_literals
 
+from json import dumps
 from uuid import uuid4
 
+from arango.aql import AQL
 from arango.collections import Collection
 from arango.connection import Connection
+from arango.graph import Graph
 from arango.utils import HTTP_OK
-from arango.exceptions import TransactionError
+from arango.exceptions import (
+    TransactionAbortError,
+    TransactionBeginError,
+    TransactionCommitError,
+    TransactionError,
+    TransactionStatusError
+)
 
 
 class Transaction(Connection):
@@ -52,7 +61,7 @@ class Transaction(Connection):
             enable_logging=connection.logging_enabled
         )
         self._id = uuid4()
-        self._actions = ['db = require("internal").db']
+        self._actions = []
         self._collections = {}
         if read:
             self._collections['read'] = read
@@ -94,7 +103,15 @@ class Transaction(Connection):
         """
         if request.command is None:
             raise TransactionError('unsupported method')
-        self._actions.append(request.command)
+        args = request.command_args
+        if args is not None:
+            # Serialize the arguments right away to snapshot their values
+            serialized = {}
+            for arg in args:
+                if id(arg) not in serialized:
+                    serialized[id(arg)] = dumps(arg)
+            args = [serialized[id(arg)] for arg in args]
+        self._actions.append((request.command, args))
 
     def execute(self, command, params=None, sync=None, timeout=None):
         """Execute raw Javascript code in a transaction.
@@ -130,6 +147,35 @@ class Transaction(Connection):
             raise TransactionError(res)
         return res.body.get('result')
 
+    def _build_action(self):
+        """Build the Javascript action executing the queued API requests.
+
+        The arguments of the queued commands (e.g. documents) are passed to
+        the action as parameters instead of being embedded in its source, so
+        that the action stays small and the same action can be reused (and
+        cached by the server) across transactions.
+
+        :returns: the action and its serialized parameters
+        :rtype: (str | unicode, [str | unicode])
+        """
+        statements = ['var db = require("internal").db']
+        params = []
+        for command, args in self._actions:
+            if args is None:
+                statements.append(command)
+                continue
+            refs = []
+            indexes = {}
+            for arg in args:
+                # Arguments passed more than once are only sent once
+                if id(arg) not in indexes:
+                    indexes[id(arg)] = len(params)
+                    params.append(arg)
+                refs.append('params[{}]'.format(indexes[id(arg)]))
+            statements.append('{}({})'.format(command, ','.join(refs)))
+        action = 'function (params) {{ {} }}'.format(';'.join(statements))
+        return action, params
+
     def commit(self):
         """Execute the queued API requests in a single atomic step.
 
@@ -139,13 +185,15 @@ class Transaction(Connection):
             be executed
         """
         try:
-            action = ';'.join(self._actions)
+            action, params = self._build_action()
             res = self.post(
                 endpoint='/_api/transaction',
-                data={
-                    'collections': self._collections,
-                    'action': 'function () {{ {} }}'.format(action)
-                },
+                # The parameters are already serialized
+                data='{{"collections":{},"action":{},"params":[{}]}}'.format(
+                    dumps(self._collections),
+                    dumps(action),
+                    ','.join(params)
+                ),
                 params={
                     'lockTimeout': self._timeout,
                     'waitForSync': self._sync,
@@ -155,7 +203,7 @@ class Transaction(Connection):
                 raise TransactionError(res)
             return res.body.get('result')
         finally:
-            self._actions = ['db = require("internal").db']
+            self._actions = []
 
     def collection(self, name):
         """Return the collection object tailored for transactions.
@@ -169,3 +217,218 @@ class Transaction(Connection):
         :rtype: arango.collections.Collection
         """
         return Collection(self, name)
+
+
+class StreamTransaction(Connection):
+    """ArangoDB stream transaction.
+
+    Unlike with :class:`arango.transaction.Transaction`, API requests made in
+    a stream transaction are not queued, but executed right away on the server
+    within the transaction (so reads return results, and cursors can be used).
+    The changes become visible to others only once the transaction is
+    committed, and are rolled back if it is aborted.
+
+    :param connection: ArangoDB database connection
+    :type connection: arango.connection.Connection
+    :param read: the name(s) of the collection(s) to read from
+    :type read: str | unicode | list
+    :param write: the name(s) of the collection(s) to write to
+    :type write: str | unicode | list
+    :param exclusive: the name(s) of the collection(s) to write to
+        exclusively
+    :type exclusive: str | unicode | list
+    :param sync: wait for the transaction to sync to disk on commit
+    :type sync: bool
+    :param timeout: timeout on the collection locks
+    :type timeout: int
+    :param allow_implicit: allow reading from collections not declared
+    :type allow_implicit: bool
+
+    .. note::
+        The transaction is started on the server when this object is created.
+        When context managers are used, the transaction is committed upon
+        exiting the context, or aborted if an exception was raised.
+    """
+
+    def __init__(self,
+                 connection,
+                 read=None,
+                 write=None,
+                 exclusive=None,
+                 sync=None,
+                 timeout=None,
+                 allow_implicit=None):
+        super(StreamTransaction, self).__init__(
+            protocol=connection.protocol,
+            host=connection.host,
+            port=connection.port,
+            username=connection.username,
+            password=connection.password,
+            http_client=connection.http_client,
+            database=connection.database,
+            enable_logging=connection.logging_enabled
+        )
+        self._parent = connection
+        self._aql = AQL(self)
+        self._type = 'stream_transaction'
+
+        collections = {}
+        if read:
+            collections['read'] = read
+        if write:
+            collections['write'] = write
+        if exclusive:
+            collections['exclusive'] = exclusive
+        data = {'collections': collections}
+        if sync is not None:
+            data['waitForSync'] = sync
+        if timeout is not None:
+            data['lockTimeout'] = timeout
+        if allow_implicit is not None:
+            data['allowImplicit'] = allow_implicit
+
+        res = self._parent.post('/_api/transaction/begin', data=data)
+        if res.status_code not in HTTP_OK:
+            raise TransactionBeginError(res)
+        self._id = res.body['result']['id']
+
+    def __repr__(self):
+        return '<ArangoDB stream transaction {}>'.format(self._id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, *_):
+        if exception is None:
+            self.commit()
+        else:
+            self.abort()
+
+    @property
+    def id(self):
+        """Return the ID of the stream transaction.
+
+        :return: the ID of the stream transaction
+        :rtype: str | unicode
+        """
+        return self._id
+
+    def _headers(self, headers):
+        """Return the given request headers with the transaction ID added.
+
+        :param headers: the request headers
+        :type headers: dict
+        :returns: the request headers including ``x-arango-trx-id``
+        :rtype: dict
+        """
+        headers = dict(headers or {})
+        headers['x-arango-trx-id'] = self._id
+        return headers
+
+    def head(self, endpoint, params=None, headers=None, **_):
+        return super(StreamTransaction, self).head(
+            endpoint, params=params, headers=self._headers(headers)
+        )
+
+    def get(self, endpoint, params=None, headers=None, **_):
+        return super(StreamTransaction, self).get(
+            endpoint, params=params, headers=self._headers(headers)
+        )
+
+    def put(self, endpoint, data=None, params=None, headers=None, **_):
+        return super(StreamTransaction, self).put(
+            endpoint, data=data, params=params, headers=self._headers(headers)
+        )
+
+    def post(self, endpoint, data=None, params=None, headers=None, **_):
+        return super(StreamTransaction, self).post(
+            endpoint, data=data, params=params, headers=self._headers(headers)
+        )
+
+    def patch(self, endpoint, data=None, params=None, headers=None, **_):
+        return super(StreamTransaction, self).patch(
+            endpoint, data=data, params=params, headers=self._headers(headers)
+        )
+
+    def delete(self, endpoint, data=None, params=None, headers=None, **_):
+        return super(StreamTransaction, self).delete(
+            endpoint, data=data, params=params, headers=self._headers(headers)
+        )
+
+    def status(self):
+        """Return the status of the stream transaction from the server.
+
+        :returns: the status, which can be ``"running"``, ``"committed"`` or
+            ``"aborted"``
+        :rtype: str | unicode
+        :raises arango.exceptions.TransactionStatusError: if the status cannot
+            be retrieved
+        """
+        res = self._parent.get('/_api/transaction/{}'.format(self._id))
+        if res.status_code not in HTTP_OK:
+            raise TransactionStatusError(res)
+        return res.body['result']['status']
+
+    def commit(self):
+        """Commit the stream transaction.
+
+        :returns: whether the transaction was committed successfully
+        :rtype: bool
+        :raises arango.exceptions.TransactionCommitError: if the transaction
+            cannot be committed
+        """
+        res = self._parent.put('/_api/transaction/{}'.format(self._id))
+        if res.status_code not in HTTP_OK:
+            raise TransactionCommitError(res)
+        return True
+
+    def abort(self):
+        """Abort the stream transaction and roll back its changes.
+
+        :returns: whether the transaction was aborted successfully
+        :rtype: bool
+        :raises arango.exceptions.TransactionAbortError: if the transaction
+            cannot be aborted
+        """
+        res = self._parent.delete('/_api/transaction/{}'.format(self._id))
+        if res.status_code not in HTTP_OK:
+            raise TransactionAbortError(res)
+        return True
+
+    @property
+    def aql(self):
+        """Return the AQL object tailored for the stream transaction.
+
+        API requests via the returned object are executed within the stream
+        transaction.
+
+        :returns: ArangoDB query object
+        :rtype: arango.query.AQL
+        """
+        return self._aql
+
+    def collection(self, name):
+        """Return the collection object tailored for the stream transaction.
+
+        API requests via the returned object are executed within the stream
+        transaction.
+
+        :param name: the name of the collection
+        :type name: str | unicode
+        :returns: the collection object
+        :rtype: arango.collections.Collection
+        """
+        return Collection(self, name)
+
+    def graph(self, name):
+        """Return the graph object tailored for the stream transaction.
+
+        API requests via the returned object are executed within the stream
+        transaction.
+
+        :param name: the name of the graph
+        :type name: str | unicode
+        :returns: the graph object
+        :rtype: arango.graph.Graph
+        """
+        return Graph(self, name)
@@ -2,7 +2,7 @@ from __future__ import absolute_import, unicode_literals
 
 from json import dumps
 
-from six import string_types
+from six import binary_type, string_types
 
 # Set of HTTP OK status codes
 HTTP_OK = {200, 201, 202, 203, 204, 205, 206}
@@ -12,7 +12,39 @@ HTTP_AUTH_ERR = {401, 403}
 def sanitize(data):
     if data is None:
         return None
-    elif isinstance(data, string_types):
+    elif isinstance(data, (string_types, binary_type)):
         return data
     else:
         return dumps(data)
+
+
+def split_documents(documents, chunk_size=None, max_bytes=None):
+    """Split the documents into chunks bounded in count and size.
+
+    :param documents: the documents (or keys) to split
+    :type documents: list
+    :param chunk_size: the maximum number of documents per chunk
+    :type chunk_size: int
+    :param max_bytes: the maximum number of (JSON-encoded) bytes per chunk,
+        which is exceeded only by chunks holding a single large document
+    :type max_bytes: int
+    :returns: the chunks in the order of **documents**
+    :rtype: [list]
+    """
+    chunks = []
+    chunk = []
+    chunk_bytes = 0
+    for document in documents:
+        size = len(dumps(document)) + 1 if max_bytes else 0
+        if chunk and (
+            (chunk_size and len(chunk) >= chunk_size) or
+            (max_bytes and chunk_bytes + size > max_bytes)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(document)
+        chunk_bytes += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
@@ -13,7 +13,11 @@ setup(
     url='https://github.com/joowani/python-arango',
     packages=find_packages(),
     include_package_data=True,
-    install_requires=['requests', 'six'],
+    install_requires=[
+        'requests',
+        'six',
+        'futures; python_version < "3"'
+    ],
     tests_require=['pytest'],
     license='MIT',
     classifiers=[
@@ -214,3 +214,95 @@ def test_aql_errors():
     assert isinstance(err.value, AQLCacheClearError) \
            or isinstance(err.value, AsyncExecuteError) \
            or isinstance(err.value, BatchExecuteError)
+
+
+@pytest.mark.order11
+def test_query_result_cache():
+    col = db.collection(col_name)
+    col.truncate()
+    col.insert_many([{'_key': str(i), 'val': i} for i in range(3)])
+    query = 'FOR d IN {} FILTER d.val >= @min SORT d.val RETURN d.val'.format(
+        col_name
+    )
+
+    # Test results are not cached unless the cache is enabled
+    cursor = db.aql.execute(query, bind_vars={'min': 1}, cache_result=True)
+    assert list(cursor) == [1, 2]
+    assert db.aql.result_cache is None
+
+    cache = db.aql.enable_result_cache(max_size=2)
+    assert db.aql.result_cache is cache
+    assert 'ArangoDB query result cache' in repr(cache)
+
+    # Test only the queries opted in are cached
+    db.aql.execute(query, bind_vars={'min': 1})
+    assert len(cache) == 0
+    cursor = db.aql.execute(
+        query, bind_vars={'min': 1}, count=True, cache_result=True
+    )
+    assert cursor.count() == 2
+    assert list(cursor) == [1, 2]
+
+    # Test queries differing only by whitespace share their result
+    cursor = db.aql.execute(
+        query.replace(' ', '\n    '),
+        bind_vars={'min': 1},
+        count=True,
+        cache_result=True
+    )
+    assert cursor.count() == 2
+    assert list(cursor) == [1, 2]
+    stats = cache.statistics()
+    assert stats['misses'] == 1
+    assert stats['revalidations'] == 1
+
+    # Test results are invalidated once their collections are modified
+    col.insert({'_key': '3', 'val': 3})
+    cursor = db.aql.execute(
+        query, bind_vars={'min': 1}, count=True, cache_result=True
+    )
+    assert list(cursor) == [1, 2, 3]
+    stats = cache.statistics()
+    assert stats['misses'] == 2
+    assert stats['invalidations'] == 1
+
+    # Test least recently used results are evicted past the maximum size
+    db.aql.execute(query, bind_vars={'min': 2}, cache_result=True)
+    db.aql.execute(query, bind_vars={'min': 3}, cache_result=True)
+    assert len(cache) == 2
+    assert cache.statistics()['evictions'] == 1
+
+    # Test results of queries modifying documents are not cached
+    db.aql.execute(
+        'INSERT {{val: 4}} INTO {}'.format(col_name), cache_result=True
+    )
+    assert len(cache) == 2
+    assert cache.statistics()['misses'] == 4
+
+    # Test fresh results are served without a round trip
+    cache = db.aql.enable_result_cache(ttl=60)
+    db.aql.execute(query, bind_vars={'min': 4}, cache_result=True)
+    col.insert({'_key': '5', 'val': 5})
+    cursor = db.aql.execute(query, bind_vars={'min': 4}, cache_result=True)
+    assert list(cursor) == [4]
+    assert cache.statistics()['hits'] == 1
+
+    # Test results are not cached without the revisions of all collections
+    cursor = db.aql.execute(
+        'RETURN 1', cache_result=True, collections=[generate_col_name()]
+    )
+    assert list(cursor) == [1]
+    assert len(cache) == 1
+
+    # Test results of queries reading no collection are not cached
+    for _ in range(2):
+        cursor = db.aql.execute('RETURN 2', cache_result=True)
+        assert list(cursor) == [2]
+    cursor = db.aql.execute('RETURN 3', cache_result=True, collections=[])
+    assert list(cursor) == [3]
+    assert len(cache) == 1
+
+    db.aql.disable_result_cache()
+    assert db.aql.result_cache is None
+    cursor = db.aql.execute(query, bind_vars={'min': 4}, cache_result=True)
+    assert list(cursor) == [4, 5]
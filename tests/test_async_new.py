@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import gc
+from concurrent.futures import Future
 from time import sleep, time
 
 import pytest
@@ -7,6 +9,7 @@ from six import string_types
 
 from arango import ArangoClient
 from arango.aql import AQL
+from arango.async import AsyncJobPoller, as_completed, wait
 from arango.collections import Collection
 from arango.exceptions import (
     AsyncExecuteError,
@@ -15,7 +18,8 @@ from arango.exceptions import (
     AsyncJobResultError,
     AsyncJobStatusError,
     AsyncJobListError,
-    AQLQueryExecuteError
+    AQLQueryExecuteError,
+    DocumentInsertError
 )
 from arango.graph import Graph
 
@@ -409,3 +413,99 @@ def test_list_async_jobs_db_level():
     job_ids = db.async_jobs(status='done', count=1)
     assert len(job_ids) == 1
     assert job_ids[0] in expected_job_ids
+
+
+@pytest.mark.order13
+def test_async_job_futures():
+    asynchronous = db.asynchronous(return_result=True)
+    job1 = asynchronous.collection(col_name).insert({'_key': '1', 'val': 1})
+    job2 = asynchronous.collection(col_name).insert({'_key': '2', 'val': 2})
+    job3 = asynchronous.collection(col_name).insert({'_key': '1', 'val': 3})
+    jobs = [job1, job2, job3]
+
+    future = job1.future()
+    assert isinstance(future, Future)
+    assert job1.future() is future
+    assert future.result(timeout=10)['_key'] == '1'
+
+    assert set(as_completed(jobs, timeout=10)) == set(jobs)
+    done, not_done = wait(jobs, timeout=10)
+    assert done == set(jobs)
+    assert not_done == set()
+    assert job2.future().result()['_key'] == '2'
+    assert isinstance(job3.future().exception(), DocumentInsertError)
+
+    # Custom pollers can be used as well
+    poller = AsyncJobPoller(min_interval=0.001, max_interval=0.1)
+    job4 = asynchronous.collection(col_name).insert({'_key': '4', 'val': 4})
+    assert job4.future(poller=poller).result(timeout=10)['_key'] == '4'
+
+
+@pytest.mark.order14
+def test_async_job_bulk_polling():
+    asynchronous = db.asynchronous(return_result=True)
+    jobs = [
+        asynchronous.collection(col_name).insert({'_key': str(i), 'val': i})
+        for i in range(20)
+    ]
+    jobs.append(asynchronous.collection(col_name).insert({'_key': '0'}))
+
+    poller = AsyncJobPoller(min_interval=0.001, bulk=True)
+    futures = [job.future(poller=poller) for job in jobs]
+    for i, future in enumerate(futures[:20]):
+        assert future.result(timeout=10)['_key'] == str(i)
+    assert isinstance(futures[20].exception(timeout=10), DocumentInsertError)
+    assert len(poller) == 0
+
+    # The results are cleared from the server once fetched
+    assert db.async_jobs(status='done') == []
+
+    poller = AsyncJobPoller(min_interval=0.001, bulk=False)
+    job = asynchronous.collection(col_name).insert({'_key': '21', 'val': 21})
+    assert job.future(poller=poller).result(timeout=10)['_key'] == '21'
+
+
+@pytest.mark.order15
+def test_async_job_garbage_collection():
+    asynchronous = db.asynchronous(return_result=True)
+    job1 = asynchronous.collection(col_name).insert({'_key': '1', 'val': 1})
+    job2 = asynchronous.collection(col_name).insert({'_key': '2', 'val': 2})
+    job_ids = [entry['id'] for entry in db.unfetched_async_jobs()]
+    assert job1.id in job_ids
+    assert job2.id in job_ids
+
+    wait_on_job(job1)
+    job1.result()
+    job_ids = [entry['id'] for entry in db.unfetched_async_jobs()]
+    assert job1.id not in job_ids
+
+    # Results of discarded jobs are deleted from the server
+    wait_on_job(job2)
+    job2_id = job2.id
+    del job2
+    gc.collect()
+    assert db.unfetched_async_jobs() == []
+    assert job2_id not in db.async_jobs(status='done')
+
+
+@pytest.mark.order16
+def test_async_job_housekeeper():
+    asynchronous = db.asynchronous(return_result=True)
+    job = asynchronous.collection(col_name).insert({'_key': '1', 'val': 1})
+    wait_on_job(job)
+
+    housekeeper = db.async_housekeeper(ttl=3600, orphans_only=True)
+    assert 'ArangoDB async job housekeeper' in repr(housekeeper)
+    assert housekeeper.run_once() == 0
+    assert job.id in db.async_jobs(status='done')
+
+    sleep(1)
+    housekeeper = db.async_housekeeper(ttl=0.5, interval=0.1)
+    assert housekeeper.run_once() == 1
+    assert db.unfetched_async_jobs() == []
+    assert db.async_jobs(status='done') == []
+
+    with db.async_housekeeper(ttl=0, interval=0.1):
+        job = asynchronous.collection(col_name).insert({'_key': '2'})
+        sleep(1)
+    assert db.unfetched_async_jobs() == []
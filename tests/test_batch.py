@@ -1,5 +1,6 @@
 from __future__ import absolute_import, unicode_literals
 
+import time
 from uuid import UUID
 
 import pytest
@@ -226,3 +227,76 @@ def test_batch_clear():
     assert len(col) == 0
     assert job1.status() == 'pending'
     assert job2.status() == 'pending'
+
+
+def test_batch_auto_commit_max_requests():
+    batch = db.batch(max_requests=2)
+    batch_col = batch.collection(col_name)
+    job1 = batch_col.insert({'_key': '1'})
+    assert batch.queue_size() == 1
+    assert job1.status() == 'pending'
+    job2 = batch_col.insert({'_key': '2'})
+    assert batch.queue_size() == 0
+    assert batch.queue_bytes() == 0
+    assert job1.status() == 'done'
+    assert job2.status() == 'done'
+    job3 = batch_col.insert({'_key': '3'})
+    assert job3.status() == 'pending'
+    assert len(col) == 2
+
+    batch.commit()
+    assert job3.status() == 'done'
+    assert len(col) == 3
+
+
+def test_batch_auto_commit_max_bytes():
+    with db.batch(max_bytes=1) as batch:
+        job = batch.collection(col_name).insert({'_key': '1'})
+        assert job.status() == 'done'
+        assert '1' in col
+
+
+def test_batch_auto_commit_max_latency():
+    batch = db.batch(max_latency=0.01, background=True)
+    job = batch.collection(col_name).insert({'_key': '1'})
+    for _ in range(100):
+        if job.status() != 'pending':
+            break
+        time.sleep(0.05)
+    assert job.status() == 'done'
+    assert '1' in col
+    batch.close()
+
+
+def test_batch_sub_batches():
+    col.insert({'_key': 'existing'})
+    with db.batch(sub_batches=3) as batch:
+        batch_col = batch.collection(col_name)
+        jobs = [batch_col.insert({'_key': str(i)}) for i in range(10)]
+        jobs.append(batch_col.insert({'_key': 'existing'}))
+    assert len(col) == 11
+    for i, job in enumerate(jobs[:10]):
+        assert job.status() == 'done'
+        assert job.result()['_key'] == str(i)
+    assert jobs[10].status() == 'error'
+    assert isinstance(jobs[10].result(), DocumentInsertError)
+
+
+def test_batch_commit_async():
+    col.insert({'_key': 'existing'})
+    batch = db.batch(return_result=True)
+    batch_col = batch.collection(col_name)
+    job1 = batch_col.insert({'_key': '1'})
+    job2 = batch_col.insert({'_key': 'existing'})
+    async_job = batch.commit_async()
+    assert batch.queue_size() == 0
+    assert job1.status() == 'pending'
+
+    assert async_job.future().result(timeout=10) == [job1, job2]
+    assert job1.status() == 'done'
+    assert job1.result()['_key'] == '1'
+    assert job2.status() == 'error'
+    assert isinstance(job2.result(), DocumentInsertError)
+    assert '1' in col
+
+    assert batch.commit_async() is None
@@ -0,0 +1,150 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from arango import ArangoClient
+from arango.exceptions import BulkWriteError
+
+from .utils import (
+    generate_db_name,
+    generate_col_name,
+)
+
+arango_client = ArangoClient()
+db_name = generate_db_name()
+db = arango_client.create_database(db_name)
+col_name = generate_col_name()
+col = db.create_collection(col_name)
+
+
+def teardown_module(*_):
+    arango_client.delete_database(db_name, ignore_missing=True)
+
+
+def setup_function(*_):
+    col.truncate()
+
+
+def test_bulk_writer_init():
+    writer = db.bulk_writer(col_name)
+    assert 'ArangoDB transactional bulk writer' in repr(writer)
+    assert writer.offset == 0
+    assert writer.progress() == {'offset': 0, 'chunks': 0}
+
+    with pytest.raises(ValueError):
+        db.bulk_writer(col_name, method='upsert')
+
+
+def test_bulk_writer_write():
+    progress = []
+    writer = db.bulk_writer(col_name, chunk_size=3, callback=progress.append)
+    docs = ({'_key': str(i), 'val': i} for i in range(8))
+    assert writer.write(docs) == 8
+    assert len(col) == 8
+    assert writer.offset == 8
+    assert progress == [
+        {'offset': 3, 'chunks': 1},
+        {'offset': 6, 'chunks': 2},
+        {'offset': 8, 'chunks': 3},
+    ]
+
+    writer = db.bulk_writer(col_name, method='update', chunk_size=5)
+    assert writer.write({'_key': str(i), 'val': 0} for i in range(8)) == 8
+    assert all(doc['val'] == 0 for doc in col)
+
+    writer = db.bulk_writer(col_name, method='delete', chunk_size=5)
+    assert writer.write([str(i) for i in range(8)], offset=4) == 4
+    assert len(col) == 4
+
+
+def test_bulk_writer_resume():
+    col.insert({'_key': '3'})
+    docs = [{'_key': str(i)} for i in range(6)]
+    writer = db.bulk_writer(col_name, chunk_size=2)
+    with pytest.raises(BulkWriteError):
+        writer.write(docs)
+    # The failed chunk is rolled back as a whole
+    assert writer.offset == 2
+    assert len(col) == 3
+    assert '2' not in col
+
+    col.delete('3')
+    assert writer.write(docs, offset=writer.offset) == 4
+    assert len(col) == 6
+
+
+def test_bulk_writer_compensate():
+    col.insert({'_key': '3', 'val': 0})
+    writer = db.bulk_writer(
+        col_name,
+        method='replace',
+        chunk_size=2,
+        compensate=True
+    )
+    with pytest.raises(BulkWriteError):
+        writer.write({'_key': str(i), 'val': 1} for i in range(3, 6))
+    assert writer.offset == 0
+    assert col['3']['val'] == 0
+
+    writer = db.bulk_writer(col_name, chunk_size=2, compensate=True)
+    with pytest.raises(BulkWriteError):
+        writer.write({'_key': str(i)} for i in range(6))
+    assert writer.offset == 0
+    assert len(col) == 1
+
+    # Test chunks which cannot be undone are reported
+    writer = db.bulk_writer(
+        col_name,
+        chunk_size=2,
+        compensate=True,
+        callback=lambda progress: col.delete('0', ignore_missing=True)
+    )
+    with pytest.raises(BulkWriteError) as err:
+        writer.write({'_key': str(i)} for i in range(6))
+    assert 'offset(s) 0 could not be undone' in str(err.value)
+    assert writer.offset == 2
+    assert '1' in col
+
+
+def test_bulk_loader():
+    loader = db.bulk_loader(
+        col_name,
+        chunk_size=10,
+        min_chunk_size=10,
+        max_chunk_size=50,
+        workers=1,
+        max_workers=4,
+        target_latency=10
+    )
+    assert 'ArangoDB adaptive bulk loader' in repr(loader)
+    assert loader.chunk_size == 10
+    assert loader.workers == 1
+
+    stats = loader.load({'_key': str(i), 'val': i} for i in range(1000))
+    assert stats['documents'] == 1000
+    assert stats['created'] == 1000
+    assert stats['errors'] == 0
+    assert stats['retries'] == 0
+    assert stats['throughput'] > 0
+    assert len(col) == 1000
+    # The chunk size and concurrency grow while the latency stays low
+    assert loader.chunk_size == 50
+    assert loader.workers == 4
+    assert loader.statistics() == stats
+
+    # Test per-document errors are counted
+    stats = loader.load({'_key': str(i)} for i in range(990, 1010))
+    assert stats['created'] == 10
+    assert stats['errors'] == 10
+
+    # Test the chunk size shrinks when the latency exceeds the target
+    loader = db.bulk_loader(
+        col_name,
+        chunk_size=1000,
+        min_chunk_size=10,
+        target_latency=0,
+        on_duplicate='ignore'
+    )
+    stats = loader.load({'_key': str(i)} for i in range(2000))
+    assert stats['ignored'] == 1010
+    assert loader.chunk_size < 1000
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import gc
+
 import pytest
 
 from arango import ArangoClient
@@ -310,3 +312,50 @@ def test_cursor_repr_no_id():
     )
     getattr(cursor, '_data')['id'] = None
     assert repr(cursor) == '<ArangoDB cursor>'
+
+
+@pytest.mark.order13
+def test_cursor_leak_detection():
+    col.truncate()
+    col.import_bulk([doc1, doc2, doc3, doc4])
+    db.close_cursors()
+    assert db.open_cursors() == []
+
+    cursor = db.aql.execute(
+        'FOR d IN {} RETURN d'.format(col_name),
+        batch_size=2,
+        ttl=1000
+    )
+    cursor_id = cursor.id
+    open_cursors = db.open_cursors()
+    assert len(open_cursors) == 1
+    assert open_cursors[0]['id'] == cursor_id
+    assert open_cursors[0]['database'] == db_name
+    assert open_cursors[0]['age'] >= 0
+
+    # Depleted cursors are no longer reported
+    assert len(list(cursor)) == 4
+    assert db.open_cursors() == []
+
+    # Abandoned cursors are closed on the server
+    cursor = db.aql.execute(
+        'FOR d IN {} RETURN d'.format(col_name),
+        batch_size=2,
+        ttl=1000
+    )
+    cursor_id = cursor.id
+    del cursor
+    gc.collect()
+    assert db.open_cursors() == []
+    res = db.connection.put('/_api/cursor/{}'.format(cursor_id))
+    assert res.status_code == 404
+
+    # Open cursors can be closed in bulk
+    cursor = db.aql.execute(
+        'FOR d IN {} RETURN d'.format(col_name),
+        batch_size=2,
+        ttl=1000
+    )
+    assert db.close_cursors() == 1
+    assert db.open_cursors() == []
+    assert cursor.close(ignore_missing=True) is False
@@ -0,0 +1,72 @@
+from __future__ import absolute_import, unicode_literals
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from arango import ArangoClient
+from arango.aql import AQL
+from arango.collections import Collection
+from arango.exceptions import DocumentInsertError
+from arango.graph import Graph
+
+from .utils import (
+    generate_db_name,
+    generate_col_name,
+)
+
+arango_client = ArangoClient()
+db_name = generate_db_name()
+db = arango_client.create_database(db_name)
+col_name = generate_col_name()
+col = db.create_collection(col_name)
+
+
+def teardown_module(*_):
+    arango_client.delete_database(db_name, ignore_missing=True)
+
+
+def setup_function(*_):
+    col.truncate()
+
+
+def test_init():
+    dispatcher = db.dispatcher()
+    assert dispatcher.type == 'dispatcher'
+    assert 'ArangoDB batch dispatcher' in repr(dispatcher)
+    assert isinstance(dispatcher.aql, AQL)
+    assert isinstance(dispatcher.collection(col_name), Collection)
+    assert isinstance(dispatcher.graph('test'), Graph)
+    dispatcher.close()
+
+
+def test_dispatcher_across_threads():
+    col.import_bulk([{'_key': str(i)} for i in range(50)])
+    with db.dispatcher(max_delay=0.01, max_requests=20) as dispatcher:
+        dispatcher_col = dispatcher.collection(col_name)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            keys = [str(i) for i in range(50)] + ['missing']
+            docs = list(executor.map(dispatcher_col.get, keys))
+    assert [doc['_key'] for doc in docs[:50]] == keys[:50]
+    assert docs[50] is None
+
+
+def test_dispatcher_errors():
+    col.insert({'_key': '1'})
+    with db.dispatcher() as dispatcher:
+        with pytest.raises(DocumentInsertError):
+            dispatcher.collection(col_name).insert({'_key': '1'})
+
+
+def test_dispatcher_futures():
+    with db.dispatcher(return_future=True) as dispatcher:
+        dispatcher_col = dispatcher.collection(col_name)
+        future1 = dispatcher_col.insert({'_key': '1'})
+        future2 = dispatcher_col.insert({'_key': '1'})
+    assert isinstance(future1, Future)
+    assert future1.result()['_key'] == '1'
+    with pytest.raises(DocumentInsertError):
+        future2.result()
+
+    # Requests made after closing are sent individually
+    assert dispatcher.collection(col_name).get('1').result()['_key'] == '1'
@@ -1,10 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
+from time import sleep
+
 import pytest
 from six import string_types
 
 from arango import ArangoClient
 from arango.exceptions import *
+from arango.result import BulkResult
 
 from .utils import (
     generate_db_name,
@@ -899,6 +902,86 @@ def test_delete_many():
         bad_col.delete_many(test_doc_keys)
 
 
+def test_write_many_in_chunks():
+    keys = [str(i) for i in range(10)]
+    docs = [{'_key': key, 'val': 1} for key in keys]
+    docs.append({'_key': '0'})
+
+    # Test insert_many in concurrent chunks
+    results = col.insert_many(docs, chunk_size=3, workers=4)
+    assert len(results) == 11
+    for result, doc in zip(results[:10], docs):
+        assert result['_key'] == doc['_key']
+    assert isinstance(results[10], DocumentInsertError)
+    assert len(col) == 10
+
+    # Test update_many and replace_many in chunks bounded by size
+    results = col.update_many(
+        [{'_key': str(i), 'val': 0} for i in range(10)],
+        max_bytes=50,
+        workers=2
+    )
+    assert [result['_key'] for result in results] == keys
+    assert all(doc['val'] == 0 for doc in col)
+    results = col.replace_many(
+        [{'_key': str(i)} for i in range(10)],
+        chunk_size=4
+    )
+    assert [result['_key'] for result in results] == keys
+    assert all('val' not in doc for doc in col)
+
+    # Test delete_many in chunks
+    results = col.delete_many(keys, chunk_size=1, workers=10)
+    assert [result['_key'] for result in results] == keys
+    assert len(col) == 0
+
+    # Test chunks failing as a whole
+    with pytest.raises(DocumentInsertError):
+        bad_col.insert_many(docs, chunk_size=3, workers=2)
+
+
+def test_write_many_compact():
+    docs = [{'_key': str(i), 'val': i} for i in range(5)]
+    col.insert(docs[3])
+
+    # Test insert_many with compact results
+    results = col.insert_many(docs, compact=True)
+    assert isinstance(results, BulkResult)
+    assert len(results) == 5
+    assert results.keys == ['0', '1', '2', None, '4']
+    assert list(results.error_codes) == [0, 0, 0, 1210, 0]
+    assert results.error_count == 1
+    assert results[0]['_id'] == '{}/0'.format(col.name)
+    assert isinstance(results[0]['_rev'], string_types)
+    assert isinstance(results[3], DocumentInsertError)
+    index, error = results.errors()[0]
+    assert index == 3
+    assert isinstance(error, DocumentInsertError)
+
+    # Test update_many with compact results in chunks
+    results = col.update_many(
+        [{'_key': str(i), 'val': 0} for i in range(6)],
+        compact=True,
+        chunk_size=2,
+        workers=2
+    )
+    assert results.keys == ['0', '1', '2', '3', '4', None]
+    assert results.revs[:5] == [col[str(i)]['_rev'] for i in range(5)]
+    assert all(isinstance(rev, string_types) for rev in results.old_revs[:5])
+    assert isinstance(results[5], DocumentUpdateError)
+
+    # Test replace_many and delete_many with compact results
+    results = col.replace_many(
+        [{'_key': str(i)} for i in range(5)],
+        return_old=True,
+        compact=True
+    )
+    assert [old['val'] for old in results.old] == [0] * 5
+    results = col.delete_many([str(i) for i in range(5)], compact=True)
+    assert results.error_count == 0
+    assert len(col) == 0
+
+
 def test_delete_match():
     # Test preconditions
     assert col.delete_match({'val': 100}) == 0
@@ -1279,6 +1362,136 @@ def test_all():
 #     assert result.close(ignore_missing=True) is False
 
 
+def test_scan():
+    # Set up test documents
+    col.import_bulk(test_docs)
+
+    # Test scan with default options
+    scan = col.scan()
+    assert 'ArangoDB scan on "{}"'.format(col_name) in repr(scan)
+    assert scan.collection == col_name
+    assert clean_keys(list(scan)) == test_docs
+    assert scan.count() == 5
+    assert scan.checkpoint() == {'last_key': '5', 'count': 5}
+
+    # Test scan with checkpoint callback
+    checkpoints = []
+    scan = col.scan(batch_size=2, callback=checkpoints.append)
+    assert clean_keys(list(scan)) == test_docs
+    assert checkpoints == [
+        {'last_key': '2', 'count': 2},
+        {'last_key': '4', 'count': 4},
+        {'last_key': '5', 'count': 5},
+    ]
+
+    # Test resuming scan from checkpoint
+    scan = col.scan(batch_size=2)
+    assert clean_keys(scan.next()) == doc1
+    assert clean_keys(scan.next()) == doc2
+    assert clean_keys(scan.next()) == doc3
+    scan = col.scan(batch_size=2, checkpoint=scan.checkpoint())
+    assert clean_keys(list(scan)) == [doc4, doc5]
+    assert scan.count() == 5
+
+    # Test scan in missing collection
+    with pytest.raises(DocumentGetError):
+        list(bad_col.scan())
+
+
+def test_parallel_scan():
+    # Set up test documents
+    col.import_bulk(test_docs)
+
+    # Test parallel scan with default options
+    scan = col.parallel_scan()
+    assert 'ArangoDB parallel scan on "{}"'.format(col_name) in repr(scan)
+    assert scan.collection == col_name
+    assert ordered(clean_keys(list(scan))) == test_docs
+
+    # Test parallel scan key ranges
+    scan = col.parallel_scan(partitions=2, batch_size=1)
+    ranges = scan.ranges()
+    assert len(ranges) == 2
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    assert ranges[0][1] == ranges[1][0]
+    assert ordered(clean_keys(list(scan))) == test_docs
+
+    # Test parallel scan with a sink
+    pages = []
+    scan = col.parallel_scan(partitions=3, workers=2, batch_size=1)
+    assert scan.run(pages.append) == 5
+    assert len(pages) == 5
+    assert ordered(clean_keys(sum(pages, []))) == test_docs
+
+    # Test parallel scan in missing collection
+    with pytest.raises(DocumentGetError):
+        list(bad_col.parallel_scan())
+    with pytest.raises(DocumentGetError):
+        bad_col.parallel_scan().run(pages.append)
+
+
+def test_paginate():
+    # Set up test documents
+    col.import_bulk(test_docs)
+
+    # Test paginate with default options
+    page = col.paginate()
+    assert 'ArangoDB page of 5 documents' in repr(page)
+    assert clean_keys(page.documents) == test_docs
+    assert page.has_more() is False
+    assert page.next_token is None
+
+    # Test paginate through all pages
+    page = col.paginate(page_size=2)
+    assert clean_keys(list(page)) == [doc1, doc2]
+    assert page.has_more() is True
+    page = col.paginate(page_size=2, page_token=page.next_token)
+    assert clean_keys(list(page)) == [doc3, doc4]
+    assert page.has_more() is True
+    page = col.paginate(page_size=2, page_token=page.next_token)
+    assert clean_keys(list(page)) == [doc5]
+    assert page.has_more() is False
+
+    # Test paginate sorted by a non-unique field in descending order
+    page = col.paginate(page_size=3, sort_field='val', descending=True)
+    assert clean_keys(list(page)) == [doc5, doc4, doc3]
+    page = col.paginate(
+        page_size=3,
+        page_token=page.next_token,
+        sort_field='val',
+        descending=True
+    )
+    assert clean_keys(list(page)) == [doc2, doc1]
+    assert page.has_more() is False
+
+    # Test paginate with filters
+    page = col.paginate(page_size=1, filters={'text': 'foo'})
+    assert clean_keys(list(page)) == [doc1]
+    page = col.paginate(
+        page_size=5,
+        page_token=page.next_token,
+        filters={'text': 'foo'}
+    )
+    assert clean_keys(list(page)) == [doc4, doc5]
+
+    # Test paginate with an invalid page token
+    with pytest.raises(DocumentGetError):
+        col.paginate(page_token='invalid')
+
+    # Test paginate with a page token of another sort order
+    page = col.paginate(page_size=1)
+    with pytest.raises(DocumentGetError):
+        col.paginate(page_token=page.next_token, sort_field='val')
+
+    # Test paginate in a batch execution
+    with pytest.raises(DocumentGetError):
+        db.batch().collection(col.name).paginate()
+
+    # Test paginate in missing collection
+    with pytest.raises(DocumentGetError):
+        bad_col.paginate()
+
+
 def test_random():
     # Set up test documents
     col.import_bulk(test_docs)
@@ -1634,3 +1847,179 @@ def test_import_bulk():
     assert result['ignored'] == 0
     assert 'foo' not in col['1']
     assert col['1']['bar'] == '3'
+
+
+def test_document_cache():
+    col.insert_many(test_docs)
+    cached_col = db.collection(col.name)
+    cache = cached_col.enable_cache(max_size=3)
+    assert cached_col.cache is cache
+    assert 'ArangoDB document cache' in repr(cache)
+
+    # Test documents are revalidated by revision on every read
+    doc = cached_col.get('1')
+    assert doc['val'] == 100
+    doc['val'] = 0
+    assert cached_col.get('1')['val'] == 100
+    assert cached_col['1']['val'] == 100
+    assert cached_col.get('missing') is None
+    stats = cache.statistics()
+    assert stats['misses'] == 1
+    assert stats['revalidations'] == 2
+    assert stats['hit_rate'] == 2 / 3.0
+
+    # Test modified documents are fetched again
+    col.update({'_key': '1', 'val': 1})
+    assert cached_col.get('1')['val'] == 1
+    assert cache.statistics()['misses'] == 2
+
+    # Test documents written through the collection object are evicted
+    cached_col.update({'_key': '1', 'val': 2})
+    assert '1' not in cache
+    assert cached_col.get('1')['val'] == 2
+
+    # Test least recently used documents are evicted past the maximum size
+    for key in ['2', '3', '4']:
+        cached_col.get(key)
+    assert len(cache) == 3
+    assert '1' not in cache
+    assert cache.statistics()['evictions'] == 1
+
+    # Test failed writes evict the documents as well
+    with pytest.raises(DocumentRevisionError):
+        cached_col.update({'_key': '4', '_rev': 'bad'}, check_rev=True)
+    assert '4' not in cache
+
+    # Test overwriting imports and truncates clear the cache
+    cached_col.import_bulk([{'_key': '9'}])
+    assert len(cache) == 2
+    cached_col.import_bulk([{'_key': '2', 'val': 2}], on_duplicate='update')
+    assert len(cache) == 0
+    assert cached_col.get('2')['val'] == 2
+    cached_col.truncate()
+    assert len(cache) == 0
+    assert cached_col.get('2') is None
+    col.insert_many(test_docs)
+
+    # Test fresh documents are served without a round trip
+    cache = cached_col.enable_cache(ttl=60)
+    cached_col.get('5')
+    col.update({'_key': '5', 'val': 5})
+    assert cached_col.get('5')['val'] == 300
+    assert cache.statistics()['hits'] == 1
+
+    cached_col.disable_cache()
+    assert cached_col.cache is None
+    assert cached_col.get('5')['val'] == 5
+
+    # Test the cache is not used in batch executions
+    batch_col = db.batch().collection(col.name)
+    cache = batch_col.enable_cache()
+    assert batch_col['5']['val'] == 5
+    assert len(cache) == 0
+
+
+def test_document_cache_revision_check():
+    col.insert_many(test_docs)
+    cached_col = db.collection(col.name)
+    assert cached_col.revalidate_cache() is None
+    with pytest.raises(ValueError):
+        cached_col.enable_cache(revision_check=True)
+    cache = cached_col.enable_cache(ttl=0.5, revision_check=True)
+    assert cache.revision_check is True
+
+    # Test all cached documents are revalidated with one revision check
+    for key in ['1', '2', '3']:
+        cached_col.get(key)
+    assert cache.statistics()['revision_checks'] == 1
+    sleep(0.5)
+    for key in ['1', '2', '3']:
+        assert cached_col.get(key)['_key'] == key
+    stats = cache.statistics()
+    assert stats['revision_checks'] == 2
+    assert stats['revalidations'] == 0
+    assert stats['hits'] == 3
+    assert cached_col.revalidate_cache() is True
+
+    # Test documents are revalidated one by one once the collection changes
+    col.update({'_key': '1', 'val': 1})
+    assert cached_col.revalidate_cache() is False
+    sleep(0.5)
+    assert cached_col.get('1')['val'] == 1
+    assert cached_col.get('2')['val'] == 100
+    stats = cache.statistics()
+    assert stats['misses'] == 4
+    assert stats['revalidations'] == 1
+
+    # Test revalidated documents are valid for the new revision
+    sleep(0.5)
+    assert cached_col.get('2')['val'] == 100
+    assert cache.statistics()['revalidations'] == 1
+    cached_col.disable_cache()
+
+
+def test_import_file(tmpdir):
+    # Test import file in JSON lines format
+    path = tmpdir.join('docs.jsonl')
+    path.write(''.join(
+        '{{"_key": "{}", "val": {}}}\n'.format(i, i) for i in range(100)
+    ))
+    reports = col.import_file(str(path), chunk_bytes=256, workers=4)
+    assert len(reports) > 1
+    assert reports[0]['offset'] == 0
+    for report, next_report in zip(reports, reports[1:]):
+        assert report['offset'] + report['size'] == next_report['offset']
+    assert sum(report['created'] for report in reports) == 100
+    assert sum(report['errors'] for report in reports) == 0
+    assert len(col) == 100
+    assert col['42']['val'] == 42
+
+    # Test import file with duplicates reported per chunk
+    reports = col.import_file(str(path), halt_on_error=False)
+    assert len(reports) == 1
+    assert reports[0]['errors'] == 100
+    assert len(reports[0]['details']) == 100
+
+    # Test import file in CSV format
+    col.truncate()
+    path = tmpdir.join('docs.csv')
+    path.write(
+        '_key,val,text\r\n'
+        '1,foo,"a ""quoted"" value"\r\n'
+        '\r\n'
+        '2,bar,"a value with,\r\na line break"\r\n'
+        '"3",3,\r\n'
+    )
+    reports = col.import_file(str(path), format='csv', chunk_bytes=8)
+    assert [report['created'] for report in reports] == [1, 1, 1]
+    assert [report['offset'] for report in reports] == [0, 1, 2]
+    assert col['1']['text'] == 'a "quoted" value'
+    assert col['2']['text'] == 'a value with,\r\na line break'
+    assert col['3']['val'] == '3'
+
+    # Test import file in missing collection
+    reports = bad_col.import_file(str(path), format='csv')
+    assert isinstance(reports[0]['error'], DocumentInsertError)
+
+    # Test import empty file and bad format
+    path = tmpdir.join('empty.jsonl')
+    path.write('')
+    assert col.import_file(str(path)) == []
+    with pytest.raises(ValueError):
+        col.import_file(str(path), format='xml')
+
+    # Test import raw documents with and without a header
+    col.truncate()
+    result = col.import_raw(b'{"_key": "1"}\n{"_key": "2"}\n')
+    assert result['created'] == 2
+    result = col.import_raw('["_key","val"]\n["3","foo"]\n', header=True)
+    assert result['created'] == 1
+    assert col['3']['val'] == 'foo'
+    with pytest.raises(DocumentInsertError):
+        bad_col.import_raw(b'{"_key": "1"}\n')
+
+    # Test import file in batch and async executions
+    with pytest.raises(DocumentInsertError):
+        db.batch().collection(col.name).import_file(str(path))
+    with pytest.raises(DocumentInsertError):
+        db.asynchronous().collection(col.name).import_file(str(path))
@@ -0,0 +1,79 @@
+from __future__ import absolute_import, unicode_literals
+
+import os
+
+from arango import ArangoClient
+
+from .utils import (
+    generate_db_name,
+    generate_col_name,
+    generate_graph_name
+)
+
+arango_client = ArangoClient()
+db_name = generate_db_name()
+db = arango_client.create_database(db_name)
+col_name = generate_col_name()
+col = db.create_collection(col_name)
+col.add_hash_index(['val'], unique=True)
+edge_col_name = generate_col_name()
+edge_col = db.create_collection(edge_col_name, edge=True)
+graph_name = generate_graph_name()
+db.create_graph(graph_name, edge_definitions=[{
+    'name': edge_col_name,
+    'from_collections': [col_name],
+    'to_collections': [col_name]
+}])
+col.import_bulk([{'_key': str(i), 'val': i} for i in range(25)])
+edge_col.insert({
+    '_key': 'e',
+    '_from': '{}/1'.format(col_name),
+    '_to': '{}/2'.format(col_name)
+})
+
+restore_db_name = generate_db_name()
+restore_db = arango_client.create_database(restore_db_name)
+
+
+def teardown_module(*_):
+    arango_client.delete_database(db_name, ignore_missing=True)
+    arango_client.delete_database(restore_db_name, ignore_missing=True)
+
+
+def test_dump_and_restore(tmpdir):
+    path = str(tmpdir.join('dump'))
+    manifest = db.dump(path, shard_size=10, workers=2)
+    assert os.path.isfile(os.path.join(path, 'manifest.json'))
+
+    dumped = {details['name']: details for details in manifest['collections']}
+    assert set(dumped) == {col_name, edge_col_name}
+    assert dumped[col_name]['count'] == 25
+    assert len(dumped[col_name]['shards']) == 3
+    assert dumped[edge_col_name]['properties']['edge'] is True
+    assert [index['type'] for index in dumped[col_name]['indexes']] == ['hash']
+    assert manifest['graphs'][0]['name'] == graph_name
+
+    results = restore_db.restore(path, workers=3, chunk_bytes=64)
+    assert results[col_name]['created'] == 25
+    assert results[edge_col_name]['created'] == 1
+
+    restored_col = restore_db.collection(col_name)
+    assert len(restored_col) == 25
+    assert restored_col['7']['val'] == 7
+    assert any(
+        index['type'] == 'hash' and index['unique']
+        for index in restored_col.indexes()
+    )
+    assert restore_db.collection(edge_col_name).properties()['edge'] is True
+    assert restore_db.graph(graph_name).edge_definitions() == \
+        db.graph(graph_name).edge_definitions()
+
+    # Test restore into existing collections
+    results = restore_db.restore(
+        path,
+        collections=[col_name],
+        on_duplicate='ignore'
+    )
+    assert results == {col_name: {
+        'created': 0, 'errors': 0, 'empty': 0, 'updated': 0, 'ignored': 25
+    }}
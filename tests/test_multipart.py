@@ -0,0 +1,70 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from arango.exceptions import BatchExecuteError
+from arango.multipart import (
+    MultipartParser,
+    encode_end,
+    encode_part,
+    parse_parts
+)
+from arango.request import Request
+
+
+def make_part(content_id, status, body, content_length=True):
+    body = body.encode('utf-8')
+    headers = 'Content-Type: application/json\r\n'
+    if content_length:
+        headers += 'Content-Length: {}\r\n'.format(len(body))
+    return (
+        '--XXXsubpartXXX\r\n'
+        'Content-Type: application/x-arango-batchpart\r\n'
+        'Content-Id: {}\r\n\r\n'
+        'HTTP/1.1 {}\r\n{}\r\n'.format(content_id, status, headers)
+    ).encode('utf-8') + body + b'\r\n'
+
+
+def test_encode_part():
+    request = Request(method='post', endpoint='/_api/document/c', data={})
+    part = encode_part(1, request)
+    assert isinstance(part, bytes)
+    assert part.startswith(b'--XXXsubpartXXX\r\n')
+    assert b'Content-Id: 1\r\n\r\npost /_api/document/c' in part
+    assert encode_end() == b'--XXXsubpartXXX--\r\n\r\n'
+
+
+def test_parse_parts():
+    data = b''.join([
+        b'preamble\r\n',
+        make_part(2, '202 Accepted', '{\n  "_key": "--XXXsubpartXXX"\n}'),
+        make_part(1, '404 Not Found', '{"error": true}', False),
+        b'--XXXsubpartXXX--\r\n'
+    ])
+    part2, part1 = parse_parts(data)
+    assert part1.content_id == '1'
+    assert part1.status_code == 404
+    assert part1.status_text == 'Not Found'
+    assert part1.body == b'{"error": true}'
+    assert part2.content_id == '2'
+    assert part2.status_code == 202
+    assert part2.headers['content-type'] == (
+        'application/x-arango-batchpart'
+    )
+    assert part2.response_headers['content-type'] == 'application/json'
+    assert part2.body == b'{\n  "_key": "--XXXsubpartXXX"\n}'
+
+
+def test_parse_parts_incrementally():
+    data = make_part(1, '200 OK', '[1, 2]') + b'--XXXsubpartXXX--\r\n'
+    parser = MultipartParser()
+    parts = []
+    for index in range(len(data)):
+        parts.extend(parser.feed(data[index:index + 1]))
+    parser.close()
+    assert [part.body for part in parts] == [b'[1, 2]']
+
+
+def test_parse_parts_truncated():
+    with pytest.raises(BatchExecuteError):
+        parse_parts(make_part(1, '200 OK', '[1, 2]'))
@@ -0,0 +1,80 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from arango import ArangoClient
+from arango.aql import AQL
+from arango.collections import Collection
+from arango.exceptions import WritePipelineFullError
+from arango.graph import Graph
+
+from .utils import (
+    generate_db_name,
+    generate_col_name,
+)
+
+arango_client = ArangoClient()
+db_name = generate_db_name()
+db = arango_client.create_database(db_name)
+col_name = generate_col_name()
+col = db.create_collection(col_name)
+
+
+def teardown_module(*_):
+    arango_client.delete_database(db_name, ignore_missing=True)
+
+
+def setup_function(*_):
+    col.truncate()
+
+
+def test_init():
+    pipeline = db.write_pipeline()
+    assert pipeline.type == 'async'
+    assert 'ArangoDB write pipeline' in repr(pipeline)
+    assert isinstance(pipeline.aql, AQL)
+    assert isinstance(pipeline.collection(col_name), Collection)
+    assert isinstance(pipeline.graph('test'), Graph)
+    assert pipeline.depth() == 0
+
+    with pytest.raises(ValueError):
+        db.write_pipeline(policy='invalid')
+
+
+def test_pipeline_block():
+    with db.write_pipeline(max_pending=5) as pipeline:
+        pipeline_col = pipeline.collection(col_name)
+        for i in range(50):
+            assert pipeline_col.insert({'_key': str(i)}) is True
+            assert pipeline.depth() <= 5
+        assert pipeline_col.insert({'_key': '0'}) is True
+    assert pipeline.depth() == 0
+    assert pipeline.statistics() == {
+        'pending': 0,
+        'submitted': 51,
+        'completed': 51,
+        'failed': 1,
+        'dropped': 0
+    }
+    assert len(col) == 50
+
+
+def test_pipeline_drop():
+    pipeline = db.write_pipeline(max_pending=1, policy='drop')
+    pipeline_col = pipeline.collection(col_name)
+    results = [pipeline_col.insert({'_key': str(i)}) for i in range(10)]
+    assert results[0] is True
+    assert pipeline.flush(timeout=10) is True
+    stats = pipeline.statistics()
+    assert stats['submitted'] == results.count(True)
+    assert stats['dropped'] == results.count(False)
+    assert len(col) == results.count(True)
+
+
+def test_pipeline_timeout():
+    pipeline = db.write_pipeline(max_pending=1, timeout=0)
+    pipeline_col = pipeline.collection(col_name)
+    with pytest.raises(WritePipelineFullError):
+        for i in range(10):
+            pipeline_col.insert({'_key': str(i)})
+    assert pipeline.flush(timeout=10) is True
@@ -0,0 +1,67 @@
+from __future__ import absolute_import, unicode_literals
+
+from arango import ArangoClient
+
+from .utils import (
+    generate_db_name,
+    generate_col_name,
+)
+
+arango_client = ArangoClient()
+db_name = generate_db_name()
+db = arango_client.create_database(db_name)
+col_name = generate_col_name()
+col = db.create_collection(col_name)
+
+
+def teardown_module(*_):
+    arango_client.delete_database(db_name, ignore_missing=True)
+
+
+def setup_function(*_):
+    col.truncate()
+
+
+def test_init():
+    throttle = db.write_throttle()
+    assert 'ArangoDB write throttle' in repr(throttle)
+    assert throttle.delay == 0
+    assert throttle.statistics()['throttled'] == 0
+
+
+def test_wait():
+    # Test no delay while the server is idle
+    throttle = db.write_throttle(max_queued=1000, max_latency=None)
+    assert throttle.wait() == 0
+    stats = throttle.statistics()
+    assert stats['queued'] is not None
+    assert stats['delay'] == 0
+
+    # Test the delay grows while a limit is exceeded, up to the maximum
+    throttle = db.write_throttle(
+        interval=0,
+        max_queued=-1,
+        min_delay=0.01,
+        max_delay=0.04
+    )
+    assert [throttle.wait() for _ in range(4)] == [0.01, 0.02, 0.04, 0.04]
+    stats = throttle.statistics()
+    assert stats['throttled'] == 4
+    assert stats['throttled_time'] > 0.1
+
+
+def test_throttled_writers():
+    throttle = db.write_throttle(interval=0, max_queued=-1, max_delay=0.01)
+    writer = db.bulk_writer(col_name, chunk_size=10, throttle=throttle)
+    assert writer.write({'_key': str(i)} for i in range(30)) == 30
+    assert throttle.statistics()['throttled'] == 3
+
+    loader = db.bulk_loader(
+        col_name,
+        chunk_size=10,
+        min_chunk_size=10,
+        on_duplicate='ignore',
+        throttle=throttle
+    )
+    assert loader.load({'_key': str(i)} for i in range(30))['ignored'] == 30
+    assert throttle.statistics()['throttled'] > 3
@@ -4,7 +4,11 @@ import pytest
 
 from arango import ArangoClient
 from arango.collections import Collection
-from arango.exceptions import TransactionError
+from arango.exceptions import (
+    TransactionAbortError,
+    TransactionBeginError,
+    TransactionError
+)
 
 from .utils import (
     generate_db_name,
@@ -424,3 +428,66 @@ def test_bad_collections():
         ) as txn:
             txn_col = txn.collection(col_name)
             txn_col.insert(doc2)
+
+
+def test_transaction_params():
+    doc = {'_key': '1', 'val': 100}
+    txn = db.transaction(write=col_name)
+    txn_col = txn.collection(col_name)
+    txn_col.insert(doc)
+    # Queued documents are snapshotted so later changes do not leak in
+    doc['val'] = 200
+    txn_col.update({'_key': '1', 'val': 300})
+    txn_col.insert_many([{'_key': '2'}, {'_key': '3'}])
+
+    action, params = getattr(txn, '_build_action')()
+    assert action.startswith('function (params) {')
+    assert 'db.{}.insert(params[0],params[1])'.format(col_name) in action
+    assert 'db.{}.update(params[2],params[2],params[3])'.format(
+        col_name
+    ) in action
+    assert len(params) == 6
+    txn.commit()
+
+    assert len(col) == 3
+    assert col['1']['val'] == 300
+    assert getattr(txn, '_build_action')()[1] == []
+
+
+def test_stream_transaction():
+    col.insert(doc1)
+    with db.begin_transaction(read=col_name, write=col_name) as txn:
+        assert txn.status() == 'running'
+        txn_col = txn.collection(col_name)
+        # Reads are executed within the transaction and return results
+        doc = txn_col.get('1')
+        doc['data']['val'] += 1
+        txn_col.update(doc)
+        txn_col.insert(doc2)
+        assert len(list(txn.aql.execute(
+            'FOR d IN {} RETURN d'.format(col_name)
+        ))) == 2
+        # The changes are invisible outside the transaction
+        assert '2' not in col
+        assert col['1']['data']['val'] == 100
+    assert col['1']['data']['val'] == 101
+    assert '2' in col
+
+    # Abort on exception
+    with pytest.raises(ValueError):
+        with db.begin_transaction(write=col_name) as txn:
+            txn.collection(col_name).insert(doc3)
+            raise ValueError
+    assert '3' not in col
+
+    # Explicit abort
+    txn = db.begin_transaction(write=col_name)
+    txn.collection(col_name).delete('1')
+    assert txn.abort() is True
+    assert '1' in col
+    assert txn.status() == 'aborted'
+    with pytest.raises(TransactionAbortError):
+        txn.abort()
+
+    with pytest.raises(TransactionBeginError):
+        db.begin_transaction(write='missing')